@@ -0,0 +1,63 @@
+"""
+Throughput of a season pull over HTTP against the local stand-in server,
+with a fixed latency per response, by number of workers, and with injected
+errors that are retried. The server serves the synthetic payloads of
+`fixtures.py`, so the results are reproducible.
+
+    python benchmarks/bench_concurrency.py
+"""
+import time
+import logging
+from typing import Optional
+from euroleague_api.server import StandInServer, RedirectTransport
+from euroleague_api.transport import HTTPTransport
+from euroleague_api.rate_limit import RetryPolicy
+from euroleague_api.shot_data import ShotData
+from fixtures import FixtureTransport
+
+SEASON = 2023
+N_GAMES = 54
+LATENCY = 0.02
+
+
+def run(
+    server: StandInServer,
+    max_workers: int,
+    retry: Optional[RetryPolicy] = None
+) -> float:
+    """The games per second of a season pull through the server."""
+    transport = RedirectTransport(
+        server.url,
+        HTTPTransport(pool_maxsize=max(10, max_workers), retry=retry)
+    )
+    shotdata = ShotData(transport=transport)
+    start = time.perf_counter()
+    df = shotdata.get_game_shot_data_single_season(
+        SEASON, max_workers=max_workers)
+    elapsed = time.perf_counter() - start
+    transport.close()
+    return df["Gamecode"].nunique() / elapsed
+
+
+def main():
+    # the retries of the injected errors are expected
+    logging.getLogger("euroleague_api").setLevel(logging.ERROR)
+    source = FixtureTransport(n_games=N_GAMES)
+    print(f"{N_GAMES} games, {LATENCY * 1e3:.0f} ms latency per response")
+    print(f"{'workers':<10}{'errors':>8}{'games/s':>10}{'requests':>10}")
+    for max_workers in [1, 2, 4, 8, 16]:
+        with StandInServer(source, latency=LATENCY) as server:
+            rate = run(server, max_workers)
+            print(f"{max_workers:<10}{0:>8.0%}{rate:>10.1f}"
+                  f"{server.requests:>10}")
+    for error_rate in [0.05, 0.2]:
+        with StandInServer(source, latency=LATENCY, error_rate=error_rate,
+                           error_statuses=[429, 503], retry_after=0,
+                           seed=0) as server:
+            rate = run(server, 8, RetryPolicy(backoff_factor=0.01))
+            print(f"{8:<10}{error_rate:>8.0%}{rate:>10.1f}"
+                  f"{server.requests:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Per-game parse time of the PlaybyPlay, Points and Boxscore payloads, split
+into decoding the JSON body and building the dataframe of the flat records,
+with the standard library and `pd.json_normalize` (before) and with the
+decoding layer (after).
+
+    python benchmarks/bench_decoding.py
+"""
+import json
+import timeit
+from typing import Callable, List
+import pandas as pd
+from euroleague_api.decoding import get_default_json_loads, make_records_df
+from fixtures import (
+    PERIODS,
+    encode,
+    make_pbp_payload,
+    make_points_payload,
+    make_boxscore_payload
+)
+
+
+def get_pbp_records(data: dict) -> List[dict]:
+    return [play for period in PERIODS for play in data[period]]
+
+
+def get_points_records(data: dict) -> List[dict]:
+    return data["Rows"]
+
+
+def get_boxscore_records(data: dict) -> List[dict]:
+    return [
+        player for team in data["Stats"] for player in team["PlayersStats"]
+    ]
+
+
+def measure(fun: Callable[[], object], number: int = 50) -> float:
+    """The best per-call time in milliseconds."""
+    timer = timeit.Timer(fun)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e3
+
+
+def main():
+    loads = get_default_json_loads()
+    print(f"JSON parser: {loads.__module__}.{loads.__name__}")
+    cases = [
+        ("PlaybyPlay", make_pbp_payload(), get_pbp_records),
+        ("Points", make_points_payload(), get_points_records),
+        ("Boxscore", make_boxscore_payload(), get_boxscore_records),
+    ]
+    print(
+        f"{'endpoint':<12}{'KB':>7}{'decode before':>15}{'after':>8}"
+        f"{'frame before':>14}{'after':>8}{'total before':>14}{'after':>8}"
+    )
+    for name, payload, get_records in cases:
+        content = encode(payload)
+        records = get_records(json.loads(content))
+        decode_before = measure(lambda: json.loads(content))
+        decode_after = measure(lambda: loads(content))
+        frame_before = measure(lambda: pd.json_normalize(records))
+        frame_after = measure(lambda: make_records_df(records))
+        print(
+            f"{name:<12}{len(content) / 1024:>7.1f}"
+            f"{decode_before:>15.2f}{decode_after:>8.2f}"
+            f"{frame_before:>14.2f}{frame_after:>8.2f}"
+            f"{decode_before + frame_before:>14.2f}"
+            f"{decode_after + frame_after:>8.2f}"
+        )
+    print("Times in ms per game.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Import time of the package, measured in fresh interpreters, against the
+budget of each case. `import euroleague_api` loads no submodule, so its
+budget is a few milliseconds. Importing a class loads pandas and requests,
+which the package cannot cut, so its budget applies to the time on top of
+importing them, i.e. to the modules of the package and their deferred
+imports, e.g. `tqdm.auto`, `asyncio` and `sqlite3`.
+
+    python benchmarks/bench_import.py
+
+It exits with status 1 if a case is over budget.
+"""
+import subprocess
+import sys
+from typing import List, Tuple
+
+REPEAT = 5
+
+DEPENDENCIES = "import pandas, requests"
+
+# (statement, budget in ms, on top of the dependencies)
+CASES: List[Tuple[str, float, bool]] = [
+    ("import euroleague_api", 5.0, False),
+    ("from euroleague_api.standings import Standings", 50.0, True),
+    ("from euroleague_api.play_by_play_data import PlayByPlay", 50.0, True),
+    ("from euroleague_api.harvester import GameHarvester", 60.0, True),
+]
+
+TIMER = (
+    "import time\n"
+    "t = time.perf_counter()\n"
+    "{statement}\n"
+    "print(time.perf_counter() - t)\n"
+)
+
+
+def measure(statement: str, setup: str = "") -> float:
+    """The best import time of a statement in ms, over fresh interpreters."""
+    code = setup + "\n" + TIMER.format(statement=statement)
+    times = []
+    for _ in range(REPEAT):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True, capture_output=True, text=True
+        )
+        times.append(float(out.stdout) * 1e3)
+    return min(times)
+
+
+def main() -> int:
+    dependencies = measure(DEPENDENCIES)
+    print(f"{DEPENDENCIES:<58}{dependencies:>9.1f}")
+    print(f"{'statement':<58}{'ms':>9}{'budget':>9}")
+    over = []
+    for statement, budget, on_top in CASES:
+        # the package's own share, with the dependencies already loaded
+        elapsed = measure(statement, DEPENDENCIES if on_top else "")
+        flag = "" if elapsed <= budget else "  OVER"
+        print(f"{statement:<58}{elapsed:>9.1f}{budget:>9.1f}{flag}")
+        if flag:
+            over.append(statement)
+    print("The class imports are measured with pandas and requests loaded.")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Offline benchmark suite of the season pulls and the CPU-bound stages, over
+the synthetic payloads of `fixtures.py`. It reports the throughput (games/s
+and rows/s), the peak memory allocated (as traced by `tracemalloc`) and the
+import time, and compares them with a stored baseline.
+
+    pip install -e .                             # or PYTHONPATH=src
+    python benchmarks/bench_suite.py --save      # store the baseline
+    python benchmarks/bench_suite.py             # compare with it
+
+The baseline depends on the machine, so it is not committed: store it on
+the commit before a change, then compare after the change. It exits with
+status 1 if a case is slower, or allocates more, than the baseline by more
+than the tolerance.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+import pandas as pd
+from euroleague_api.EuroLeagueData import EuroLeagueData
+from euroleague_api.play_by_play_data import PlayByPlay
+from euroleague_api.boxscore_data import BoxScoreData
+from euroleague_api.shot_data import ShotData
+from euroleague_api.game_metadata import GameMetadata
+from euroleague_api.player_stats import PlayerStats
+from euroleague_api.utils import get_pbp_lineups
+from bench_import import measure as measure_import
+from fixtures import FixtureTransport
+
+SEASON = 2023
+N_GAMES = 54
+REPEAT = 3
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+# the import takes about a millisecond, so its noise is absolute
+IMPORT_SLACK_MS = 2.0
+
+# a case returns the number of games, or requests, and of rows it processed
+Case = Callable[[], Tuple[int, int]]
+
+
+def make_cases(transport: FixtureTransport) -> Dict[str, Case]:
+    """The benchmark cases, which share the transport."""
+    pbp = PlayByPlay(transport=transport)
+    boxscore = BoxScoreData(transport=transport)
+    pbp_df = pbp.get_game_play_by_play_data(SEASON, 1)
+    boxscore_df = boxscore.get_players_boxscore_stats(SEASON, 1)
+
+    def season_case(fun: Callable[[], pd.DataFrame]) -> Case:
+        def case() -> Tuple[int, int]:
+            df = fun()
+            return df["Gamecode"].nunique(), len(df)
+        return case
+
+    def lineups_case() -> Tuple[int, int]:
+        rows = 0
+        for _ in range(50):
+            rows += len(get_pbp_lineups(pbp_df, boxscore_df))
+        return 50, rows
+
+    def gamecodes_case() -> Tuple[int, int]:
+        df = EuroLeagueData(transport=transport).get_gamecodes_season(SEASON)
+        return len(df), len(df)
+
+    def rounds_case() -> Tuple[int, int]:
+        data = EuroLeagueData(transport=transport)
+        rows = sum(
+            len(data.get_gamecodes_round(SEASON, r)) for r in range(1, 35))
+        return rows, rows
+
+    def player_stats_case() -> Tuple[int, int]:
+        df = PlayerStats(transport=transport).get_player_stats_single_season(
+            "traditional", SEASON)
+        return 1, len(df)
+
+    return {
+        "play_by_play season": season_case(
+            lambda: pbp.get_game_play_by_play_data_single_season(SEASON)),
+        "pbp lineups season": season_case(
+            lambda: pbp.get_game_pbp_data_lineups_single_season(
+                SEASON, max_workers=4)),
+        "get_pbp_lineups": lineups_case,
+        "boxscore season": season_case(
+            lambda: boxscore.get_players_boxscore_stats_single_season(SEASON)),
+        "shots season": season_case(
+            lambda: ShotData(transport=transport)
+            .get_game_shot_data_single_season(SEASON, max_workers=4)),
+        "metadata season": season_case(
+            lambda: GameMetadata(transport=transport)
+            .get_game_metadata_single_season(SEASON)),
+        "v1 results": gamecodes_case,
+        "v2 games": rounds_case,
+        "v3 player stats": player_stats_case,
+    }
+
+
+def run_case(case: Case) -> Dict[str, float]:
+    """The best time of a case over `REPEAT` runs and its peak memory."""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        games, rows = case()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    case()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    seconds = min(times)
+    return {
+        "games_per_s": games / seconds,
+        "rows_per_s": rows / seconds,
+        "peak_mb": peak / 2 ** 20,
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float
+) -> List[str]:
+    """The cases that regressed with respect to the baseline."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if name == "import" and result["ms"] > max(
+                base["ms"] * (1 + tolerance), base["ms"] + IMPORT_SLACK_MS):
+            regressions.append(name)
+        elif name != "import" and (
+                result["rows_per_s"] < base["rows_per_s"] / (1 + tolerance)
+                or result["peak_mb"] > base["peak_mb"] * (1 + tolerance)):
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--save", action="store_true",
+                        help="store the results as the baseline")
+    parser.add_argument("--baseline", default=BASELINE,
+                        help="the path of the baseline")
+    parser.add_argument("--games", type=int, default=N_GAMES,
+                        help="the number of games of the season")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="the allowed relative regression")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results: Dict[str, Dict[str, float]] = {
+        "import": {"ms": measure_import("import euroleague_api")}
+    }
+    transport = FixtureTransport(n_games=args.games)
+    for name, case in make_cases(transport).items():
+        results[name] = run_case(case)
+
+    print(f"{'case':<22}{'games/s':>10}{'rows/s':>12}{'peak MB':>10}"
+          f"{'vs baseline':>13}")
+    print(f"{'import':<22}{results['import']['ms']:>32.1f} ms")
+    for name, result in results.items():
+        if name == "import":
+            continue
+        ratio = ""
+        if name in baseline:
+            speedup = result["rows_per_s"] / baseline[name]["rows_per_s"]
+            ratio = f"{speedup:.2f}x"
+        print(f"{name:<22}{result['games_per_s']:>10.1f}"
+              f"{result['rows_per_s']:>12.0f}{result['peak_mb']:>10.1f}"
+              f"{ratio:>13}")
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.baseline}.")
+        return 0
+    if not baseline:
+        print(f"No baseline at {args.baseline}, store one with --save.")
+    regressions = compare(results, baseline, args.tolerance)
+    for name in regressions:
+        print(f"Regression: {name}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Synthetic payloads of the Euroleague endpoints, with the shape and the size
+of a real game or season, and a transport that serves them, so that the
+benchmarks run offline and deterministically.
+"""
+import json
+import random
+from typing import Callable, Dict, List, Optional
+from euroleague_api.transport import build_response
+from euroleague_api.timing import get_url_template
+
+HOME, AWAY = "PAN", "OLY"
+PERIODS = [
+    "FirstQuarter", "SecondQuarter", "ThirdQuarter", "ForthQuarter",
+    "ExtraTime"
+]
+PLAYTYPES = ["2FGM", "2FGA", "3FGM", "3FGA", "D", "O", "AS", "FTM", "FTA",
+             "TO", "ST", "CM", "RV"]
+
+
+def make_players(team: str, n: int = 12) -> List[str]:
+    return [f"{team}PLAYER{i}, NAME" for i in range(n)]
+
+
+def make_pbp_payload(n_plays: int = 560, seed: int = 0) -> dict:
+    """The payload of the PlaybyPlay endpoint of a game."""
+    rng = random.Random(seed)
+    on_court = {t: make_players(t)[:5] for t in (HOME, AWAY)}
+    bench = {t: make_players(t)[5:] for t in (HOME, AWAY)}
+    payload: Dict[str, object] = {
+        "Live": False, "TeamA": "HOME", "TeamB": "AWAY",
+        "CodeTeamA": HOME, "CodeTeamB": AWAY, "ActualQuarter": 4,
+    }
+    number = 0
+    per_period = n_plays // 4
+    for q, period in enumerate(PERIODS[:4]):
+        plays = [{
+            "TYPE": 0, "NUMBEROFPLAY": number, "CODETEAM": "", "PLAYER_ID": "",
+            "PLAYTYPE": "BP", "PLAYER": None, "TEAM": None, "DORSAL": None,
+            "MINUTE": q * 10 + 1, "MARKERTIME": "", "POINTS_A": None,
+            "POINTS_B": None, "PLAYINFO": "Begin Period",
+        }]
+        for j in range(per_period):
+            number += 1
+            team = rng.choice([HOME, AWAY])
+            seconds = 600 - j * 600 // per_period
+            markertime = f"{seconds // 60:02d}:{seconds % 60:02d}"
+            if j % 15 == 14:
+                out = rng.choice(on_court[team])
+                sub = rng.choice(bench[team])
+                on_court[team].remove(out)
+                bench[team].remove(sub)
+                on_court[team].append(sub)
+                bench[team].append(out)
+                subs = [("OUT", out), ("IN", sub)]
+            else:
+                subs = [(rng.choice(PLAYTYPES), rng.choice(on_court[team]))]
+            for playtype, player in subs:
+                plays.append({
+                    "TYPE": 1, "NUMBEROFPLAY": number,
+                    "CODETEAM": f"{team} ", "PLAYER_ID": f"P{team} ",
+                    "PLAYTYPE": f"{playtype} ",
+                    "PLAYER": player.replace(", ", " , "), "TEAM": team,
+                    "DORSAL": "7", "MINUTE": q * 10 + 1 + j * 10 // per_period,
+                    "MARKERTIME": f"{markertime} ",
+                    "POINTS_A": rng.randint(0, 100) if playtype == "2FGM"
+                    else None,
+                    "POINTS_B": None, "PLAYINFO": playtype,
+                })
+        payload[period] = plays
+    payload["ExtraTime"] = []
+    return payload
+
+
+def make_points_payload(n_shots: int = 140, seed: int = 0) -> dict:
+    """The payload of the Points endpoint of a game."""
+    rng = random.Random(seed)
+    return {"Rows": [{
+        "NUM_ANOT": i, "TEAM": f"{rng.choice([HOME, AWAY])} ",
+        "ID_PLAYER": "P1 ", "PLAYER": "PLAYER, NAME", "ID_ACTION": "2FGM ",
+        "ACTION": "Two Pointer", "POINTS": 2,
+        "COORD_X": rng.randint(-750, 750), "COORD_Y": rng.randint(-100, 1400),
+        "ZONE": "C", "FASTBREAK": "0", "SECOND_CHANCE": "0",
+        "POINTS_OFF_TURNOVER": "0", "MINUTE": rng.randint(1, 40),
+        "CONSOLE": "09:00", "POINTS_A": 2, "POINTS_B": 0,
+        "UTC": "20231012190000",
+    } for i in range(n_shots)]}
+
+
+def make_boxscore_payload() -> dict:
+    """The payload of the Boxscore endpoint of a game."""
+    stats = []
+    for team in (HOME, AWAY):
+        players_stats = [{
+            "Player_ID": f"P{team}{i} ", "IsStarter": int(i < 5),
+            "IsPlaying": 0, "Team": team, "Dorsal": str(i), "Player": player,
+            "Minutes": "20:00", "Points": i, "FieldGoalsMade2": 1,
+            "FieldGoalsAttempted2": 2, "FieldGoalsMade3": 1,
+            "FieldGoalsAttempted3": 3, "FreeThrowsMade": 2,
+            "FreeThrowsAttempted": 2, "OffensiveRebounds": 1,
+            "DefensiveRebounds": 2, "TotalRebounds": 3, "Assistances": 1,
+            "Steals": 1, "Turnovers": 1, "BlocksFavour": 0,
+            "BlocksAgainst": 0, "FoulsCommited": 2, "FoulsReceived": 2,
+            "Valuation": 10, "Plusminus": 1.0,
+        } for i, player in enumerate(make_players(team))]
+        team_row = dict(players_stats[0], Player_ID="", IsStarter=0,
+                        Team=None, Dorsal="TEAM", Player="", Minutes="")
+        stats.append({
+            "Team": team, "Coach": "COACH", "PlayersStats": players_stats,
+            "tmr": team_row, "totr": dict(team_row, Dorsal="TOTAL"),
+        })
+    by_quarter = [{
+        "Team": team, "Quarter1": 20, "Quarter2": 20, "Quarter3": 20,
+        "Quarter4": 20,
+    } for team in (HOME, AWAY)]
+    return {
+        "Live": False, "Referees": "REFEREES", "Stats": stats,
+        "ByQuarter": by_quarter, "EndOfQuarter": by_quarter,
+    }
+
+
+def encode(payload: dict) -> bytes:
+    return json.dumps(payload).encode()
+
+
+def make_header_payload() -> dict:
+    """The payload of the Header endpoint of a game."""
+    return {
+        "Live": False, "Round": "1", "Date": "12/10/2023", "Hour": "20:00",
+        "Stadium": "STADIUM", "Capacity": "18000", "TeamA": "HOME",
+        "TeamB": "AWAY", "CodeTeamA": HOME, "CodeTeamB": AWAY,
+        "ScoreA": "80", "ScoreB": "75", "CoachA": "COACH A",
+        "CoachB": "COACH B", "Referee1": "REFEREE 1",
+        "Referee2": "REFEREE 2", "Referee3": "REFEREE 3",
+    }
+
+
+def make_results_xml(season: int = 2023, n_games: int = 306) -> bytes:
+    """The XML document of the v1 results endpoint of a season."""
+    games = []
+    for g in range(1, n_games + 1):
+        games.append(
+            f"<game><gameday>{(g - 1) // 9 + 1}</gameday><round>RS</round>"
+            f"<gamecode>E{season}_{g}</gamecode><gamenumber>{g}</gamenumber>"
+            f"<hometeam>HOME</hometeam><homecode>{HOME}</homecode>"
+            f"<homescore>80</homescore><awayteam>AWAY</awayteam>"
+            f"<awaycode>{AWAY}</awaycode><awayscore>75</awayscore>"
+            f"<date>Oct 12, {season}</date><time>20:00</time>"
+            f"<played>true</played></game>"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><results>'
+        + "".join(games) + "</results>"
+    ).encode()
+
+
+def make_games_payload(n_games: int = 9, round_number: int = 1) -> dict:
+    """The payload of the v2 games endpoint of a round."""
+    return {"data": [{
+        "gameCode": (round_number - 1) * n_games + i + 1,
+        "round": round_number, "played": True,
+        "phaseType": {"code": "RS", "name": "Regular Season"},
+        "local": {"club": {"code": HOME}, "score": 80},
+        "road": {"club": {"code": AWAY}, "score": 75},
+    } for i in range(n_games)]}
+
+
+def make_players_stats_payload(n_players: int = 300, seed: int = 0) -> dict:
+    """The payload of the v3 statistics endpoint of the players."""
+    rng = random.Random(seed)
+    players = [{
+        "playerRanking": i + 1, "gamesPlayed": 34, "gamesStarted": 20,
+        "minutesPlayed": rng.uniform(5, 30),
+        "pointsScored": rng.uniform(0, 20),
+        "twoPointersMade": 2.1, "twoPointersAttempted": 4.0,
+        "twoPointersPercentage": "52.5%", "threePointersMade": 1.2,
+        "threePointersAttempted": 3.1, "threePointersPercentage": "38.7%",
+        "freeThrowsMade": 1.5, "freeThrowsAttempted": 1.9,
+        "freeThrowsPercentage": "78.9%", "offensiveRebounds": 0.8,
+        "defensiveRebounds": 2.2, "totalRebounds": 3.0, "assists": 1.9,
+        "steals": 0.6, "turnovers": 1.1, "blocks": 0.2, "foulsCommited": 1.8,
+        "foulsDrawn": 1.7, "pir": rng.uniform(0, 20),
+        "player": {
+            "code": f"P{i:06d}", "name": f"PLAYER{i}, NAME", "age": 25,
+            "imageUrl": "", "team": {
+                "code": rng.choice([HOME, AWAY]), "name": "TEAM",
+                "tvCodes": "TEA", "imageUrl": "",
+            },
+        },
+    } for i in range(n_players)]
+    return {"players": players, "total": n_players}
+
+
+class FixtureTransport:
+    """
+    A transport that serves the synthetic payloads without any network, with
+    the same payload for every game. It can be passed to any
+    `EuroLeagueData` class, e.g. `PlayByPlay(transport=FixtureTransport())`.
+
+    Args:
+        n_games (int, optional): The number of games of a season.
+            Defaults to 306, i.e. a regular season of 18 teams.
+    """
+
+    def __init__(self, n_games: int = 306):
+        self.requests = 0
+        payloads: Dict[str, Callable[[], bytes]] = {
+            "/api/PlaybyPlay": lambda: encode(make_pbp_payload()),
+            "/api/Boxscore": lambda: encode(make_boxscore_payload()),
+            "/api/Points": lambda: encode(make_points_payload()),
+            "/api/Header": lambda: encode(make_header_payload()),
+            "/v1/results/": lambda: make_results_xml(n_games=n_games),
+            "/v2/competitions/{competition}/seasons/{season}/games":
+                lambda: encode(make_games_payload()),
+            "/v3/competitions/{competition}/statistics/players/traditional":
+                lambda: encode(make_players_stats_payload()),
+        }
+        self.bodies = {endpoint: body() for endpoint, body in payloads.items()}
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None
+    ):
+        self.requests += 1
+        body = self.bodies.get(get_url_template(url))
+        if body is None:
+            return build_response(url, 404, b"{}", reason="Not Found")
+        return build_response(url, 200, body, reason="OK")
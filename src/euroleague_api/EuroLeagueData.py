@@ -1,38 +1,71 @@
-from typing import Callable
+from typing import (
+    Any, Callable, Awaitable, Dict, Iterator, List, Optional, TYPE_CHECKING
+)
 import logging
 from json.decoder import JSONDecodeError
 import pandas as pd
-from tqdm.auto import trange
-import xmltodict
-from .utils import get_requests, get_data_over_collection_of_games
+from .utils import (
+    get_requests,
+    get_requests_async,
+    get_data_over_collection_of_games,
+    get_data_over_collection_of_games_async,
+    get_datasets_over_collection_of_games,
+    iter_data_over_collection_of_games,
+    iter_with_workers,
+    get_game_data_from_row,
+    map_over_game_rows,
+    progress_range
+)
+from .decoding import (
+    decode_json, make_records_df, iter_xml_records, json_normalize
+)
+from .transport import (
+    HTTPTransport,
+    AsyncHTTPTransport,
+    get_default_transport
+)
+
+from .schemas import apply_schema, concat_frames
+
+if TYPE_CHECKING:
+    from .sink import ParquetSink
+    from .manifest import SyncManifest
+    from .checkpoint import Checkpoint
 
-logging.basicConfig(encoding='utf-8', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class EuroLeagueData:
+class EuroLeagueBase:
     """
-    Base class for collecting Euroleague and Eurocup competition's data.
+    Base class holding the competition and the URL construction, shared by
+    the sync `EuroLeagueData` and the async `AsyncEuroLeagueData` classes.
 
     Args:
         competition (str, optional): The competition code. Choose one of:
             - 'E' for Euroleague
             - 'U' for Eurocup
             Defaults to "E".
+        typed (bool, optional): Whether to cast the game dataframes to their
+            typed schema, see `schemas.apply_schema`. Defaults to False.
     """
     BASE_URL = "https://api-live.euroleague.net"
+    LIVE_URL = "https://live.euroleague.net/api"
     V3 = "v3"
     V2 = "v2"
     V1 = "v1"
+    # set by the sync and async subclasses
+    transport: Any
 
-    def __init__(self, competition="E"):
-        """init function for the EuroLeagueData class.
+    def __init__(self, competition="E", typed: bool = False):
+        """init function for the EuroLeagueBase class.
 
         Args:
             competition (str, optional): The competition code. Choose one of:
                 - 'E' for Euroleague
                 - 'U' for Eurocup
                 Defaults to "E".
+            typed (bool, optional): Whether to cast the game dataframes to
+                their typed schema. Defaults to False.
 
         Raises:
             ValueError: When an invalid competition code is provided.
@@ -43,6 +76,7 @@ class EuroLeagueData:
                 "Valid values 'E', 'U'"
             )
         self.competition = competition
+        self.typed = typed
         self.url_v1 = f"{self.BASE_URL}/{self.V1}/results/"
         self.url_v2 = f"{self.BASE_URL}/{self.V2}/competitions/{competition}"
         # Don't rename url to url_v3, as the former it's used is several places
@@ -76,26 +110,144 @@ class EuroLeagueData:
         )
         return full_url
 
-    def get_gamecodes_season(self, season: int) -> pd.DataFrame:
+    def make_live_game_url(self, endpoint: str) -> str:
         """
-        A function that returns the game metadata, e.g. gamecodes of season
+        Makes the url of an endpoint of the live API, e.g. PlaybyPlay,
+        Boxscore, Points and Header.
 
         Args:
 
-            season (int): The start year of the season.
+            endpoint (str): The endpoint of the live API
 
         Returns:
 
-            pd.DataFrame: A dataframe with the season's game metadata, e.g.
-                gamecode, score, home-away teams, date, round, etc.
+            str: the full URL
+        """
+        return f"{self.LIVE_URL}/{endpoint}"
+
+    def make_live_game_params(self, season: int, gamecode: int) -> dict:
+        """
+        Makes the get request parameters of a game in the live API.
+
+        Args:
+
+            season (int): The start year of the season
+
+            gamecode (int): The game-code of the game of interest.
+
+        Returns:
+
+            dict: The `params` variables of the get request.
         """
         params = {
-            "seasonCode": f"{self.competition}{season}",
+            "gamecode": gamecode,
+            "seasoncode": f"{self.competition}{season}"
         }
-        r = get_requests(self.url_v1, params=params)
+        return params
+
+    def make_gamecodes_round_url(self, season: int) -> str:
+        """
+        Makes the url of the games of a season, which are filtered by round.
+
+        Args:
+
+            season (int): The start year of the season.
+
+        Returns:
+
+            str: the full URL
+        """
+        return f"{self.url_v2}/seasons/{self.competition}{season}/games"
+
+    def make_standings_url(
+        self,
+        season: int,
+        round_number: int,
+        endpoint: str
+    ) -> str:
+        """
+        Makes the url of the standings of a round in a given season.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round number
+
+            endpoint (str): The type of standing, e.g. basicstandings.
+
+        Raises:
+
+            ValueError: If endpoint is not applicable
+
+        Returns:
+
+            str: the full URL
+        """
+        available_endpoints = [
+            "calendarstandings", "streaks",
+            "aheadbehind", "margins",
+            "basicstandings"
+        ]
+
+        if endpoint not in available_endpoints:
+            raise ValueError(
+                "Standings endpoint, {endpoint}, is not applicable. Choose "
+                f"one of the following: {available_endpoints}"
+            )
+
+        full_url = (
+            f"{self.url}/seasons/{self.competition}{season}/"
+            f"rounds/{round_number}/{endpoint}"
+        )
+        return full_url
+
+    def apply_schema(self, df: pd.DataFrame, dataset: str) -> pd.DataFrame:
+        """
+        Casts a dataframe to the typed schema of its dataset, if the
+        instance is typed, see `schemas.apply_schema`.
 
-        data = xmltodict.parse(r.content)
-        df = pd.DataFrame(data["results"]["game"])
+        Args:
+
+            df (pd.DataFrame): The dataframe.
+
+            dataset (str): The name of the dataset, e.g. "play_by_play".
+
+        Returns:
+
+            pd.DataFrame: The dataframe, typed if the instance is typed.
+        """
+        if not self.typed:
+            return df
+        return apply_schema(df, dataset)
+
+    @staticmethod
+    def make_gamecodes_season_df(content: bytes) -> pd.DataFrame:
+        """
+        Makes the game metadata dataframe of a season from the XML response
+        of the v1 results endpoint. The `played` column is True only for the
+        games reported as played, i.e. the scheduled and in-progress games
+        are False.
+
+        Args:
+
+            content (bytes): The XML response body.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the season's game metadata, e.g.
+                gamecode, score, home-away teams, date, round, etc.
+        """
+        df = make_records_df(
+            iter_xml_records(content, "game"),
+            converters={
+                "gameday": int,
+                "gamenumber": int,
+                "homescore": int,
+                "awayscore": int,
+                "played": lambda played: played == "true",
+            }
+        )
         df.rename(
             columns={
                 "gamenumber": "gameCode",
@@ -104,13 +256,146 @@ class EuroLeagueData:
             },
             inplace=True
         )
-        int_cols = ["Round", "gameCode", "homescore", "awayscore"]
-        df[int_cols] = df[int_cols].astype(int)
-        df["played"] = df["played"].astype(
-            bool).replace({"true": True, "false": False})
         df.sort_values(["gameCode"], ignore_index=True, inplace=True)
         return df
 
+    @staticmethod
+    def make_gamecodes_round_df(data: dict) -> pd.DataFrame:
+        """
+        Makes the game metadata dataframe of a round from the JSON response
+        of the v2 games endpoint.
+
+        Args:
+
+            data (dict): The decoded JSON response.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the round's game metadata,
+                e.g. gamecode, score, home-away teams, date, etc.
+        """
+        df = json_normalize(data["data"])
+        df.rename(
+            columns={
+                "round": "Round",
+                "phaseType.code": "Phase"
+            },
+            inplace=True
+        )
+        df.sort_values(["gameCode"], ignore_index=True, inplace=True)
+        return df
+
+    def mark_played_games(
+        self,
+        season: int,
+        game_codes_df: pd.DataFrame
+    ) -> None:
+        """
+        Records the played games of a season in the response cache of the
+        transport, if any, so that their data are cached indefinitely.
+
+        Args:
+
+            season (int): The start year of the season.
+
+            game_codes_df (pd.DataFrame): The season's game metadata.
+        """
+        cache = getattr(self.transport, "cache", None)
+        if cache is None:
+            return
+        played = game_codes_df.loc[game_codes_df["played"], "gameCode"]
+        cache.mark_played(f"{self.competition}{season}", played.tolist())
+
+    @staticmethod
+    def select_season_game_codes(game_codes_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Selects the played games of a season, sorted by game code.
+
+        Args:
+
+            game_codes_df (pd.DataFrame): The season's game metadata.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the Phase, Round and gameCode of
+                the played games.
+        """
+        game_codes_df = game_codes_df[game_codes_df["played"]]
+        season_game_codes_df = (
+            game_codes_df[["Phase", "Round", "gameCode"]]
+            .drop_duplicates().sort_values(["gameCode", "Round"])
+            .reset_index(drop=True)
+        )
+        return season_game_codes_df
+
+
+class EuroLeagueData(EuroLeagueBase):
+    """
+    Base class for collecting Euroleague and Eurocup competition's data.
+
+    Args:
+        competition (str, optional): The competition code. Choose one of:
+            - 'E' for Euroleague
+            - 'U' for Eurocup
+            Defaults to "E".
+        transport (HTTPTransport, optional): The HTTP transport used for all
+            requests. Defaults to None, which uses a pooled transport shared
+            by all instances.
+        typed (bool, optional): Whether to cast the game dataframes to their
+            typed schema, i.e. categoricals and small integers, see
+            `schemas.apply_schema`. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        competition="E",
+        transport: Optional[HTTPTransport] = None,
+        typed: bool = False
+    ):
+        """init function for the EuroLeagueData class.
+
+        Args:
+            competition (str, optional): The competition code. Choose one of:
+                - 'E' for Euroleague
+                - 'U' for Eurocup
+                Defaults to "E".
+            transport (HTTPTransport, optional): The HTTP transport used for
+                all requests. Any object with a compatible `get` method can
+                be injected. Defaults to None, which uses a pooled transport
+                shared by all instances.
+            typed (bool, optional): Whether to cast the game dataframes to
+                their typed schema. Defaults to False.
+
+        Raises:
+            ValueError: When an invalid competition code is provided.
+        """
+        super().__init__(competition, typed=typed)
+        self.transport = (
+            transport if transport is not None else get_default_transport()
+        )
+
+    def get_gamecodes_season(self, season: int) -> pd.DataFrame:
+        """
+        A function that returns the game metadata, e.g. gamecodes of season
+
+        Args:
+
+            season (int): The start year of the season.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the season's game metadata, e.g.
+                gamecode, score, home-away teams, date, round, etc.
+        """
+        params = {
+            "seasonCode": f"{self.competition}{season}",
+        }
+        r = get_requests(
+            self.url_v1, params=params, transport=self.transport)
+        df = self.make_gamecodes_season_df(r.content)
+        self.mark_played_games(season, df)
+        return df
+
     def get_gamecodes_round(
             self, season: int,
             round_number: int
@@ -130,33 +415,24 @@ class EuroLeagueData:
             pd.DataFrame: A dataframe with the round_number's game metadata,
                 e.g. gamecode, score, home-away teams, date, etc.
         """
-        url = f"{self.url_v2}/seasons/{self.competition}{season}/games"
+        url = self.make_gamecodes_round_url(season)
         params = {"roundNumber": round_number}
-        r = get_requests(url, params=params)
+        r = get_requests(url, params=params, transport=self.transport)
         try:
-            data = r.json()
+            data = decode_json(r)
         except JSONDecodeError as exc:
             raise ValueError(
                 f"Round, {round_number}, season {season}, "
                 "did not return any data."
             ) from exc
-
-        df = pd.json_normalize(data["data"])
-        df.rename(
-            columns={
-                "round": "Round",
-                "phaseType.code": "Phase"
-            },
-            inplace=True
-        )
-        df.sort_values(["gameCode"], ignore_index=True, inplace=True)
-        return df
+        return self.make_gamecodes_round_df(data)
 
     def get_round_data_from_game_data(
         self,
         season: int,
         round_number: int,
-        fun: Callable[[int, int], pd.DataFrame]
+        fun: Callable[[int, int], pd.DataFrame],
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """A wrapper function for getting game data for all games in a single
         round.
@@ -177,6 +453,8 @@ class EuroLeagueData:
                 - get_player_boxscore_stats_data
                 - get_game_metadata
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
 
         Returns:
             pd.DataFrame: A dataframe with the corresponding data of a single
@@ -187,14 +465,17 @@ class EuroLeagueData:
         df = get_data_over_collection_of_games(
             game_codes_df,
             season=season,
-            fun=fun
+            fun=fun,
+            max_workers=max_workers
         )
         return df
 
     def get_season_data_from_game_data(
         self,
         season: int,
-        fun: Callable[[int, int], pd.DataFrame]
+        fun: Callable[[int, int], pd.DataFrame],
+        max_workers: int = 1,
+        checkpoint: Optional["Checkpoint"] = None
     ) -> pd.DataFrame:
         """
         A wrapper function for getting game data for all games in a single
@@ -215,30 +496,50 @@ class EuroLeagueData:
                 - get_player_boxscore_stats_data
                 - get_game_metadata
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+            checkpoint (Checkpoint, optional): A durable checkpoint. The
+                collected games are persisted as they finish and the games
+                already collected by a previous run are skipped. Defaults to
+                None.
+
         Returns:
 
             pd.DataFrame: A dataframe with the corresponding data of all
                 games in a single season.
         """
+        if checkpoint is not None and checkpoint.is_season_done(season):
+            logger.info("Season %s loaded from %s.", season, checkpoint)
+            return checkpoint.load_season(season)
         game_codes_df = self.get_gamecodes_season(season)
-        game_codes_df = game_codes_df[game_codes_df["played"]]
-        season_game_codes_df = (
-            game_codes_df[["Phase", "Round", "gameCode"]]
-            .drop_duplicates().sort_values(["gameCode", "Round"])
-            .reset_index(drop=True)
-        )
-        df = get_data_over_collection_of_games(
-            season_game_codes_df,
-            season=season,
-            fun=fun
+        season_game_codes_df = self.select_season_game_codes(game_codes_df)
+        if checkpoint is None:
+            return get_data_over_collection_of_games(
+                season_game_codes_df,
+                season=season,
+                fun=fun,
+                max_workers=max_workers
+            )
+        done = checkpoint.get_done_games(season)
+        pending_df = season_game_codes_df[
+            ~season_game_codes_df["gameCode"].isin(done)]
+        map_over_game_rows(
+            pending_df,
+            season,
+            lambda row: checkpoint.collect_game(row, season, fun),
+            max_workers=max_workers
         )
-        return df
+        return checkpoint.complete_season(
+            season, season_game_codes_df["gameCode"])
 
     def get_range_seasons_data(
         self,
         start_season: int,
         end_season: int,
-        fun: Callable[[int, int], pd.DataFrame]
+        fun: Callable[[int, int], pd.DataFrame],
+        max_workers: int = 1,
+        checkpoint: Optional["Checkpoint"] = None
     ) -> pd.DataFrame:
         """
         A wrapper function with the all game data in a range of seasons
@@ -260,17 +561,654 @@ class EuroLeagueData:
                 - get_player_boxscore_stats_data
                 - get_game_metadata
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+            checkpoint (Checkpoint, optional): A durable checkpoint, so that
+                a job that was interrupted resumes from the last collected
+                game when it is called again. Defaults to None.
+
         Returns:
 
             pd.DataFrame: A dataframe with the corresponding data of all
                 games in a range of seasons.
         """
         data = []
-        for season in trange(
+        for season in progress_range(
                 start_season, end_season + 1, desc="Season loop", leave=True):
 
-            data_df = self.get_season_data_from_game_data(season, fun)
+            data_df = self.get_season_data_from_game_data(
+                season, fun, max_workers=max_workers, checkpoint=checkpoint)
+            data.append(data_df)
+        df = concat_frames(data)
+        df.reset_index(drop=True, inplace=True)
+        return df
+
+    def iter_season_data_from_game_data(
+        self,
+        season: int,
+        fun: Callable[[int, int], pd.DataFrame],
+        max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_season_data_from_game_data`. It
+        yields the data of each game of a single season as soon as it is
+        collected, so that only a bounded number of games is held in memory.
+
+        Args:
+
+            season (int, optional): The start year of the season.
+
+            fun (Callable[[int, int], pd.DataFrame]): A callable function that
+                determines that type of data to be collected.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: The dataframe of each game.
+        """
+        game_codes_df = self.get_gamecodes_season(season)
+        season_game_codes_df = self.select_season_game_codes(game_codes_df)
+        yield from iter_data_over_collection_of_games(
+            season_game_codes_df,
+            season=season,
+            fun=fun,
+            max_workers=max_workers
+        )
+
+    def iter_range_seasons_data(
+        self,
+        start_season: int,
+        end_season: int,
+        fun: Callable[[int, int], pd.DataFrame],
+        max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_range_seasons_data`. It yields the
+        data of each game of a range of seasons as soon as it is collected.
+
+        Args:
+
+            start_season (int): The start year of the start season.
+
+            end_season (int): The start year of the end season
+
+            fun (Callable[[int, int], pd.DataFrame]): A callable function that
+                determines that type of data to be collected.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: The dataframe of each game.
+        """
+        for season in range(start_season, end_season + 1):
+            yield from self.iter_season_data_from_game_data(
+                season, fun, max_workers=max_workers)
+
+    def export_season_data(
+        self,
+        season: int,
+        fun: Callable[[int, int], pd.DataFrame],
+        sink: "ParquetSink",
+        max_workers: int = 1
+    ) -> List[str]:
+        """
+        Collects the game data of all games in a single season and writes
+        each game to a sink as soon as it is collected, partitioned by
+        competition, season and phase, instead of building one dataframe.
+
+        Args:
+
+            season (int): The start year of the season.
+
+            fun (Callable[[int, int], pd.DataFrame]): A callable function that
+                determines that type of data to be collected.
+
+            sink (ParquetSink): The sink of the data, e.g.
+                `ParquetSink("warehouse/shots")`.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+        Returns:
+
+            List[str]: The paths of the written files.
+        """
+        game_codes_df = self.get_gamecodes_season(season)
+        season_game_codes_df = self.select_season_game_codes(game_codes_df)
+        return self.export_games(
+            season_game_codes_df, season, fun, sink, max_workers=max_workers)
+
+    def export_games(
+        self,
+        game_codes_df: pd.DataFrame,
+        season: int,
+        fun: Callable[[int, int], pd.DataFrame],
+        sink: "ParquetSink",
+        max_workers: int = 1,
+        on_write: Optional[Callable[[pd.Series, str], None]] = None
+    ) -> List[str]:
+        """
+        Collects the game data of a collection of games of a season and
+        writes each game to a sink as soon as it is collected.
+
+        Args:
+
+            game_codes_df (pd.DataFrame): A dataframe of the game codes to
+                collect.
+
+            season (int): The start year of the season.
+
+            fun (Callable[[int, int], pd.DataFrame]): A callable function that
+                determines that type of data to be collected.
+
+            sink (ParquetSink): The sink of the data.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+            on_write (Callable[[pd.Series, str], None], optional): A function
+                called with the row of each game and its path, after it is
+                written. Defaults to None.
+
+        Returns:
+
+            List[str]: The paths of the written files.
+        """
+        rows = [row for _, row in game_codes_df.iterrows()]
+        results = iter_with_workers(
+            lambda row: get_game_data_from_row(row, season, fun),
+            rows,
+            max_workers=max_workers,
+            desc=f"Season {season}"
+        )
+        paths = []
+        for row, df in zip(rows, results):
+            if df is None:
+                continue
+            partitions = {
+                "Competition": self.competition,
+                "Season": season,
+                "Phase": row.get("Phase"),
+            }
+            path = sink.write(df, partitions, str(row["gameCode"]))
+            if on_write is not None:
+                on_write(row, path)
+            paths.append(path)
+        return paths
+
+    def export_range_seasons_data(
+        self,
+        start_season: int,
+        end_season: int,
+        fun: Callable[[int, int], pd.DataFrame],
+        sink: "ParquetSink",
+        max_workers: int = 1
+    ) -> List[str]:
+        """
+        Collects the game data of all games in a range of seasons and writes
+        each game to a sink as soon as it is collected.
+
+        Args:
+
+            start_season (int): The start year of the start season.
+
+            end_season (int): The start year of the end season
+
+            fun (Callable[[int, int], pd.DataFrame]): A callable function that
+                determines that type of data to be collected.
+
+            sink (ParquetSink): The sink of the data.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+        Returns:
+
+            List[str]: The paths of the written files.
+        """
+        paths = []
+        for season in progress_range(
+                start_season, end_season + 1, desc="Season loop", leave=True):
+            paths.extend(self.export_season_data(
+                season, fun, sink, max_workers=max_workers))
+        return paths
+
+    def sync_season_data(
+        self,
+        season: int,
+        fun: Callable[[int, int], pd.DataFrame],
+        sink: "ParquetSink",
+        manifest: "SyncManifest",
+        dataset: str,
+        max_workers: int = 1
+    ) -> List[str]:
+        """
+        Incrementally collects the game data of a single season. Only the
+        played games that are not in the manifest, or that have changed since
+        they were collected (e.g. a corrected score), are fetched and written
+        to the sink. The games written are recorded in the manifest, so the
+        games that failed are retried by the next sync.
+
+        Args:
+
+            season (int): The start year of the season.
+
+            fun (Callable[[int, int], pd.DataFrame]): A callable function that
+                determines that type of data to be collected.
+
+            sink (ParquetSink): The sink of the data.
+
+            manifest (SyncManifest): The record of the collected games.
+
+            dataset (str): The name of the dataset in the manifest, e.g.
+                "shots".
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+        Returns:
+
+            List[str]: The paths of the written files.
+        """
+        from .manifest import make_game_fingerprints
+
+        game_codes_df = self.get_gamecodes_season(season)
+        fingerprints = dict(zip(
+            game_codes_df["gameCode"], make_game_fingerprints(game_codes_df)))
+        season_game_codes_df = self.select_season_game_codes(game_codes_df)
+        season_game_codes_df["fingerprint"] = (
+            season_game_codes_df["gameCode"].map(fingerprints))
+        pending_df = manifest.select_pending_games(
+            self.competition, season, dataset, season_game_codes_df)
+
+        def record(row: pd.Series, path: str) -> None:
+            manifest.record(
+                self.competition, season, row["gameCode"], dataset,
+                row["fingerprint"])
+
+        return self.export_games(
+            pending_df, season, fun, sink, max_workers=max_workers,
+            on_write=record)
+
+    def sync_range_seasons_data(
+        self,
+        start_season: int,
+        end_season: int,
+        fun: Callable[[int, int], pd.DataFrame],
+        sink: "ParquetSink",
+        manifest: "SyncManifest",
+        dataset: str,
+        max_workers: int = 1
+    ) -> List[str]:
+        """
+        Incrementally collects the game data of a range of seasons, see
+        `sync_season_data`.
+
+        Args:
+
+            start_season (int): The start year of the start season.
+
+            end_season (int): The start year of the end season
+
+            fun (Callable[[int, int], pd.DataFrame]): A callable function that
+                determines that type of data to be collected.
+
+            sink (ParquetSink): The sink of the data.
+
+            manifest (SyncManifest): The record of the collected games.
+
+            dataset (str): The name of the dataset in the manifest, e.g.
+                "shots".
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+        Returns:
+
+            List[str]: The paths of the written files.
+        """
+        paths = []
+        for season in progress_range(
+                start_season, end_season + 1, desc="Season loop", leave=True):
+            paths.extend(self.sync_season_data(
+                season, fun, sink, manifest, dataset,
+                max_workers=max_workers))
+        return paths
+
+    def get_round_datasets_from_game_data(
+        self,
+        season: int,
+        round_number: int,
+        fun: Callable[[int, int], Dict[str, pd.DataFrame]],
+        max_workers: int = 1
+    ) -> Dict[str, pd.DataFrame]:
+        """A wrapper function for getting several datasets for all games in a
+        single round, with one pass over the games.
+
+        Args:
+            season (int, optional): The start year of the season.
+
+            round_number (int): The round of the season.
+
+            fun (Callable[[int, int], Dict[str, pd.DataFrame]]): A callable
+                function that returns the dataframes of a game keyed by
+                dataset, e.g. `get_boxscore_bundle`.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+        Returns:
+            Dict[str, pd.DataFrame]: A dataframe per dataset with the data of
+                a single round
+        """
+        game_codes_df = self.get_gamecodes_round(season, round_number)
+        game_codes_df = game_codes_df[game_codes_df["played"]]
+        return get_datasets_over_collection_of_games(
+            game_codes_df,
+            season=season,
+            fun=fun,
+            max_workers=max_workers
+        )
+
+    def get_season_datasets_from_game_data(
+        self,
+        season: int,
+        fun: Callable[[int, int], Dict[str, pd.DataFrame]],
+        max_workers: int = 1
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        A wrapper function for getting several datasets for all games in a
+        single season, with one pass over the games.
+
+        Args:
+
+            season (int, optional): The start year of the season.
+
+            fun (Callable[[int, int], Dict[str, pd.DataFrame]]): A callable
+                function that returns the dataframes of a game keyed by
+                dataset, e.g. `get_boxscore_bundle`.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+        Returns:
+
+            Dict[str, pd.DataFrame]: A dataframe per dataset with the data of
+                all games in a single season.
+        """
+        game_codes_df = self.get_gamecodes_season(season)
+        season_game_codes_df = self.select_season_game_codes(game_codes_df)
+        return get_datasets_over_collection_of_games(
+            season_game_codes_df,
+            season=season,
+            fun=fun,
+            max_workers=max_workers
+        )
+
+    def get_range_seasons_datasets(
+        self,
+        start_season: int,
+        end_season: int,
+        fun: Callable[[int, int], Dict[str, pd.DataFrame]],
+        max_workers: int = 1
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        A wrapper function for getting several datasets for all games in a
+        range of seasons, with one pass over the games.
+
+        Args:
+
+            start_season (int): The start year of the start season.
+
+            end_season (int): The start year of the end season
+
+            fun (Callable[[int, int], Dict[str, pd.DataFrame]]): A callable
+                function that returns the dataframes of a game keyed by
+                dataset, e.g. `get_boxscore_bundle`.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1, i.e. sequentially.
+
+        Returns:
+
+            Dict[str, pd.DataFrame]: A dataframe per dataset with the data of
+                all games in a range of seasons.
+        """
+        data: Dict[str, list] = {}
+        for season in progress_range(
+                start_season, end_season + 1, desc="Season loop", leave=True):
+            datasets = self.get_season_datasets_from_game_data(
+                season, fun, max_workers=max_workers)
+            for name, df in datasets.items():
+                data.setdefault(name, []).append(df)
+        return {
+            name: concat_frames(dfs).reset_index(drop=True)
+            for name, dfs in data.items()
+        }
+
+
+class AsyncEuroLeagueData(EuroLeagueBase):
+    """
+    Base class for collecting Euroleague and Eurocup competition's data
+    without blocking the event loop. It mirrors `EuroLeagueData`, with
+    coroutine methods of the same names.
+
+    Use it as an async context manager, or call `close`, to release the
+    connections of its transport.
+
+    Args:
+        competition (str, optional): The competition code. Choose one of:
+            - 'E' for Euroleague
+            - 'U' for Eurocup
+            Defaults to "E".
+        transport (AsyncHTTPTransport, optional): The async HTTP transport
+            used for all requests. Defaults to None, which creates a new
+            transport owned by the instance.
+        typed (bool, optional): Whether to cast the game dataframes to their
+            typed schema, see `schemas.apply_schema`. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        competition="E",
+        transport: Optional[AsyncHTTPTransport] = None,
+        typed: bool = False
+    ):
+        """init function for the AsyncEuroLeagueData class.
+
+        Args:
+            competition (str, optional): The competition code. Choose one of:
+                - 'E' for Euroleague
+                - 'U' for Eurocup
+                Defaults to "E".
+            transport (AsyncHTTPTransport, optional): The async HTTP
+                transport used for all requests. It can be shared by several
+                instances. Defaults to None, which creates a new transport.
+            typed (bool, optional): Whether to cast the game dataframes to
+                their typed schema. Defaults to False.
+
+        Raises:
+            ValueError: When an invalid competition code is provided.
+        """
+        super().__init__(competition, typed=typed)
+        self.owns_transport = transport is None
+        self.transport = (
+            transport if transport is not None else AsyncHTTPTransport()
+        )
+
+    async def close(self) -> None:
+        """Closes the transport, if it was created by this instance."""
+        if self.owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def get_gamecodes_season(self, season: int) -> pd.DataFrame:
+        """
+        The async counterpart of `EuroLeagueData.get_gamecodes_season`.
+
+        Args:
+
+            season (int): The start year of the season.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the season's game metadata.
+        """
+        params = {
+            "seasonCode": f"{self.competition}{season}",
+        }
+        r = await get_requests_async(
+            self.url_v1, params=params, transport=self.transport)
+        df = self.make_gamecodes_season_df(r.content)
+        self.mark_played_games(season, df)
+        return df
+
+    async def get_gamecodes_round(
+        self,
+        season: int,
+        round_number: int
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `EuroLeagueData.get_gamecodes_round`.
+
+        Args:
+
+            season (int): The start year of the season.
+
+            round_number (int): The round number.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the round_number's game metadata.
+        """
+        url = self.make_gamecodes_round_url(season)
+        params = {"roundNumber": round_number}
+        r = await get_requests_async(
+            url, params=params, transport=self.transport)
+        try:
+            data = decode_json(r)
+        except JSONDecodeError as exc:
+            raise ValueError(
+                f"Round, {round_number}, season {season}, "
+                "did not return any data."
+            ) from exc
+        return self.make_gamecodes_round_df(data)
+
+    async def get_round_data_from_game_data(
+        self,
+        season: int,
+        round_number: int,
+        fun: Callable[[int, int], Awaitable[pd.DataFrame]],
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of
+        `EuroLeagueData.get_round_data_from_game_data`.
+
+        Args:
+
+            season (int): The start year of the season.
+
+            round_number (int): The round of the season.
+
+            fun (Callable[[int, int], Awaitable[pd.DataFrame]]): A coroutine
+                function that determines that type of data to be collected.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the corresponding data of a single
+                round
+        """
+        game_codes_df = await self.get_gamecodes_round(season, round_number)
+        game_codes_df = game_codes_df[game_codes_df["played"]]
+        df = await get_data_over_collection_of_games_async(
+            game_codes_df,
+            season=season,
+            fun=fun,
+            max_workers=max_workers
+        )
+        return df
+
+    async def get_season_data_from_game_data(
+        self,
+        season: int,
+        fun: Callable[[int, int], Awaitable[pd.DataFrame]],
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of
+        `EuroLeagueData.get_season_data_from_game_data`.
+
+        Args:
+
+            season (int): The start year of the season.
+
+            fun (Callable[[int, int], Awaitable[pd.DataFrame]]): A coroutine
+                function that determines that type of data to be collected.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the corresponding data of all
+                games in a single season.
+        """
+        game_codes_df = await self.get_gamecodes_season(season)
+        season_game_codes_df = self.select_season_game_codes(game_codes_df)
+        df = await get_data_over_collection_of_games_async(
+            season_game_codes_df,
+            season=season,
+            fun=fun,
+            max_workers=max_workers
+        )
+        return df
+
+    async def get_range_seasons_data(
+        self,
+        start_season: int,
+        end_season: int,
+        fun: Callable[[int, int], Awaitable[pd.DataFrame]],
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `EuroLeagueData.get_range_seasons_data`.
+
+        Args:
+
+            start_season (int): The start year of the start season.
+
+            end_season (int): The start year of the end season
+
+            fun (Callable[[int, int], Awaitable[pd.DataFrame]]): A coroutine
+                function that determines that type of data to be collected.
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the corresponding data of all
+                games in a range of seasons.
+        """
+        data = []
+        for season in range(start_season, end_season + 1):
+            data_df = await self.get_season_data_from_game_data(
+                season, fun, max_workers=max_workers)
             data.append(data_df)
-        df = pd.concat(data)
+        df = concat_frames(data)
         df.reset_index(drop=True, inplace=True)
         return df
@@ -1,12 +1,35 @@
-from . import game_stats
-from . import player_stats
-from . import shot_data
-from . import standings
-from . import team_stats
-from . import play_by_play_data
-from . import boxscore_data
-from . import game_metadata
-from . import utils
+"""
+The submodules of the package are imported on first access, e.g.
+`euroleague_api.standings`, so that `import euroleague_api` does not pay for
+pandas, requests and the other dependencies of the modules it does not use.
+"""
+from typing import TYPE_CHECKING, List
+import importlib
+
+if TYPE_CHECKING:
+    from . import game_stats
+    from . import player_stats
+    from . import shot_data
+    from . import standings
+    from . import team_stats
+    from . import play_by_play_data
+    from . import boxscore_data
+    from . import game_metadata
+    from . import utils
+    from . import transport
+    from . import cache
+    from . import rate_limit
+    from . import harvester
+    from . import sink
+    from . import manifest
+    from . import checkpoint
+    from . import lineups
+    from . import decoding
+    from . import schemas
+    from . import events
+    from . import timing
+    from . import replay
+    from . import server
 
 __all__ = [
     "game_stats",
@@ -17,5 +40,31 @@ __all__ = [
     "play_by_play_data",
     "boxscore_data",
     "game_metadata",
-    "utils"
+    "utils",
+    "transport",
+    "cache",
+    "rate_limit",
+    "harvester",
+    "sink",
+    "manifest",
+    "checkpoint",
+    "lineups",
+    "decoding",
+    "schemas",
+    "events",
+    "timing",
+    "replay",
+    "server"
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,16 +1,22 @@
-from typing import List
+from typing import Dict, List, Iterator
 import logging
 from json.decoder import JSONDecodeError
 import pandas as pd
 import numpy as np
-from .EuroLeagueData import EuroLeagueData
+from .EuroLeagueData import EuroLeagueData, AsyncEuroLeagueData
 from .utils import (
     get_requests,
+    get_requests_async,
     raise_error
 )
+from .decoding import (
+    decode_json, make_records_df, clean_series, clean_name, json_normalize
+)
 
 logger = logging.getLogger(__name__)
 
+BOXSCORE_TYPES = ["Stats", "ByQuarter", "EndOfQuarter"]
+
 
 class BoxScoreData(EuroLeagueData):
     """
@@ -24,6 +30,33 @@ class BoxScoreData(EuroLeagueData):
             Defaults to "E".
     """
 
+    def get_boxscore_payload(self, season: int, gamecode: int) -> dict:
+        """
+        Gets the raw payload of the Boxscore endpoint of a game, i.e. all of
+        its `Stats`, `ByQuarter` and `EndOfQuarter` data from one request.
+
+        Args:
+            season (int): The start year of the season
+            gamecode (int): The game-code of the game of interest.
+                It can be found on Euroleague's website.
+
+        Returns:
+            dict: The decoded JSON data of the endpoint.
+        """
+        url = self.make_live_game_url("Boxscore")
+        params = self.make_live_game_params(season, gamecode)
+        r = get_requests(url, params=params, transport=self.transport)
+
+        try:
+            data = decode_json(r)
+        except JSONDecodeError as exc:
+            logger.error(
+                "Game code, %s, season %s, did not return valid JSON data.",
+                gamecode, season
+            )
+            raise exc
+        return data
+
     def get_boxscore_data(
         self,
         season: int,
@@ -49,34 +82,69 @@ class BoxScoreData(EuroLeagueData):
         Returns:
             List[dict]: A list of dictionaries with the data.
         """
-        url = "https://live.euroleague.net/api/Boxscore"
-        params = {
-            "gamecode": gamecode,
-            "seasoncode": f"{self.competition}{season}"
-        }
-        r = get_requests(url, params=params)
+        raise_error(boxscore_type, "Boxscore", BOXSCORE_TYPES, False)
 
+        data = self.get_boxscore_payload(season, gamecode)
         try:
-            data = r.json()
-        except JSONDecodeError as exc:
-            logger.error(
-                f"Game code, {gamecode}, season {season}, "
-                "did not return valid JSON data."
-            )
-            raise exc
+            return data[boxscore_type]
         except KeyError as exc:
             logger.error(
-                f"Game code, {gamecode}, season {season}, "
-                "returned incomplete data."
+                "Game code, %s, season %s, returned incomplete data.",
+                gamecode, season
             )
             raise exc
 
-        boxscore_types = ["Stats", "ByQuarter", "EndOfQuarter"]
+    def get_boxscore_bundle(
+        self,
+        season: int,
+        gamecode: int
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Gets all boxscore tables of a game with a single request, i.e. the
+        players' stats, the by-quarter and the end-of-quarter scores.
 
-        if boxscore_type not in boxscore_types:
-            raise_error(boxscore_type, "Boxscore", boxscore_types, False)
+        Args:
+            season (int): The start year of the season
+            gamecode (int): The game-code of the game of interest.
+                It can be found on Euroleague's website.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The dataframes of the game keyed by
+                boxscore type, i.e. `Stats`, `ByQuarter` and `EndOfQuarter`.
+        """
+        data = self.get_boxscore_payload(season, gamecode)
+        bundle = self.make_boxscore_bundle(data, season, gamecode)
+        bundle["Stats"] = self.apply_schema(
+            bundle["Stats"], "boxscore_players")
+        return bundle
+
+    @staticmethod
+    def make_boxscore_bundle(
+        data: dict,
+        season: int,
+        gamecode: int
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Makes all boxscore dataframes of a game from the payload of the
+        Boxscore endpoint.
 
-        return data[boxscore_type]
+        Args:
+            data (dict): The payload of the Boxscore endpoint.
+            season (int): The start year of the season
+            gamecode (int): The game-code of the game of interest.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The dataframes of the game keyed by
+                boxscore type, i.e. `Stats`, `ByQuarter` and `EndOfQuarter`.
+        """
+        return {
+            "Stats": BoxScoreData.make_players_boxscore_stats_df(
+                data["Stats"], season, gamecode),
+            "ByQuarter": BoxScoreData.make_teams_boxscore_quarter_df(
+                data["ByQuarter"], season, gamecode),
+            "EndOfQuarter": BoxScoreData.make_teams_boxscore_quarter_df(
+                data["EndOfQuarter"], season, gamecode),
+        }
 
     def get_teams_boxscore_quarter_scores(
         self,
@@ -114,7 +182,28 @@ class BoxScoreData(EuroLeagueData):
                         valid_vals, False)
 
         data = self.get_boxscore_data(season, gamecode, boxscore_type)
-        df = pd.json_normalize(data)
+        return self.make_teams_boxscore_quarter_df(data, season, gamecode)
+
+    @staticmethod
+    def make_teams_boxscore_quarter_df(
+        data: List[dict],
+        season: int,
+        gamecode: int
+    ) -> pd.DataFrame:
+        """
+        Makes the boxscore quarter dataframe of a game from the `ByQuarter`
+        or `EndOfQuarter` entry of the Boxscore endpoint.
+
+        Args:
+            data (List[dict]): The quarter boxscore data.
+            season (int): The start year of the season
+            gamecode (int): The game-code of the game of interest.
+
+        Returns:
+            pd.DataFrame: A dataframe with the boxscore quarter data of the
+                game.
+        """
+        df = json_normalize(data)
         df.insert(0, 'Season', season)
         df.insert(1, 'Gamecode', gamecode)
         return df
@@ -132,14 +221,36 @@ class BoxScoreData(EuroLeagueData):
             gamecode (int): The game-code of the game of interest.
                 It can be found on Euroleague's website.
 
+        Returns:
+            pd.DataFrame: A dataframe with home and away team player stats
+        """
+        data = self.get_boxscore_data(season, gamecode, "Stats")
+        df = self.make_players_boxscore_stats_df(data, season, gamecode)
+        return self.apply_schema(df, "boxscore_players")
+
+    @staticmethod
+    def make_players_boxscore_stats_df(
+        data: List[dict],
+        season: int,
+        gamecode: int
+    ) -> pd.DataFrame:
+        """
+        Makes the players' and team's total stats dataframe of a game from
+        the `Stats` entry of the Boxscore endpoint.
+
+        Args:
+            data (List[dict]): The home and away teams' stats data.
+            season (int): The start year of the season
+            gamecode (int): The game-code of the game of interest.
+
         Returns:
             pd.DataFrame: A dataframe with home and away team player stats
         """
 
         def dict_to_df_bx(datadict, home=1):
-            playerstats_df = pd.json_normalize(datadict["PlayersStats"])
-            teamstats_df = pd.json_normalize(datadict["tmr"])
-            totalstats_df = pd.json_normalize(datadict["totr"])
+            playerstats_df = make_records_df(datadict["PlayersStats"])
+            teamstats_df = json_normalize(datadict["tmr"])
+            totalstats_df = json_normalize(datadict["totr"])
             df = pd.concat(
                 [
                     # fix types to avoid pandas futurewarning
@@ -163,23 +274,19 @@ class BoxScoreData(EuroLeagueData):
             df.insert(2, "Home", home)
             return df
 
-        data = self.get_boxscore_data(season, gamecode, "Stats")
-
         home_df = dict_to_df_bx(data[0], home=1)
         away_df = dict_to_df_bx(data[1], home=0)
 
         df = pd.concat([home_df, away_df], axis=0, ignore_index=True)
-        df["Player"] = (
-            df["Player"].str.replace("  ", " ")
-            .str.replace(" , ", ", ").str.strip()
-        )
+        df["Player"] = clean_series(df["Player"], clean_name)
         return df
 
     def get_teams_boxscore_quarter_scores_round(
         self,
         season: int,
         round_number: int,
-        boxscore_type: str = "ByQuarter"
+        boxscore_type: str = "ByQuarter",
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the boxscore quarter data of all games in a
@@ -197,6 +304,9 @@ class BoxScoreData(EuroLeagueData):
                 - EndOfQuarter
                 Default: ByQuarter
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with the boxscore quarter data of all
@@ -207,13 +317,15 @@ class BoxScoreData(EuroLeagueData):
                 season, gamecode, boxscore_type)
         )
         data_df = self.get_round_data_from_game_data(
-            season, round_number, get_teams_boxscore_quarter_scores_)
+            season, round_number, get_teams_boxscore_quarter_scores_,
+            max_workers=max_workers)
         return data_df
 
     def get_teams_boxscore_quarter_scores_single_season(
         self,
         season: int,
-        boxscore_type: str = "ByQuarter"
+        boxscore_type: str = "ByQuarter",
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the boxscore quarter data of *all* games in a
@@ -229,6 +341,9 @@ class BoxScoreData(EuroLeagueData):
                 - EndOfQuarter
             Default: ByQuarter
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with the boxscore quarter data of all
@@ -239,14 +354,16 @@ class BoxScoreData(EuroLeagueData):
                 season, gamecode, boxscore_type)
         )
         data_df = self.get_season_data_from_game_data(
-            season, get_teams_boxscore_quarter_scores_)
+            season, get_teams_boxscore_quarter_scores_,
+            max_workers=max_workers)
         return data_df
 
     def get_teams_boxscore_quarter_scores_range_seasons(
         self,
         start_season: int,
         end_season: int,
-        boxscore_type: str = "ByQuarter"
+        boxscore_type: str = "ByQuarter",
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the play-by-play data of *all* games in a range of
@@ -264,6 +381,9 @@ class BoxScoreData(EuroLeagueData):
                 - EndOfQuarter
                 Default: ByQuarter
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with the boxscore quarter data of all
@@ -274,13 +394,90 @@ class BoxScoreData(EuroLeagueData):
                 season, gamecode, boxscore_type)
         )
         df = self.get_range_seasons_data(
-            start_season, end_season, get_teams_boxscore_quarter_scores_)
+            start_season, end_season, get_teams_boxscore_quarter_scores_,
+            max_workers=max_workers)
         return df
 
+    def iter_teams_boxscore_quarter_scores_single_season(
+        self,
+        season: int,
+        boxscore_type: str = "ByQuarter",
+        max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of
+        `get_teams_boxscore_quarter_scores_single_season`. It yields the
+        boxscore quarter data of each game as soon as it is collected.
+
+        Args:
+
+            season (int): The start year of the season
+
+            boxscore_type (str): The type of quarter boxscore data.
+                Available values:
+                - ByQuarter
+                - EndOfQuarter
+                Default: ByQuarter
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        get_teams_boxscore_quarter_scores_ = (
+            lambda season, gamecode: self.get_teams_boxscore_quarter_scores(
+                season, gamecode, boxscore_type)
+        )
+        return self.iter_season_data_from_game_data(
+            season, get_teams_boxscore_quarter_scores_,
+            max_workers=max_workers)
+
+    def iter_teams_boxscore_quarter_scores_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        boxscore_type: str = "ByQuarter",
+        max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of
+        `get_teams_boxscore_quarter_scores_range_seasons`. It yields the
+        boxscore quarter data of each game as soon as it is collected.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            boxscore_type (str): The type of quarter boxscore data.
+                Available values:
+                - ByQuarter
+                - EndOfQuarter
+                Default: ByQuarter
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        get_teams_boxscore_quarter_scores_ = (
+            lambda season, gamecode: self.get_teams_boxscore_quarter_scores(
+                season, gamecode, boxscore_type)
+        )
+        return self.iter_range_seasons_data(
+            start_season, end_season, get_teams_boxscore_quarter_scores_,
+            max_workers=max_workers)
+
     def get_players_boxscore_stats_round(
         self,
         season: int,
-        round_number: int
+        round_number: int,
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that return the player boxscore stats for all games in a
@@ -289,18 +486,22 @@ class BoxScoreData(EuroLeagueData):
         Args:
             season (int): The start year of the start season
             round_number (int): The number of the round
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
 
         Returns:
             pd.DataFrame: A dataframe with home and away team player stats for
                 a season
         """
         data_df = self.get_round_data_from_game_data(
-            season, round_number, self.get_players_boxscore_stats)
+            season, round_number, self.get_players_boxscore_stats,
+            max_workers=max_workers)
         return data_df
 
     def get_players_boxscore_stats_single_season(
         self,
-        season: int
+        season: int,
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that return the player boxscore stats for all games in a
@@ -308,19 +509,23 @@ class BoxScoreData(EuroLeagueData):
 
         Args:
             season (int): The start year of the start season
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
 
         Returns:
             pd.DataFrame: A dataframe with home and away team player stats for
                 a season
         """
         data_df = self.get_season_data_from_game_data(
-            season, self.get_players_boxscore_stats)
+            season, self.get_players_boxscore_stats,
+            max_workers=max_workers)
         return data_df
 
     def get_players_boxscore_stats_range_seasons(
         self,
         start_season: int,
-        end_season: int
+        end_season: int,
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that return the player boxscore stats for all games in
@@ -331,10 +536,487 @@ class BoxScoreData(EuroLeagueData):
 
             end_season (int): The start year of the end season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
             pd.DataFrame: A dataframe with home and away team player stats for
                 a season
         """
         data_df = self.get_range_seasons_data(
-            start_season, end_season, self.get_players_boxscore_stats)
+            start_season, end_season, self.get_players_boxscore_stats,
+            max_workers=max_workers)
         return data_df
+
+    def iter_players_boxscore_stats_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of
+        `get_players_boxscore_stats_single_season`. It yields the player
+        boxscore stats of each game as soon as it is collected.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_season_data_from_game_data(
+            season, self.get_players_boxscore_stats, max_workers=max_workers)
+
+    def iter_players_boxscore_stats_range_seasons(
+        self, start_season: int, end_season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of
+        `get_players_boxscore_stats_range_seasons`. It yields the player
+        boxscore stats of each game as soon as it is collected.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_range_seasons_data(
+            start_season, end_season, self.get_players_boxscore_stats,
+            max_workers=max_workers)
+
+    def get_boxscore_bundle_round(
+        self,
+        season: int,
+        round_number: int,
+        max_workers: int = 1
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        A function that gets all boxscore tables of all games in a single
+        round, with one request per game.
+
+        Args:
+            season (int): The start year of the season
+            round_number (int): The number of the round
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The `Stats`, `ByQuarter` and
+                `EndOfQuarter` dataframes of all games in the round.
+        """
+        return self.get_round_datasets_from_game_data(
+            season, round_number, self.get_boxscore_bundle,
+            max_workers=max_workers)
+
+    def get_boxscore_bundle_single_season(
+        self,
+        season: int,
+        max_workers: int = 1
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        A function that gets all boxscore tables of all games in a single
+        season, with one request per game.
+
+        Args:
+            season (int): The start year of the season
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The `Stats`, `ByQuarter` and
+                `EndOfQuarter` dataframes of all games in the season.
+        """
+        return self.get_season_datasets_from_game_data(
+            season, self.get_boxscore_bundle, max_workers=max_workers)
+
+    def get_boxscore_bundle_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 1
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        A function that gets all boxscore tables of all games in a range of
+        seasons, with one request per game.
+
+        Args:
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The `Stats`, `ByQuarter` and
+                `EndOfQuarter` dataframes of all games in the seasons.
+        """
+        return self.get_range_seasons_datasets(
+            start_season, end_season, self.get_boxscore_bundle,
+            max_workers=max_workers)
+
+
+class AsyncBoxScoreData(AsyncEuroLeagueData):
+    """
+    The async counterpart of the `BoxScoreData` class.
+
+    Args:
+        competition (str, optional): The competition code, inherited from the
+            `AsyncEuroLeagueData` class. Choose one of:
+            - 'E' for Euroleague
+            - 'U' for Eurocup
+            Defaults to "E".
+        transport (AsyncHTTPTransport, optional): The async HTTP transport,
+            inherited from the `AsyncEuroLeagueData` class. Defaults to None.
+    """
+
+    async def get_boxscore_payload(self, season: int, gamecode: int) -> dict:
+        """
+        The async counterpart of `BoxScoreData.get_boxscore_payload`.
+
+        Args:
+            season (int): The start year of the season
+            gamecode (int): The game-code of the game of interest.
+
+        Returns:
+            dict: The decoded JSON data of the endpoint.
+        """
+        url = self.make_live_game_url("Boxscore")
+        params = self.make_live_game_params(season, gamecode)
+        r = await get_requests_async(
+            url, params=params, transport=self.transport)
+        try:
+            data = decode_json(r)
+        except JSONDecodeError as exc:
+            logger.error(
+                "Game code, %s, season %s, did not return valid JSON data.",
+                gamecode, season
+            )
+            raise exc
+        return data
+
+    async def get_boxscore_data(
+        self,
+        season: int,
+        gamecode: int,
+        boxscore_type: str = "ByQuarter"
+    ) -> List[dict]:
+        """The async counterpart of `BoxScoreData.get_boxscore_data`.
+
+        Args:
+            season (int): The start year of the season
+            gamecode (int): The game-code of the game of interest.
+            boxscore_type (str, optional): The type of quarter boxscore data.
+                Available values:
+                - Stats
+                - ByQuarter
+                - EndOfQuarter
+                Defaults to "ByQuarter".
+
+        Raises:
+            ValueError: If boxscore_type value is not valid.
+
+        Returns:
+            List[dict]: A list of dictionaries with the data.
+        """
+        raise_error(boxscore_type, "Boxscore", BOXSCORE_TYPES, False)
+
+        data = await self.get_boxscore_payload(season, gamecode)
+        try:
+            return data[boxscore_type]
+        except KeyError as exc:
+            logger.error(
+                "Game code, %s, season %s, returned incomplete data.",
+                gamecode, season
+            )
+            raise exc
+
+    async def get_boxscore_bundle(
+        self,
+        season: int,
+        gamecode: int
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        The async counterpart of `BoxScoreData.get_boxscore_bundle`.
+
+        Args:
+            season (int): The start year of the season
+            gamecode (int): The game-code of the game of interest.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The dataframes of the game keyed by
+                boxscore type, i.e. `Stats`, `ByQuarter` and `EndOfQuarter`.
+        """
+        data = await self.get_boxscore_payload(season, gamecode)
+        bundle = BoxScoreData.make_boxscore_bundle(data, season, gamecode)
+        bundle["Stats"] = self.apply_schema(
+            bundle["Stats"], "boxscore_players")
+        return bundle
+
+    async def get_teams_boxscore_quarter_scores(
+        self,
+        season: int,
+        gamecode: int,
+        boxscore_type: str = "ByQuarter"
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of
+        `BoxScoreData.get_teams_boxscore_quarter_scores`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            gamecode (int): The game-code of the game of interest.
+
+            boxscore_type (str): The type of quarter boxscore data.
+                Available values:
+                - ByQuarter
+                - EndOfQuarter
+                Default: ByQuarter
+
+        Raises:
+            ValueError: If boxscore_type value is not valid.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the boxscore quarter data of the
+                game.
+        """
+        valid_vals = ["ByQuarter", "EndOfQuarter"]
+        raise_error(boxscore_type, "Boxscore quarter type", valid_vals, False)
+
+        data = await self.get_boxscore_data(season, gamecode, boxscore_type)
+        return BoxScoreData.make_teams_boxscore_quarter_df(
+            data, season, gamecode)
+
+    async def get_players_boxscore_stats(
+        self,
+        season: int,
+        gamecode: int
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `BoxScoreData.get_players_boxscore_stats`.
+
+        Args:
+            season (int): The start year of the season
+            gamecode (int): The game-code of the game of interest.
+
+        Returns:
+            pd.DataFrame: A dataframe with home and away team player stats
+        """
+        data = await self.get_boxscore_data(season, gamecode, "Stats")
+        df = BoxScoreData.make_players_boxscore_stats_df(
+            data, season, gamecode)
+        return self.apply_schema(df, "boxscore_players")
+
+    async def get_teams_boxscore_quarter_scores_round(
+        self,
+        season: int,
+        round_number: int,
+        boxscore_type: str = "ByQuarter",
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `BoxScoreData` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round of the season
+
+            boxscore_type (str): The type of quarter boxscore data.
+                Available values:
+                - ByQuarter
+                - EndOfQuarter
+                Default: ByQuarter
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the boxscore quarter data
+                of all games in a single round
+        """
+        get_teams_boxscore_quarter_scores_ = (
+            lambda season, gamecode: self.get_teams_boxscore_quarter_scores(
+                season, gamecode, boxscore_type)
+        )
+        df = await self.get_round_data_from_game_data(
+            season, round_number, get_teams_boxscore_quarter_scores_,
+            max_workers=max_workers)
+        return df
+
+    async def get_teams_boxscore_quarter_scores_single_season(
+        self,
+        season: int,
+        boxscore_type: str = "ByQuarter",
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `BoxScoreData` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            boxscore_type (str): The type of quarter boxscore data.
+                Available values:
+                - ByQuarter
+                - EndOfQuarter
+                Default: ByQuarter
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the boxscore quarter data
+                of all games in a single season
+        """
+        get_teams_boxscore_quarter_scores_ = (
+            lambda season, gamecode: self.get_teams_boxscore_quarter_scores(
+                season, gamecode, boxscore_type)
+        )
+        df = await self.get_season_data_from_game_data(
+            season, get_teams_boxscore_quarter_scores_,
+            max_workers=max_workers)
+        return df
+
+    async def get_teams_boxscore_quarter_scores_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        boxscore_type: str = "ByQuarter",
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `BoxScoreData` method of the same
+        name.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            boxscore_type (str): The type of quarter boxscore data.
+                Available values:
+                - ByQuarter
+                - EndOfQuarter
+                Default: ByQuarter
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the boxscore quarter data
+                of all games in a range of seasons
+        """
+        get_teams_boxscore_quarter_scores_ = (
+            lambda season, gamecode: self.get_teams_boxscore_quarter_scores(
+                season, gamecode, boxscore_type)
+        )
+        df = await self.get_range_seasons_data(
+            start_season, end_season, get_teams_boxscore_quarter_scores_,
+            max_workers=max_workers)
+        return df
+
+    async def get_players_boxscore_stats_round(
+        self,
+        season: int,
+        round_number: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `BoxScoreData` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the player boxscore stats
+                of all games in a single round
+        """
+        df = await self.get_round_data_from_game_data(
+            season, round_number, self.get_players_boxscore_stats,
+            max_workers=max_workers)
+        return df
+
+    async def get_players_boxscore_stats_single_season(
+        self,
+        season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `BoxScoreData` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the player boxscore stats
+                of all games in a single season
+        """
+        df = await self.get_season_data_from_game_data(
+            season, self.get_players_boxscore_stats, max_workers=max_workers)
+        return df
+
+    async def get_players_boxscore_stats_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `BoxScoreData` method of the same
+        name.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the player boxscore stats
+                of all games in a range of seasons
+        """
+        df = await self.get_range_seasons_data(
+            start_season, end_season, self.get_players_boxscore_stats,
+            max_workers=max_workers)
+        return df
@@ -0,0 +1,363 @@
+from typing import Optional, Tuple
+import os
+import re
+import gzip
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import logging
+from urllib.parse import urlencode
+import requests
+from .transport import build_response
+
+logger = logging.getLogger(__name__)
+
+GAME_URL_PATTERN = re.compile(r"/seasons/(\w+)/games/(\d+)/")
+
+
+class ResponseCache:
+    """
+    A persistent, size-bounded, on-disk cache of raw response bodies. The
+    bodies are gzip-compressed and content-addressed by the url and the
+    request parameters. An sqlite index keeps their age, size and last access
+    time, so that the least recently used entries are evicted when the cache
+    exceeds `max_size`.
+
+    Entries expire according to three time-to-live (TTL) policies:
+        - `ttl_played`: the endpoints of a game that has been played, as
+          reported by `get_gamecodes_season`. These data never change.
+        - `ttl_live`: the endpoints of a game which is not known to be
+          played, e.g. an in-progress game.
+        - `ttl_default`: everything else, e.g. schedules, standings, stats.
+
+    The policy of an entry is decided when it is stored, so that a body
+    fetched while its game was in progress keeps the `ttl_live` policy after
+    the game is marked as played, and is refetched once it expires.
+
+    Attach it to a transport to enable it, e.g.
+    `HTTPTransport(cache=ResponseCache("~/.euroleague_api_cache"))`.
+
+    Args:
+        directory (str): The directory of the cache. Created if it does not
+            exist.
+        max_size (int, optional): The maximum size of the cached bodies in
+            bytes. Defaults to 1GB.
+        ttl_played (float, optional): The TTL in seconds of played games.
+            Defaults to None, i.e. never expire.
+        ttl_live (float, optional): The TTL in seconds of games that are not
+            known to be played. Defaults to 60.
+        ttl_default (float, optional): The TTL in seconds of every other
+            endpoint. Defaults to 3600.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int = 1024 ** 3,
+        ttl_played: Optional[float] = None,
+        ttl_live: Optional[float] = 60,
+        ttl_default: Optional[float] = 3600
+    ):
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_size = max_size
+        self.ttl_played = ttl_played
+        self.ttl_live = ttl_live
+        self.ttl_default = ttl_default
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(
+            os.path.join(self.directory, "index.sqlite"),
+            check_same_thread=False
+        )
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, url TEXT, size INTEGER, "
+                "created REAL, accessed REAL, encoding TEXT, policy TEXT)"
+            )
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS played ("
+                "seasoncode TEXT, gamecode INTEGER, "
+                "PRIMARY KEY (seasoncode, gamecode))"
+            )
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        """
+        Makes the content address of a request, i.e. the sha256 of its url
+        and its (sorted) parameters. None parameters are dropped, as
+        `requests` does.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables of the request.
+                Defaults to None.
+
+        Returns:
+
+            str: The key of the request.
+        """
+        items = sorted(
+            (k, str(v)) for k, v in (params or {}).items() if v is not None
+        )
+        return hashlib.sha256(
+            f"{url}?{urlencode(items)}".encode()).hexdigest()
+
+    @staticmethod
+    def get_game(
+        url: str,
+        params: Optional[dict] = None
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Finds the game a request refers to, if any.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables of the request.
+                Defaults to None.
+
+        Returns:
+
+            Optional[Tuple[str, int]]: The season code (e.g. E2023) and the
+                game code, or None if the request is not about a game.
+        """
+        params = params or {}
+        if "gamecode" in params and "seasoncode" in params:
+            return params["seasoncode"], int(params["gamecode"])
+        match = GAME_URL_PATTERN.search(url)
+        if match:
+            return match.group(1), int(match.group(2))
+        return None
+
+    def mark_played(self, season_code: str, game_codes) -> None:
+        """
+        Records that games have been played, so that their endpoints are
+        cached with the `ttl_played` policy. The record is persistent.
+
+        Args:
+
+            season_code (str): The season code, e.g. E2023.
+
+            game_codes (Iterable[int]): The game codes of the played games.
+        """
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO played VALUES (?, ?)",
+                [(season_code, int(g)) for g in game_codes]
+            )
+
+    def get_policy(
+        self,
+        url: str,
+        params: Optional[dict] = None
+    ) -> str:
+        """
+        Returns the TTL policy of a request sent now, i.e. "played" if it is
+        about a played game, "live" if it is about another game and
+        "default" otherwise.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables of the request.
+                Defaults to None.
+
+        Returns:
+
+            str: The TTL policy.
+        """
+        game = self.get_game(url, params)
+        if game is None:
+            return "default"
+        with self.lock:
+            played = self.db.execute(
+                "SELECT 1 FROM played WHERE seasoncode = ? AND gamecode = ?",
+                game
+            ).fetchone()
+        return "played" if played else "live"
+
+    def get_ttl(self, policy: str) -> Optional[float]:
+        """
+        Returns the TTL of a policy.
+
+        Args:
+
+            policy (str): The TTL policy, i.e. "played", "live" or
+                "default".
+
+        Returns:
+
+            Optional[float]: The TTL in seconds, None if it never expires.
+        """
+        if policy == "played":
+            return self.ttl_played
+        if policy == "live":
+            return self.ttl_live
+        return self.ttl_default
+
+    def make_path(self, key: str) -> str:
+        """Returns the file path of the body of a cache key."""
+        return os.path.join(self.directory, key[:2], f"{key}.gz")
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None
+    ) -> Optional[requests.models.Response]:
+        """
+        Returns the cached response of a request, if it exists and it has
+        not expired.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables of the request.
+                Defaults to None.
+
+        Returns:
+
+            Optional[requests.models.Response]: The cached response, or None
+                on a cache miss.
+        """
+        key = self.make_key(url, params)
+        now = time.time()
+        with self.lock:
+            row = self.db.execute(
+                "SELECT created, encoding, policy FROM entries WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            ttl = self.get_ttl(row[2])
+            if ttl is not None and now - row[0] > ttl:
+                self.misses += 1
+                return None
+            try:
+                with gzip.open(self.make_path(key), "rb") as f:
+                    content = f.read()
+            except OSError:
+                logger.warning("Cache entry of %s is unreadable.", url)
+                self.misses += 1
+                return None
+            with self.db:
+                self.db.execute(
+                    "UPDATE entries SET accessed = ? WHERE key = ?",
+                    (now, key)
+                )
+            self.hits += 1
+        return build_response(
+            url, 200, content, {"X-Cache": "HIT"}, "OK", row[1])
+
+    def set(
+        self,
+        url: str,
+        params: Optional[dict],
+        response: requests.models.Response
+    ) -> None:
+        """
+        Stores the body of a successful response, with the TTL policy of
+        its request at this time.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables of the request.
+
+            response (requests.models.Response): The response.
+        """
+        if response.status_code != 200:
+            return
+        key = self.make_key(url, params)
+        policy = self.get_policy(url, params)
+        path = self.make_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(response.content)
+        os.replace(tmp_path, path)
+        now = time.time()
+        with self.lock:
+            with self.db:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, url, os.path.getsize(path), now, now,
+                     response.encoding, policy)
+                )
+            self.stores += 1
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Deletes the least recently used entries until the size of the cache
+        is within `max_size`. It must be called with the lock held.
+        """
+        total = self.db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_size:
+            return
+        rows = self.db.execute(
+            "SELECT key, size FROM entries ORDER BY accessed").fetchall()
+        with self.db:
+            for key, size in rows:
+                if total <= self.max_size:
+                    break
+                try:
+                    os.remove(self.make_path(key))
+                except FileNotFoundError:
+                    pass
+                self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Deletes all cached responses. The played games are kept."""
+        with self.lock:
+            for (key,) in self.db.execute("SELECT key FROM entries"):
+                try:
+                    os.remove(self.make_path(key))
+                except FileNotFoundError:
+                    pass
+            with self.db:
+                self.db.execute("DELETE FROM entries")
+
+    def stats(self) -> dict:
+        """
+        Returns the cache statistics of this session.
+
+        Returns:
+
+            dict: The number of hits, misses, stores and evictions, the hit
+                rate, the number of entries and their total size in bytes.
+        """
+        with self.lock:
+            entries, size = self.db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        requests_ = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests_ if requests_ else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size": size,
+        }
+
+    def __repr__(self):
+        return f"ResponseCache({self.directory!r}, {json.dumps(self.stats())})"
@@ -0,0 +1,229 @@
+from typing import Callable, Iterable, Optional, Set
+import os
+import time
+import sqlite3
+import threading
+import logging
+import pandas as pd
+from .utils import get_game_data_from_row, concat_game_data
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """
+    A durable checkpoint of a long collection job, e.g. a range of seasons.
+    The data of each game is persisted as soon as it is collected and each
+    season is marked complete when all of its games have been collected, so
+    that a restarted job with the same `job_id` skips the completed games and
+    seasons and continues where it stopped. The games that failed are
+    recorded with their error and they are retried when the job is resumed.
+
+    The state of a job is kept in `<directory>/<job_id>`, i.e. an sqlite
+    index and a pickle file per collected game.
+
+    Args:
+        directory (str): The directory of the checkpoints. Created if it
+            does not exist.
+        job_id (str): The identifier of the job, e.g. "pbp-2000-2023".
+    """
+
+    def __init__(self, directory: str, job_id: str):
+        self.job_id = job_id
+        self.directory = os.path.join(os.path.expanduser(directory), job_id)
+        os.makedirs(self.directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(
+            os.path.join(self.directory, "checkpoint.sqlite"),
+            check_same_thread=False
+        )
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS games ("
+                "season INTEGER, gamecode INTEGER, status TEXT, "
+                "error TEXT, updated REAL, "
+                "PRIMARY KEY (season, gamecode))"
+            )
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS seasons ("
+                "season INTEGER PRIMARY KEY, updated REAL)"
+            )
+
+    def make_path(self, season: int, gamecode: int) -> str:
+        """Returns the file path of the data of a game."""
+        return os.path.join(self.directory, str(season), f"{gamecode}.pkl")
+
+    def is_season_done(self, season: int) -> bool:
+        """Whether all games of a season have been collected."""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT 1 FROM seasons WHERE season = ?", (season,)
+            ).fetchone()
+        return row is not None
+
+    def get_done_games(self, season: int) -> Set[int]:
+        """Returns the game codes of a season that have been collected."""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT gamecode FROM games "
+                "WHERE season = ? AND status = 'done'",
+                (season,)
+            ).fetchall()
+        return {gamecode for (gamecode,) in rows}
+
+    def save_game(
+        self,
+        season: int,
+        gamecode: int,
+        df: Optional[pd.DataFrame]
+    ) -> None:
+        """
+        Persists the data of a collected game and marks it as done.
+
+        Args:
+
+            season (int): The start year of the season.
+
+            gamecode (int): The game code.
+
+            df (pd.DataFrame, optional): The data of the game, or None if the
+                game returned no data.
+        """
+        if df is not None:
+            path = self.make_path(season, gamecode)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO games VALUES (?, ?, 'done', NULL, ?)",
+                (season, int(gamecode), time.time())
+            )
+
+    def record_failure(
+        self,
+        season: int,
+        gamecode: int,
+        err: Exception
+    ) -> None:
+        """
+        Records a game that failed to be collected.
+
+        Args:
+
+            season (int): The start year of the season.
+
+            gamecode (int): The game code.
+
+            err (Exception): The raised error.
+        """
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO games VALUES (?, ?, 'failed', ?, ?)",
+                (season, int(gamecode), f"{type(err).__name__}: {err}",
+                 time.time())
+            )
+
+    def collect_game(
+        self,
+        row: pd.Series,
+        season: int,
+        fun: Callable[[int, int], pd.DataFrame]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Collects the data of a single game, given its row in the game codes
+        dataframe, and persists it, or records its failure.
+
+        Args:
+
+            row (pd.Series): A row of the game codes dataframe
+
+            season (int): The start year of the season.
+
+            fun (Callable[[int, int], pd.DataFrame]): A callable function
+                that determines that type of data to be collected.
+
+        Returns:
+
+            Optional[pd.DataFrame]: A dataframe with the game's data, or
+                None if the game returned no data or failed.
+        """
+        errors = []
+        df = get_game_data_from_row(
+            row, season, fun, on_error=lambda _, err: errors.append(err))
+        if errors:
+            self.record_failure(season, row["gameCode"], errors[0])
+        else:
+            self.save_game(season, row["gameCode"], df)
+        return df
+
+    def complete_season(
+        self,
+        season: int,
+        game_codes: Iterable[int]
+    ) -> pd.DataFrame:
+        """
+        Loads the data of the collected games of a season, in the order of
+        `game_codes`, and marks the season as done if none of them failed.
+
+        Args:
+
+            season (int): The start year of the season.
+
+            game_codes (Iterable[int]): The game codes of the season.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the data of the collected games.
+        """
+        game_codes = list(game_codes)
+        done = self.get_done_games(season)
+        missing = [g for g in game_codes if g not in done]
+        if missing:
+            logger.warning(
+                "Season %s: %d games failed and will be retried when job %s "
+                "is resumed.", season, len(missing), self.job_id
+            )
+        else:
+            with self.lock, self.db:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO seasons VALUES (?, ?)",
+                    (season, time.time())
+                )
+        return concat_game_data([
+            self.load_game(season, g) for g in game_codes if g in done
+        ])
+
+    def load_game(self, season: int, gamecode: int) -> Optional[pd.DataFrame]:
+        """Loads the data of a collected game, None if it had no data."""
+        path = self.make_path(season, gamecode)
+        if not os.path.exists(path):
+            return None
+        return pd.read_pickle(path)
+
+    def load_season(self, season: int) -> pd.DataFrame:
+        """Loads the data of all collected games of a season."""
+        return concat_game_data([
+            self.load_game(season, g)
+            for g in sorted(self.get_done_games(season))
+        ])
+
+    def get_failed_games(self) -> pd.DataFrame:
+        """
+        Returns the games that failed and have not been collected since.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the season, the game code and the
+                error of each failed game.
+        """
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT season, gamecode, error FROM games "
+                "WHERE status = 'failed' ORDER BY season, gamecode"
+            ).fetchall()
+        return pd.DataFrame(rows, columns=["Season", "gameCode", "error"])
+
+    def __repr__(self):
+        return f"Checkpoint({self.directory!r})"
@@ -0,0 +1,258 @@
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+)
+import io
+import json
+from xml.etree import ElementTree
+import logging
+import requests
+import numpy as np
+import pandas as pd
+from .timing import time_stage
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+JSONLoads = Callable[[Union[bytes, str]], Any]
+
+
+def get_default_json_loads() -> JSONLoads:
+    """
+    Returns the fastest available JSON parser, i.e. `orjson.loads` if
+    `orjson` is installed, else `json.loads`. Both raise a subclass of
+    `json.JSONDecodeError` on invalid data.
+    """
+    if orjson is not None:
+        return orjson.loads
+    return json.loads
+
+
+_json_loads: JSONLoads = get_default_json_loads()
+
+
+def set_json_loads(loads: Optional[JSONLoads] = None) -> None:
+    """
+    Sets the JSON parser used to decode the responses.
+
+    Args:
+        loads (Callable[[Union[bytes, str]], Any], optional): A function that
+            parses a JSON document and raises `json.JSONDecodeError` on
+            invalid data, e.g. `json.loads`. Defaults to None, i.e. the
+            fastest available parser.
+    """
+    global _json_loads
+    _json_loads = get_default_json_loads() if loads is None else loads
+
+
+def decode_json(r: requests.models.Response) -> Any:
+    """
+    Decodes the JSON body of a response with the configured parser. It is
+    the drop-in replacement of `r.json()`, which always uses the standard
+    library.
+
+    Args:
+        r (requests.models.Response): The response object.
+
+    Raises:
+        JSONDecodeError: If the body is not valid JSON.
+
+    Returns:
+        Any: The decoded data.
+    """
+    with time_stage("decode", bytes=len(r.content)):
+        return _json_loads(r.content)
+
+
+def make_records_df(
+    records: Iterable[dict],
+    columns: Optional[Dict[str, list]] = None,
+    converters: Optional[Dict[str, Callable[[Any], Any]]] = None
+) -> pd.DataFrame:
+    """
+    Makes a dataframe from a list of flat JSON records, e.g. the plays of
+    the PlaybyPlay endpoint, by gathering the values of each field into a
+    list first. It gives the same result as `pd.json_normalize` on flat
+    records without its per-record flattening; nested records fall back to
+    `pd.json_normalize`.
+
+    Args:
+        records (Iterable[dict]): The records.
+        columns (Dict[str, list], optional): Extra columns appended after
+            the fields of the records, one value per record. Defaults to
+            None.
+        converters (Dict[str, Callable[[Any], Any]], optional): Functions
+            applied to the values of the given fields, e.g. `int` or
+            `clean_name`, so that the columns are built with their final
+            type and values. Each function is called once per distinct
+            value. Defaults to None.
+
+    Returns:
+        pd.DataFrame: A dataframe with a row per record and a column per
+            field, in the order of first appearance.
+    """
+    with time_stage("frame") as stage:
+        df = build_records_df(list(records), columns, converters)
+        stage.fields["rows"] = len(df)
+    return df
+
+
+def build_records_df(
+    records: List[dict],
+    columns: Optional[Dict[str, list]] = None,
+    converters: Optional[Dict[str, Callable[[Any], Any]]] = None
+) -> pd.DataFrame:
+    """The untimed body of `make_records_df`."""
+    if not records:
+        return pd.DataFrame()
+    converters = converters or {}
+    # gather the fields, and check that every record is flat, in one pass
+    fields: Dict[str, None] = {}
+    nested = False
+    for record in records:
+        fields.update(dict.fromkeys(record))
+        if not nested:
+            nested = any(isinstance(v, dict) for v in record.values())
+    if nested:
+        df = pd.json_normalize(records)
+        for field, converter in converters.items():
+            if field in df.columns:
+                df[field] = clean_series(df[field], converter)
+        for name, values in (columns or {}).items():
+            df[name] = values
+        return df
+
+    data: Dict[str, List[Any]] = {
+        field: [record.get(field, np.nan) for record in records]
+        for field in fields
+    }
+    for field, converter in converters.items():
+        if field in data:
+            data[field] = map_unique(converter, data[field])
+    data.update(columns or {})
+    return pd.DataFrame(data)
+
+
+def json_normalize(data: Any, **kwargs: Any) -> pd.DataFrame:
+    """
+    `pd.json_normalize`, timed as the "frame" stage of the last request,
+    see `timing.time_stage`.
+
+    Args:
+        data (Any): The decoded JSON data, i.e. a dict or a list of dicts.
+        kwargs (Any): The keyword arguments of `pd.json_normalize`.
+
+    Returns:
+        pd.DataFrame: The normalised data.
+    """
+    with time_stage("frame") as stage:
+        df = pd.json_normalize(data, **kwargs)
+        stage.fields["rows"] = len(df)
+    return df
+
+
+def map_unique(fun: Callable[[Any], Any], values: List[Any]) -> List[Any]:
+    """
+    Applies a function to a list of hashable values, calling it once per
+    distinct value, e.g. once per player rather than once per play.
+
+    Args:
+        fun (Callable[[Any], Any]): The function.
+        values (List[Any]): The values.
+
+    Returns:
+        List[Any]: The results, in the order of the values.
+    """
+    mapping = {value: fun(value) for value in set(values)}
+    return [mapping[value] for value in values]
+
+
+def clean_series(s: pd.Series, fun: Callable[[Any], Any]) -> pd.Series:
+    """
+    The counterpart of `map_unique` for a column of a dataframe, e.g. to
+    clean the names of a built dataframe. The missing values are kept.
+
+    Args:
+        s (pd.Series): The column.
+        fun (Callable[[Any], Any]): The function.
+
+    Returns:
+        pd.Series: The column with the function applied to its values.
+    """
+    codes, uniques = pd.factorize(s)
+    results = np.array(
+        [fun(value) for value in uniques] + [np.nan], dtype=object)
+    return pd.Series(results[codes].tolist(), index=s.index, name=s.name)
+
+
+def strip(value: Any) -> Any:
+    """Strips the white space around a code, e.g. a team code."""
+    return value.strip() if isinstance(value, str) else value
+
+
+def clean_name(value: Any) -> Any:
+    """
+    Normalises the white space of a player's name, e.g.
+    "SURNAME ,  NAME " to "SURNAME, NAME".
+    """
+    if not isinstance(value, str):
+        return value
+    return value.replace("  ", " ").replace(" , ", ", ").strip()
+
+
+def iter_xml_records(content: bytes, tag: str) -> Iterator[Dict[str, Any]]:
+    """
+    Streams the flat records of an XML document, e.g. the `game` elements of
+    the v1 results endpoint, as dicts of child tag to text, the same as
+    `xmltodict`: the text is stripped, an empty text is None and the
+    attributes are keyed by `@` and their name. Each element is released
+    and detached from its parent as soon as it ends, outside the records,
+    so that the document is streamed in constant memory instead of being
+    held as a tree.
+
+    Args:
+        content (bytes): The XML document.
+        tag (str): The tag of the records.
+
+    Raises:
+        ValueError: If a record is not flat, i.e. it has a nested element, a
+            child with attributes or a repeated child.
+
+    Returns:
+        Iterator[Dict[str, Any]]: The records, in the order of the document.
+    """
+    # the open elements, i.e. the ancestors of the current one
+    parents: List[ElementTree.Element] = []
+    in_record = False
+    for event, elem in ElementTree.iterparse(
+            io.BytesIO(content), ("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            in_record = in_record or elem.tag == tag
+            continue
+        parents.pop()
+        if elem.tag != tag and in_record:
+            # a child of a record, released with it
+            continue
+        record: Optional[Dict[str, Any]] = None
+        if elem.tag == tag:
+            record = {
+                f"@{name}": value for name, value in elem.attrib.items()
+            }
+            for child in elem:
+                if len(child) or child.attrib or child.tag in record:
+                    raise ValueError(
+                        f"The {tag} records of the XML document are not "
+                        "flat."
+                    )
+                text = child.text.strip() if child.text else None
+                record[child.tag] = text or None
+            in_record = False
+        elem.clear()
+        if parents:
+            parents[-1].remove(elem)
+        if record is not None:
+            yield record
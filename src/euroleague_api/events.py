@@ -0,0 +1,177 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import time
+import threading
+import logging
+import pandas as pd
+
+Event = Dict[str, Any]
+EventListener = Callable[[Event], None]
+
+_listeners: List[EventListener] = []
+_listeners_lock = threading.Lock()
+
+
+def add_listener(listener: EventListener) -> None:
+    """
+    Subscribes a function to the events of the package, e.g. the timing of
+    every request and the warnings of every game. It is called with a dict
+    per event, in the thread that emits it, so it should be quick and
+    thread-safe.
+
+    Args:
+        listener (Callable[[Dict[str, Any]], None]): The function.
+    """
+    with _listeners_lock:
+        _listeners.append(listener)
+
+
+def remove_listener(listener: EventListener) -> None:
+    """
+    Unsubscribes a function added by `add_listener`.
+
+    Args:
+        listener (Callable[[Dict[str, Any]], None]): The function.
+
+    Raises:
+        ValueError: If the function is not subscribed.
+    """
+    with _listeners_lock:
+        _listeners.remove(listener)
+
+
+def has_listeners() -> bool:
+    """If any function is subscribed to the events."""
+    return bool(_listeners)
+
+
+def emit(event: str, **fields: Any) -> None:
+    """
+    Sends an event to the subscribed functions. The event is a dict with its
+    name under "event", its wall-clock time under "time" and the given
+    fields. It costs a single check when nothing is subscribed.
+
+    The events of the package are:
+        - "request_start": url, endpoint and params of a request about to
+          be sent.
+        - "request": url, endpoint, params, status, bytes and elapsed (s) of
+          every request, including failed ones. The endpoint is the url
+          template, see `timing.get_url_template`.
+        - "stage": stage, endpoint and elapsed (s) of a stage of the
+          processing of a response, i.e. "decode" with its bytes, "frame"
+          and "lineups" with their rows, see `timing.time_stage`.
+        - "game": endpoint, function, season, gamecode, elapsed (s), rows
+          and ok of every game collected over a season.
+        - "retry": url, status, attempt and delay (s) of a retried request.
+        - "game_error": season, gamecode, error and message of a game whose
+          data could not be collected.
+        - "game_empty": season and gamecode of a game without data.
+        - "unmatched_substitution": season, gamecode and index of a
+          substitution without a matching one.
+        - "mismatched_substitution": season, gamecode, index and
+          match_index of a pair of substitutions of different teams or
+          times.
+        - "player_not_in_lineup": season, gamecode and player subbed out
+          while not on the court.
+        - "oversized_lineup": players of a lineup of more than five
+          players, which is truncated to five columns.
+        - "no_starters": season and gamecode of a game without starters in
+          its boxscore.
+        - "cast_error": dataset, column and message of a column that does
+          not fit its schema.
+
+    Args:
+        event (str): The name of the event.
+        fields (Any): The fields of the event.
+    """
+    if not _listeners:
+        return
+    record = {"event": event, "time": time.time(), **fields}
+    for listener in tuple(_listeners):
+        listener(record)
+
+
+class EventLog:
+    """
+    Records the events of the package in memory, while it is used as a
+    context manager, e.g.
+
+        with EventLog() as log:
+            df = PlayByPlay().get_game_play_by_play_data_single_season(2023)
+        log.to_df().query("event == 'unmatched_substitution'")
+
+    Args:
+        events (List[str], optional): The names of the recorded events.
+            Defaults to None, i.e. all events.
+    """
+
+    def __init__(self, events: Optional[List[str]] = None):
+        self.events = None if events is None else set(events)
+        self.records: List[Event] = []
+
+    def __call__(self, record: Event) -> None:
+        if self.events is None or record["event"] in self.events:
+            self.records.append(record)
+
+    def __enter__(self):
+        add_listener(self)
+        return self
+
+    def __exit__(self, *args):
+        remove_listener(self)
+
+    def to_df(self) -> pd.DataFrame:
+        """
+        Returns the recorded events as a dataframe, with a row per event and
+        a column per field.
+        """
+        return pd.DataFrame(self.records)
+
+
+def record_events(
+    fun: Callable[..., Any],
+    *args: Any
+) -> Tuple[Any, List[Event]]:
+    """
+    Calls a function and returns its result with the events it emitted, so
+    that they can be sent back from a worker process, see
+    `utils.map_with_processes`.
+
+    Args:
+        fun (Callable[..., Any]): The function.
+        args (Any): Its arguments.
+
+    Returns:
+        Tuple[Any, List[Dict[str, Any]]]: The result and the events.
+    """
+    with EventLog() as log:
+        result = fun(*args)
+    return result, log.records
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    handler: Optional[logging.Handler] = None
+) -> logging.Handler:
+    """
+    Sends the log messages of the package to a handler, i.e. the standard
+    error by default. The package does not configure logging itself, so its
+    messages follow the configuration of the application, if any. The root
+    logger is left untouched.
+
+    Args:
+        level (int, optional): The minimum level of the messages.
+            Defaults to logging.INFO.
+        handler (logging.Handler, optional): The handler. Defaults to None,
+            i.e. a `logging.StreamHandler`.
+
+    Returns:
+        logging.Handler: The handler.
+    """
+    if handler is None:
+        handler = logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    package_logger = logging.getLogger(__name__.rpartition(".")[0])
+    package_logger.setLevel(level)
+    package_logger.addHandler(handler)
+    return handler
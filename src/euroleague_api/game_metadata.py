@@ -1,8 +1,10 @@
+from typing import Iterator
 import logging
 from json.decoder import JSONDecodeError
 import pandas as pd
-from .EuroLeagueData import EuroLeagueData
-from .utils import get_requests
+from .EuroLeagueData import EuroLeagueData, AsyncEuroLeagueData
+from .utils import get_requests, get_requests_async
+from .decoding import decode_json, json_normalize
 
 logger = logging.getLogger(__name__)
 
@@ -34,29 +36,46 @@ class GameMetadata(EuroLeagueData):
         Returns:
             pd.DataFrame: A dataframe containing metadata of a game.
         """
-        url = "https://live.euroleague.net/api/Header"
-        params = {
-            "gamecode": gamecode,
-            "seasoncode": f"{self.competition}{season}"
-        }
-        r = get_requests(url, params=params)
+        url = self.make_live_game_url("Header")
+        params = self.make_live_game_params(season, gamecode)
+        r = get_requests(url, params=params, transport=self.transport)
 
         try:
-            data = r.json()
+            data = decode_json(r)
         except JSONDecodeError as exc:
             logger.error(
-                f"Game code, {gamecode}, season {season}, "
-                "did not return valid JSON data."
+                "Game code, %s, season %s, did not return valid JSON data.",
+                gamecode, season
             )
             raise exc
-        metadata_df = pd.json_normalize(data)
+        return self.make_game_metadata_df(data, season, gamecode)
+
+    @staticmethod
+    def make_game_metadata_df(
+        data: dict,
+        season: int,
+        gamecode: int
+    ) -> pd.DataFrame:
+        """
+        Makes the metadata dataframe of a game from the JSON response of the
+        Header endpoint.
+
+        Args:
+            data (dict): The decoded JSON response.
+            season (int): The start year of the season.
+            gamecode (int): Unique identifier code of the game.
+
+        Returns:
+            pd.DataFrame: A dataframe containing metadata of a game.
+        """
+        metadata_df = json_normalize(data)
         metadata_df.insert(0, 'Season', season)
         metadata_df.insert(1, 'Gamecode', gamecode)
         metadata_df["Round"] = metadata_df["Round"].astype(int)
         return metadata_df
 
     def get_game_metadata_round(
-        self, season: int, round_number: int
+        self, season: int, round_number: int, max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the metadata of all games in a single round.
@@ -64,6 +83,8 @@ class GameMetadata(EuroLeagueData):
         Args:
             season (int): The start year of the season.
             round_number (int): The round of the season.
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
 
         Returns:
             pd.DataFrame: A dataframe with the metadata of all games in a
@@ -72,16 +93,21 @@ class GameMetadata(EuroLeagueData):
         df = self.get_round_data_from_game_data(
             season=season,
             round_number=round_number,
-            fun=self.get_game_metadata
+            fun=self.get_game_metadata,
+            max_workers=max_workers
         )
         return df
 
-    def get_game_metadata_single_season(self, season: int) -> pd.DataFrame:
+    def get_game_metadata_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> pd.DataFrame:
         """
         A function to retrieve game metadata for all games in a single season.
 
         Args:
             season (int): The start year of the season.
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
 
         Returns:
             pd.DataFrame: A dataframe containing metadata for all games
@@ -89,12 +115,13 @@ class GameMetadata(EuroLeagueData):
         """
 
         single_season_metadata_df = self.get_season_data_from_game_data(
-            season, self.get_game_metadata
+            season, self.get_game_metadata,
+            max_workers=max_workers
         )
         return single_season_metadata_df
 
     def get_game_metadata_range_seasons(
-        self, start_season: int, end_season: int
+        self, start_season: int, end_season: int, max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the metadata of *all* games in a range of seasons
@@ -105,11 +132,190 @@ class GameMetadata(EuroLeagueData):
 
             end_season (int): The start year of the end season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with the metadata of all games in range
                 of seasons
         """
         metadata_df = self.get_range_seasons_data(
-            start_season, end_season, self.get_game_metadata)
+            start_season, end_season, self.get_game_metadata,
+            max_workers=max_workers)
         return metadata_df
+
+    def iter_game_metadata_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_metadata_single_season`. It
+        yields the metadata of each game as soon as it is collected.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_season_data_from_game_data(
+            season, self.get_game_metadata, max_workers=max_workers)
+
+    def iter_game_metadata_range_seasons(
+        self, start_season: int, end_season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_metadata_range_seasons`. It
+        yields the metadata of each game as soon as it is collected.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_range_seasons_data(
+            start_season, end_season, self.get_game_metadata,
+            max_workers=max_workers)
+
+
+class AsyncGameMetadata(AsyncEuroLeagueData):
+    """
+    The async counterpart of the `GameMetadata` class.
+
+    Args:
+        competition (str, optional): The competition code, inherited from the
+            `AsyncEuroLeagueData` class. Choose one of:
+            - 'E' for Euroleague
+            - 'U' for Eurocup
+            Defaults to "E".
+        transport (AsyncHTTPTransport, optional): The async HTTP transport,
+            inherited from the `AsyncEuroLeagueData` class. Defaults to None.
+    """
+
+    async def get_game_metadata(
+        self,
+        season: int,
+        gamecode: int,
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `GameMetadata.get_game_metadata`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            gamecode (int): The game-code of the game of interest.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the metadata of the game.
+        """
+        url = self.make_live_game_url("Header")
+        params = self.make_live_game_params(season, gamecode)
+        r = await get_requests_async(
+            url, params=params, transport=self.transport)
+        try:
+            data = decode_json(r)
+        except JSONDecodeError as exc:
+            logger.error(
+                "Game code, %s, season %s, did not return valid JSON data.",
+                gamecode, season
+            )
+            raise exc
+        return GameMetadata.make_game_metadata_df(data, season, gamecode)
+
+    async def get_game_metadata_round(
+        self,
+        season: int,
+        round_number: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameMetadata` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the metadata
+                of all games in a single round
+        """
+        df = await self.get_round_data_from_game_data(
+            season, round_number, self.get_game_metadata,
+            max_workers=max_workers)
+        return df
+
+    async def get_game_metadata_single_season(
+        self,
+        season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameMetadata` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the metadata
+                of all games in a single season
+        """
+        df = await self.get_season_data_from_game_data(
+            season, self.get_game_metadata, max_workers=max_workers)
+        return df
+
+    async def get_game_metadata_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameMetadata` method of the same
+        name.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the metadata
+                of all games in a range of seasons
+        """
+        df = await self.get_range_seasons_data(
+            start_season, end_season, self.get_game_metadata,
+            max_workers=max_workers)
+        return df
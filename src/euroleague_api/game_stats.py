@@ -1,9 +1,12 @@
+from typing import Iterator
 import pandas as pd
-from .EuroLeagueData import EuroLeagueData
+from .EuroLeagueData import EuroLeagueData, AsyncEuroLeagueData
 from .utils import (
     raise_error,
-    get_requests
+    get_requests,
+    get_requests_async
 )
+from .decoding import decode_json, json_normalize
 
 
 class GameStats(EuroLeagueData):
@@ -52,10 +55,35 @@ class GameStats(EuroLeagueData):
         raise_error(endpoint, "Statistic type", game_endpoints, False)
 
         url_ = self.make_season_game_url(season, game_code, endpoint)
-        r = get_requests(url_)
+        r = get_requests(url_, transport=self.transport)
 
-        data = r.json()
-        df = pd.json_normalize(data)
+        data = decode_json(r)
+        df = self.make_game_data_df(data, season, game_code)
+        return self.apply_schema(df, f"game_{endpoint}")
+
+    @staticmethod
+    def make_game_data_df(
+        data: dict,
+        season: int,
+        game_code: int
+    ) -> pd.DataFrame:
+        """
+        Makes the game-level dataframe from the JSON response of a v3 game
+        endpoint.
+
+        Args:
+
+            data (dict): The decoded JSON response.
+
+            season (int): The start year of the season
+
+            game_code (int): The game code of the game of interest.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the game data.
+        """
+        df = json_normalize(data)
         df.insert(0, "Season", season)
         if "gameCode" in df.columns:
             df.rename(columns={"gameCode": "Gamecode"}, inplace=True)
@@ -82,7 +110,7 @@ class GameStats(EuroLeagueData):
         return df
 
     def get_game_report_round(
-        self, season: int, round_number: int
+        self, season: int, round_number: int, max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the game report data
@@ -91,6 +119,8 @@ class GameStats(EuroLeagueData):
         Args:
             season (int): The start year of the season
             round_number (int): The round of the season
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
 
         Returns:
 
@@ -98,27 +128,34 @@ class GameStats(EuroLeagueData):
                 all games in a single round
         """
         data_df = self.get_round_data_from_game_data(
-            season, round_number, self.get_game_report)
+            season, round_number, self.get_game_report,
+            max_workers=max_workers)
         return data_df
 
-    def get_game_report_single_season(self, season: int) -> pd.DataFrame:
+    def get_game_report_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> pd.DataFrame:
         """
         Get game report data for *all* games in a single season
 
         Args:
             season (int): The start year of the season
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
 
         Returns:
             pd.DataFrame: A dataframe with game report data
         """
         data_df = self.get_season_data_from_game_data(
-            season, self.get_game_report)
+            season, self.get_game_report,
+            max_workers=max_workers)
         return data_df
 
     def get_game_report_range_seasons(
         self,
         start_season: int,
-        end_season: int
+        end_season: int,
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         Get game report data for *all* games in a range of seasons
@@ -129,14 +166,63 @@ class GameStats(EuroLeagueData):
 
             end_season (int): The start year of the end season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with game report data
         """
         df = self.get_range_seasons_data(
-            start_season, end_season, self.get_game_report)
+            start_season, end_season, self.get_game_report,
+            max_workers=max_workers)
         return df
 
+    def iter_game_report_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_report_single_season`. It yields
+        the game report data of each game as soon as it is collected.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_season_data_from_game_data(
+            season, self.get_game_report, max_workers=max_workers)
+
+    def iter_game_report_range_seasons(
+        self, start_season: int, end_season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_report_range_seasons`. It yields
+        the game report data of each game as soon as it is collected.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_range_seasons_data(
+            start_season, end_season, self.get_game_report,
+            max_workers=max_workers)
+
     def get_game_stats(self, season: int, game_code: int) -> pd.DataFrame:
         """
         Get game stats data for single game
@@ -156,7 +242,7 @@ class GameStats(EuroLeagueData):
         return df
 
     def get_game_stats_round(
-        self, season: int, round_number: int
+        self, season: int, round_number: int, max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the game stats data
@@ -165,6 +251,8 @@ class GameStats(EuroLeagueData):
         Args:
             season (int): The start year of the season
             round_number (int): The round of the season
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
 
         Returns:
 
@@ -172,10 +260,13 @@ class GameStats(EuroLeagueData):
                 all games in a single round
         """
         data_df = self.get_round_data_from_game_data(
-            season, round_number, self.get_game_stats)
+            season, round_number, self.get_game_stats,
+            max_workers=max_workers)
         return data_df
 
-    def get_game_stats_single_season(self, season: int) -> pd.DataFrame:
+    def get_game_stats_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> pd.DataFrame:
         """
         Get game stats data for *all* games in a single season
 
@@ -183,18 +274,23 @@ class GameStats(EuroLeagueData):
 
             season (int): The start year of the season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with the games' stats data
         """
         data_df = self.get_season_data_from_game_data(
-            season, self.get_game_stats)
+            season, self.get_game_stats,
+            max_workers=max_workers)
         return data_df
 
     def get_game_stats_range_seasons(
         self,
         start_season: int,
-        end_season: int
+        end_season: int,
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         Get game stats data for *all* games in a range of seasons
@@ -205,14 +301,63 @@ class GameStats(EuroLeagueData):
 
             end_season (int): The start year of the end season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with the games' stats data
         """
         df = self.get_range_seasons_data(
-            start_season, end_season, self.get_game_stats)
+            start_season, end_season, self.get_game_stats,
+            max_workers=max_workers)
         return df
 
+    def iter_game_stats_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_stats_single_season`. It yields
+        the game stats data of each game as soon as it is collected.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_season_data_from_game_data(
+            season, self.get_game_stats, max_workers=max_workers)
+
+    def iter_game_stats_range_seasons(
+        self, start_season: int, end_season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_stats_range_seasons`. It yields
+        the game stats data of each game as soon as it is collected.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_range_seasons_data(
+            start_season, end_season, self.get_game_stats,
+            max_workers=max_workers)
+
     def get_game_teams_comparison(
         self,
         season: int,
@@ -238,7 +383,7 @@ class GameStats(EuroLeagueData):
         return df
 
     def get_game_teams_comparison_round(
-        self, season: int, round_number: int
+        self, season: int, round_number: int, max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the "teams comparison" game stats
@@ -247,6 +392,8 @@ class GameStats(EuroLeagueData):
         Args:
             season (int): The start year of the season
             round_number (int): The round of the season
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
 
         Returns:
 
@@ -254,11 +401,12 @@ class GameStats(EuroLeagueData):
                 all games in a single round
         """
         data_df = self.get_round_data_from_game_data(
-            season, round_number, self.get_game_teams_comparison)
+            season, round_number, self.get_game_teams_comparison,
+            max_workers=max_workers)
         return data_df
 
     def get_game_teams_comparison_single_season(
-            self, season: int) -> pd.DataFrame:
+            self, season: int, max_workers: int = 1) -> pd.DataFrame:
         """
         A function that gets the pre-grame "teams comparison" game stats for
         *all* games in a single season.
@@ -267,18 +415,23 @@ class GameStats(EuroLeagueData):
 
             season (int): The start year of the season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with games teams comparison stats
         """
         data_df = self.get_season_data_from_game_data(
-            season, self.get_game_teams_comparison)
+            season, self.get_game_teams_comparison,
+            max_workers=max_workers)
         return data_df
 
     def get_game_teams_comparison_range_seasons(
         self,
         start_season: int,
-        end_season: int
+        end_season: int,
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the pre-game "teams comparison" game stats for
@@ -290,6 +443,9 @@ class GameStats(EuroLeagueData):
 
             end_season (int): The start year of the end season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with games teams comparison stats
@@ -297,6 +453,414 @@ class GameStats(EuroLeagueData):
         df = self.get_range_seasons_data(
             start_season,
             end_season,
-            self.get_game_teams_comparison
+            self.get_game_teams_comparison,
+            max_workers=max_workers
         )
         return df
+
+    def iter_game_teams_comparison_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_teams_comparison_single_season`.
+        It yields the teams comparison stats of each game as soon as it is
+        collected.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_season_data_from_game_data(
+            season, self.get_game_teams_comparison, max_workers=max_workers)
+
+    def iter_game_teams_comparison_range_seasons(
+        self, start_season: int, end_season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_teams_comparison_range_seasons`.
+        It yields the teams comparison stats of each game as soon as it is
+        collected.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_range_seasons_data(
+            start_season, end_season, self.get_game_teams_comparison,
+            max_workers=max_workers)
+
+
+class AsyncGameStats(AsyncEuroLeagueData):
+    """
+    The async counterpart of the `GameStats` class.
+
+    Args:
+        competition (str, optional): The competition code, inherited from the
+            `AsyncEuroLeagueData` class. Choose one of:
+            - 'E' for Euroleague
+            - 'U' for Eurocup
+            Defaults to "E".
+        transport (AsyncHTTPTransport, optional): The async HTTP transport,
+            inherited from the `AsyncEuroLeagueData` class. Defaults to None.
+    """
+
+    async def get_game_data(
+        self,
+        season: int,
+        game_code: int,
+        endpoint: str
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `GameStats.get_game_data`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            game_code (int): The game code of the game of interest.
+
+            endpoint (str): The type of game data, available variables:
+                - report
+                - stats
+                - teamsComparison
+
+        Raises:
+
+            ValueError: If input endpoint is not applicable.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the game data.
+        """
+        game_endpoints = ["report", "stats", "teamsComparison"]
+
+        raise_error(endpoint, "Statistic type", game_endpoints, False)
+
+        url_ = self.make_season_game_url(season, game_code, endpoint)
+        r = await get_requests_async(url_, transport=self.transport)
+
+        data = decode_json(r)
+        df = GameStats.make_game_data_df(data, season, game_code)
+        return self.apply_schema(df, f"game_{endpoint}")
+
+    async def get_game_report(
+        self, season: int, game_code: int
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `GameStats.get_game_report`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            game_code (int): The game code of the game of interest.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the game report data
+        """
+        df = await self.get_game_data(season, game_code, "report")
+        return df
+
+    async def get_game_report_round(
+        self,
+        season: int,
+        round_number: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameStats` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the game report data
+                of all games in a single round
+        """
+        df = await self.get_round_data_from_game_data(
+            season, round_number, self.get_game_report,
+            max_workers=max_workers)
+        return df
+
+    async def get_game_report_single_season(
+        self,
+        season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameStats` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the game report data
+                of all games in a single season
+        """
+        df = await self.get_season_data_from_game_data(
+            season, self.get_game_report, max_workers=max_workers)
+        return df
+
+    async def get_game_report_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameStats` method of the same
+        name.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the game report data
+                of all games in a range of seasons
+        """
+        df = await self.get_range_seasons_data(
+            start_season, end_season, self.get_game_report,
+            max_workers=max_workers)
+        return df
+
+    async def get_game_stats(
+        self, season: int, game_code: int
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `GameStats.get_game_stats`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            game_code (int): The game code of the game of interest.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the games' stats data
+        """
+        df = await self.get_game_data(season, game_code, "stats")
+        return df
+
+    async def get_game_stats_round(
+        self,
+        season: int,
+        round_number: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameStats` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the games' stats data
+                of all games in a single round
+        """
+        df = await self.get_round_data_from_game_data(
+            season, round_number, self.get_game_stats,
+            max_workers=max_workers)
+        return df
+
+    async def get_game_stats_single_season(
+        self,
+        season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameStats` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the games' stats data
+                of all games in a single season
+        """
+        df = await self.get_season_data_from_game_data(
+            season, self.get_game_stats, max_workers=max_workers)
+        return df
+
+    async def get_game_stats_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameStats` method of the same
+        name.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the games' stats data
+                of all games in a range of seasons
+        """
+        df = await self.get_range_seasons_data(
+            start_season, end_season, self.get_game_stats,
+            max_workers=max_workers)
+        return df
+
+    async def get_game_teams_comparison(
+        self, season: int, game_code: int
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `GameStats.get_game_teams_comparison`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            game_code (int): The game code of the game of interest.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the "teams comparison" game stats
+        """
+        df = await self.get_game_data(season, game_code, "teamsComparison")
+        return df
+
+    async def get_game_teams_comparison_round(
+        self,
+        season: int,
+        round_number: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameStats` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the "teams comparison" game stats
+                of all games in a single round
+        """
+        df = await self.get_round_data_from_game_data(
+            season, round_number, self.get_game_teams_comparison,
+            max_workers=max_workers)
+        return df
+
+    async def get_game_teams_comparison_single_season(
+        self,
+        season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameStats` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the "teams comparison" game stats
+                of all games in a single season
+        """
+        df = await self.get_season_data_from_game_data(
+            season, self.get_game_teams_comparison, max_workers=max_workers)
+        return df
+
+    async def get_game_teams_comparison_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `GameStats` method of the same
+        name.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the "teams comparison" game stats
+                of all games in a range of seasons
+        """
+        df = await self.get_range_seasons_data(
+            start_season, end_season, self.get_game_teams_comparison,
+            max_workers=max_workers)
+        return df
@@ -0,0 +1,366 @@
+from typing import Callable, Dict, List, Optional
+import os
+import logging
+import pandas as pd
+from .EuroLeagueData import EuroLeagueData
+from .play_by_play_data import PlayByPlay
+from .shot_data import ShotData
+from .boxscore_data import BoxScoreData
+from .game_metadata import GameMetadata
+from .game_stats import GameStats
+from .transport import HTTPTransport
+from .utils import (
+    raise_error,
+    get_game_datasets_from_row,
+    map_with_workers,
+    concat_game_datasets,
+    progress_range
+)
+from .schemas import concat_frames
+
+logger = logging.getLogger(__name__)
+
+BOXSCORE_DATASETS = {
+    "boxscore_stats": "Stats",
+    "boxscore_by_quarter": "ByQuarter",
+    "boxscore_end_of_quarter": "EndOfQuarter",
+}
+
+
+class GameHarvester(EuroLeagueData):
+    """
+    A class for collecting all game-level datasets in one pass over the
+    games. The game codes are resolved once and the requests of every game
+    and endpoint are sent concurrently over the same transport. The
+    endpoints that serve several datasets, e.g. the Boxscore, are requested
+    once per game.
+
+    Available datasets:
+        - play_by_play
+        - shots
+        - boxscore_stats
+        - boxscore_by_quarter
+        - boxscore_end_of_quarter
+        - metadata
+        - report
+        - stats
+        - teams_comparison
+
+    Args:
+        competition (str, optional): The competition code, inherited from the
+            `EuroLeagueData` class. Choose one of:
+            - 'E' for Euroleague
+            - 'U' for Eurocup
+            Defaults to "E".
+        transport (HTTPTransport, optional): The HTTP transport, inherited
+            from the `EuroLeagueData` class. Defaults to None.
+        typed (bool, optional): Whether to cast the dataframes to their typed
+            schema, inherited from the `EuroLeagueData` class. Defaults to
+            False.
+    """
+    DATASETS = [
+        "play_by_play",
+        "shots",
+        "boxscore_stats",
+        "boxscore_by_quarter",
+        "boxscore_end_of_quarter",
+        "metadata",
+        "report",
+        "stats",
+        "teams_comparison",
+    ]
+
+    def __init__(
+        self,
+        competition: str = "E",
+        transport: Optional[HTTPTransport] = None,
+        typed: bool = False
+    ):
+        super().__init__(competition, transport=transport, typed=typed)
+        self.play_by_play = PlayByPlay(
+            competition, transport=self.transport, typed=typed)
+        self.shots = ShotData(
+            competition, transport=self.transport, typed=typed)
+        self.boxscore = BoxScoreData(
+            competition, transport=self.transport, typed=typed)
+        self.metadata = GameMetadata(
+            competition, transport=self.transport, typed=typed)
+        self.game_stats = GameStats(
+            competition, transport=self.transport, typed=typed)
+
+    def get_game_requests(
+        self,
+        datasets: Optional[List[str]] = None
+    ) -> List[Callable[[int, int], Dict[str, pd.DataFrame]]]:
+        """
+        Returns the requests of a game that serve the given datasets, one
+        function per endpoint.
+
+        Args:
+            datasets (List[str], optional): The datasets to collect.
+                Defaults to None, i.e. all datasets.
+
+        Raises:
+            ValueError: If a dataset is not valid.
+
+        Returns:
+            List[Callable[[int, int], Dict[str, pd.DataFrame]]]: Functions of
+                the season and the game code that return the dataframes of
+                the game keyed by dataset.
+        """
+        if datasets is None:
+            datasets = self.DATASETS
+        for dataset in datasets:
+            raise_error(dataset, "Dataset", self.DATASETS, False)
+
+        single_requests = {
+            "play_by_play": self.play_by_play.get_game_play_by_play_data,
+            "shots": self.shots.get_game_shot_data,
+            "metadata": self.metadata.get_game_metadata,
+            "report": self.game_stats.get_game_report,
+            "stats": self.game_stats.get_game_stats,
+            "teams_comparison": self.game_stats.get_game_teams_comparison,
+        }
+        game_requests = [
+            as_dataset_request(name, fun)
+            for name, fun in single_requests.items() if name in datasets
+        ]
+
+        boxscore_datasets = [d for d in datasets if d in BOXSCORE_DATASETS]
+        if boxscore_datasets:
+            def get_boxscore_datasets(season, gamecode):
+                bundle = self.boxscore.get_boxscore_bundle(season, gamecode)
+                return {
+                    name: bundle[BOXSCORE_DATASETS[name]]
+                    for name in boxscore_datasets
+                }
+
+            game_requests.append(get_boxscore_datasets)
+        return game_requests
+
+    def harvest_game(
+        self,
+        season: int,
+        gamecode: int,
+        datasets: Optional[List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Collects the datasets of a single game.
+
+        Args:
+            season (int): The start year of the season
+            gamecode (int): The game-code of the game of interest.
+                It can be found on Euroleague's website.
+            datasets (List[str], optional): The datasets to collect.
+                Defaults to None, i.e. all datasets.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The dataframes of the game keyed by
+                dataset.
+        """
+        data: Dict[str, pd.DataFrame] = {}
+        for fun in self.get_game_requests(datasets):
+            data.update(fun(season, gamecode))
+        return data
+
+    def harvest_games(
+        self,
+        game_codes_df: pd.DataFrame,
+        season: int,
+        datasets: Optional[List[str]] = None,
+        max_workers: int = 1
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Collects the datasets of a collection of games. Every request of
+        every game is a separate task of the worker pool, and a failed
+        request only drops its own datasets of that game.
+
+        Args:
+            game_codes_df (pd.DataFrame): A dataframe of the game codes to
+                collect
+
+            season (int): The start year of the season
+
+            datasets (List[str], optional): The datasets to collect.
+                Defaults to None, i.e. all datasets.
+
+            max_workers (int, optional): The maximum number of requests
+                sent concurrently. Defaults to 1.
+
+        Returns:
+            Dict[str, pd.DataFrame]: A dataframe per dataset with the data of
+                all games in the collection.
+        """
+        game_requests = self.get_game_requests(datasets)
+        tasks = [
+            (row, fun)
+            for _, row in game_codes_df.iterrows()
+            for fun in game_requests
+        ]
+        results = map_with_workers(
+            lambda task: get_game_datasets_from_row(task[0], season, task[1]),
+            tasks,
+            max_workers=max_workers,
+            desc=f"Season {season}"
+        )
+        return concat_game_datasets(results)
+
+    def harvest_round(
+        self,
+        season: int,
+        round_number: int,
+        datasets: Optional[List[str]] = None,
+        max_workers: int = 1
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Collects the datasets of all games in a single round.
+
+        Args:
+            season (int): The start year of the season
+
+            round_number (int): The number of the round
+
+            datasets (List[str], optional): The datasets to collect.
+                Defaults to None, i.e. all datasets.
+
+            max_workers (int, optional): The maximum number of requests
+                sent concurrently. Defaults to 1.
+
+        Returns:
+            Dict[str, pd.DataFrame]: A dataframe per dataset with the data of
+                all games in the round.
+        """
+        game_codes_df = self.get_gamecodes_round(season, round_number)
+        game_codes_df = game_codes_df[game_codes_df["played"]]
+        return self.harvest_games(
+            game_codes_df, season, datasets, max_workers=max_workers)
+
+    def harvest_season(
+        self,
+        season: int,
+        datasets: Optional[List[str]] = None,
+        max_workers: int = 1
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Collects the datasets of all games in a single season, with one
+        schedule request and one concurrent sweep over the games.
+
+        Args:
+            season (int): The start year of the season
+
+            datasets (List[str], optional): The datasets to collect.
+                Defaults to None, i.e. all datasets.
+
+            max_workers (int, optional): The maximum number of requests
+                sent concurrently. Defaults to 1.
+
+        Returns:
+            Dict[str, pd.DataFrame]: A dataframe per dataset with the data of
+                all games in the season.
+        """
+        game_codes_df = self.get_gamecodes_season(season)
+        season_game_codes_df = self.select_season_game_codes(game_codes_df)
+        return self.harvest_games(
+            season_game_codes_df, season, datasets, max_workers=max_workers)
+
+    def harvest_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        datasets: Optional[List[str]] = None,
+        max_workers: int = 1
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Collects the datasets of all games in a range of seasons.
+
+        Args:
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            datasets (List[str], optional): The datasets to collect.
+                Defaults to None, i.e. all datasets.
+
+            max_workers (int, optional): The maximum number of requests
+                sent concurrently. Defaults to 1.
+
+        Returns:
+            Dict[str, pd.DataFrame]: A dataframe per dataset with the data of
+                all games in the range of seasons.
+        """
+        data: Dict[str, List[pd.DataFrame]] = {}
+        for season in progress_range(
+                start_season, end_season + 1, desc="Season loop", leave=True):
+            season_data = self.harvest_season(
+                season, datasets, max_workers=max_workers)
+            for name, df in season_data.items():
+                data.setdefault(name, []).append(df)
+        return {
+            name: concat_frames(dfs).reset_index(drop=True)
+            for name, dfs in data.items()
+        }
+
+    def harvest_range_seasons_to_csv(
+        self,
+        start_season: int,
+        end_season: int,
+        directory: str,
+        datasets: Optional[List[str]] = None,
+        max_workers: int = 1
+    ) -> List[str]:
+        """
+        Collects the datasets of all games in a range of seasons and writes
+        each season to disk as soon as it is collected, so that only one
+        season is held in memory. The files are named
+        `<directory>/<dataset>/<season>.csv`.
+
+        Args:
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            directory (str): The output directory. Created if it does not
+                exist.
+
+            datasets (List[str], optional): The datasets to collect.
+                Defaults to None, i.e. all datasets.
+
+            max_workers (int, optional): The maximum number of requests
+                sent concurrently. Defaults to 1.
+
+        Returns:
+            List[str]: The paths of the written files.
+        """
+        paths = []
+        for season in progress_range(
+                start_season, end_season + 1, desc="Season loop", leave=True):
+            season_data = self.harvest_season(
+                season, datasets, max_workers=max_workers)
+            for name, df in season_data.items():
+                os.makedirs(os.path.join(directory, name), exist_ok=True)
+                path = os.path.join(directory, name, f"{season}.csv")
+                df.to_csv(path, index=False)
+                paths.append(path)
+            logger.info("Season %s written to %s.", season, directory)
+        return paths
+
+
+def as_dataset_request(
+    name: str,
+    fun: Callable[[int, int], pd.DataFrame]
+) -> Callable[[int, int], Dict[str, pd.DataFrame]]:
+    """
+    Wraps a function that returns a single dataframe of a game, so that it
+    returns it keyed by its dataset name.
+
+    Args:
+        name (str): The name of the dataset.
+        fun (Callable[[int, int], pd.DataFrame]): A function of the season
+            and the game code.
+
+    Returns:
+        Callable[[int, int], Dict[str, pd.DataFrame]]: The wrapped function.
+    """
+    def get_dataset(season: int, gamecode: int) -> Dict[str, pd.DataFrame]:
+        return {name: fun(season, gamecode)}
+    return get_dataset
@@ -0,0 +1,519 @@
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+from collections import deque
+import hashlib
+import threading
+import logging
+import numpy as np
+import pandas as pd
+from .events import emit
+
+logger = logging.getLogger(__name__)
+
+LINEUP_FORMATS = ["list", "id", "columns"]
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+
+def reconstruct_lineups(
+    playtypes: np.ndarray,
+    teams: np.ndarray,
+    players: np.ndarray,
+    markertimes: np.ndarray,
+    labels: np.ndarray,
+    home_team: str,
+    starting_five_home: List[str],
+    starting_five_away: List[str],
+    gamecode: Any = None,
+    season: Any = None
+) -> Tuple[List[List[str]], List[List[str]]]:
+    """
+    Reconstructs the on-court lineups of both teams at every play of a game,
+    in a single pass over the plays.
+
+    Every unprocessed substitution (`IN` or `OUT`) is paired with the first
+    subsequent unprocessed substitution of the opposite type, as in
+    the original algorithm of `get_pbp_lineups`. The unpaired substitutions
+    of each type are kept in a queue of positions, and the queue heads that
+    are behind the current play or already paired are dropped, hence each
+    play is visited a constant number of times.
+
+    Args:
+        playtypes (np.ndarray): The `PLAYTYPE` of each play.
+        teams (np.ndarray): The `CODETEAM` of each play.
+        players (np.ndarray): The `PLAYER` of each play.
+        markertimes (np.ndarray): The `MARKERTIME` of each play.
+        labels (np.ndarray): The index label of each play, for logging.
+        home_team (str): The code of the home team.
+        starting_five_home (List[str]): The starting lineup of the home team.
+        starting_five_away (List[str]): The starting lineup of the away team.
+        gamecode (Any, optional): The game code, for logging.
+            Defaults to None.
+        season (Any, optional): The season, for logging. Defaults to None.
+
+    Returns:
+        Tuple[List[List[str]], List[List[str]]]: The home and away lineup
+            after each play. Consecutive plays with the same lineup share the
+            same list object.
+    """
+    n = len(playtypes)
+    queues: Dict[str, Deque[int]] = {"IN": deque(), "OUT": deque()}
+    for pos in range(n):
+        if playtypes[pos] in queues:
+            queues[playtypes[pos]].append(pos)
+    processed = np.zeros(n, dtype=bool)
+
+    five_home = list(starting_five_home)
+    five_away = list(starting_five_away)
+    lineups_home: List[List[str]] = [five_home] * n
+    lineups_away: List[List[str]] = [five_away] * n
+    for pos in range(n):
+        team = teams[pos]
+        playtype = playtypes[pos]
+        if team != "":
+            if playtype in queues and not processed[pos]:
+                is_home = home_team == team
+                five = five_home if is_home else five_away
+                opp_queue = queues["OUT" if playtype == "IN" else "IN"]
+                while opp_queue and (
+                        opp_queue[0] <= pos or processed[opp_queue[0]]):
+                    opp_queue.popleft()
+                if not opp_queue:
+                    logger.warning(
+                        "No potential matching subs found for gamecode %s "
+                        "and season %s", gamecode, season
+                    )
+                    emit("unmatched_substitution", season=season,
+                         gamecode=gamecode, index=labels[pos])
+                else:
+                    match = opp_queue.popleft()
+                    processed[pos] = True
+                    processed[match] = True
+                    five = substitute(
+                        five, pos, match, playtypes, teams, players,
+                        markertimes, labels, gamecode, season)
+                if is_home:
+                    five_home = five
+                else:
+                    five_away = five
+        lineups_home[pos] = five_home
+        lineups_away[pos] = five_away
+    return lineups_home, lineups_away
+
+
+def substitute(
+    five: List[str],
+    pos: int,
+    match: int,
+    playtypes: np.ndarray,
+    teams: np.ndarray,
+    players: np.ndarray,
+    markertimes: np.ndarray,
+    labels: np.ndarray,
+    gamecode: Any,
+    season: Any
+) -> List[str]:
+    """
+    Applies a pair of substitutions to a lineup.
+
+    Args:
+        five (List[str]): The lineup before the substitution.
+        pos (int): The position of the substitution.
+        match (int): The position of the matching substitution.
+        playtypes (np.ndarray): The `PLAYTYPE` of each play.
+        teams (np.ndarray): The `CODETEAM` of each play.
+        players (np.ndarray): The `PLAYER` of each play.
+        markertimes (np.ndarray): The `MARKERTIME` of each play.
+        labels (np.ndarray): The index label of each play, for logging.
+        gamecode (Any): The game code, for logging.
+        season (Any): The season, for logging.
+
+    Returns:
+        List[str]: A new list with the lineup after the substitution, or
+            `five` itself if the substitution is not applicable.
+    """
+    if (teams[match] != teams[pos]) or (
+            markertimes[match] != markertimes[pos]):
+        logger.warning(
+            "Something went wrong for gamecode %s at sub index %s with "
+            "matching sub index %s", gamecode, labels[pos], labels[match]
+        )
+        emit("mismatched_substitution", season=season, gamecode=gamecode,
+             index=labels[pos], match_index=labels[match])
+    if playtypes[pos] == "IN":
+        player_in, player_out = players[pos], players[match]
+    else:
+        player_in, player_out = players[match], players[pos]
+    if player_in == player_out:
+        # there are instance where the same player is subbed in and out
+        return five
+    elif player_out not in five:
+        logger.warning(
+            "Player %s not found in current lineup, %s, for gamecode %s and "
+            "season %s.", player_out, five, gamecode, season
+        )
+        emit("player_not_in_lineup", season=season, gamecode=gamecode,
+             player=player_out)
+        return five
+    pindx = five.index(player_out)
+    return five[:pindx] + [player_in] + five[pindx + 1:]
+
+
+def validate_on_court_players(
+    players: np.ndarray,
+    playtypes: np.ndarray,
+    lineups_home: List[List[str]],
+    lineups_away: List[List[str]]
+) -> np.ndarray:
+    """
+    Validates that the player of every play is on court, i.e. in the lineup
+    of either team. The plays without a player and the `OUT` substitutions
+    are valid.
+
+    Consecutive plays share the same lineup object, see
+    `reconstruct_lineups`, so the players of each lineup are put in a set
+    once and every play is a single lookup.
+
+    Args:
+        players (np.ndarray): The `PLAYER` of each play.
+        playtypes (np.ndarray): The `PLAYTYPE` of each play.
+        lineups_home (List[List[str]]): The home lineup of each play.
+        lineups_away (List[List[str]]): The away lineup of each play.
+
+    Returns:
+        np.ndarray: A boolean array, True if the play is valid.
+    """
+    players = np.asarray(players, dtype=object)
+    exempt = (players == None) | (  # noqa: E711
+        np.asarray(playtypes, dtype=object) == "OUT")
+    on_court = np.zeros(len(players), dtype=bool)
+    # the lineups are alive during the loop, so their ids are not reused
+    members: Dict[int, set] = {}
+    for pos, (player, home, away) in enumerate(
+            zip(players, lineups_home, lineups_away)):
+        for five in (home, away):
+            key = id(five)
+            if key not in members:
+                members[key] = set(five)
+            if player in members[key]:
+                on_court[pos] = True
+                break
+    return exempt | on_court
+
+
+def get_starting_fives(
+    homes: np.ndarray,
+    teams: np.ndarray,
+    players: np.ndarray,
+    is_starter: np.ndarray
+) -> Tuple[Any, Any, List[Any], List[Any]]:
+    """
+    Finds the home and away teams of the boxscore of a game and their
+    starting lineups, in a single pass over its rows. A team with fewer
+    starters than the other is padded with NaN, as the pivoted table of
+    starters the lineups were first taken from.
+
+    Args:
+        homes (np.ndarray): The `Home` flag of each row, 1 for the home
+            team and 0 for the away team.
+        teams (np.ndarray): The `Team` of each row.
+        players (np.ndarray): The `Player` of each row.
+        is_starter (np.ndarray): A boolean array, True if the player of the
+            row is a starter.
+
+    Raises:
+        IndexError: If the boxscore has no home or no away team.
+        KeyError: If the home or the away team has no starter.
+
+    Returns:
+        Tuple[Any, Any, List[Any], List[Any]]: The home team, the away team
+            and their starting lineups.
+    """
+    home_team = teams[homes == 1][0]
+    away_team = teams[homes == 0][0]
+    fives: Dict[Any, List[Any]] = {}
+    for team, player in zip(teams[is_starter], players[is_starter]):
+        fives.setdefault(team, []).append(player)
+    five_home = fives[home_team]
+    five_away = fives[away_team]
+    size = max(len(five) for five in fives.values())
+    return (
+        home_team,
+        away_team,
+        five_home + [np.nan] * (size - len(five_home)),
+        five_away + [np.nan] * (size - len(five_away)),
+    )
+
+
+def fit_lineup(five: Iterable[Any]) -> List[Optional[str]]:
+    """
+    Sorts the players of a lineup by name and fits them in five slots, i.e.
+    pads a lineup of fewer players with None and truncates a lineup of more
+    players, e.g. after a missed substitution, with a warning.
+
+    Args:
+        five (Iterable[Any]): The players of the lineup.
+
+    Returns:
+        List[Optional[str]]: The five sorted players.
+    """
+    players: List[Optional[str]] = []
+    players.extend(sorted(str(p) for p in five))
+    if len(players) > 5:
+        logger.warning(
+            "Lineup %s has %d players, only the first five are kept.",
+            players, len(players)
+        )
+        emit("oversized_lineup", players=players)
+    return (players + [None] * 5)[:5]
+
+
+class LineupRegistry:
+    """
+    An interning table of lineups. Each lineup, i.e. a set of five players,
+    gets a 63-bit integer id, which is derived from the sorted player names,
+    so that the same lineup has the same id in every game, season and
+    registry. The registry keeps the players of every id it has seen, so
+    that the ids can be mapped back to players.
+    """
+
+    def __init__(self):
+        self.lineups: Dict[int, Tuple[str, ...]] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_id(five: List[str]) -> int:
+        """
+        Makes the id of a lineup.
+
+        Args:
+            five (List[str]): The players of the lineup, in any order.
+
+        Returns:
+            int: The id of the lineup.
+        """
+        key = "\x1f".join(sorted(str(p) for p in five)).encode()
+        digest = hashlib.blake2b(key, digest_size=8).digest()
+        return int.from_bytes(digest, "big") >> 1
+
+    def intern(self, five: List[str]) -> int:
+        """
+        Returns the id of a lineup and records its players.
+
+        Args:
+            five (List[str]): The players of the lineup, in any order.
+
+        Returns:
+            int: The id of the lineup.
+        """
+        lineup_id = self.make_id(five)
+        if lineup_id not in self.lineups:
+            with self.lock:
+                self.lineups[lineup_id] = tuple(sorted(str(p) for p in five))
+        return lineup_id
+
+    def encode(self, lineups: List[List[str]]) -> np.ndarray:
+        """
+        Encodes the lineup of every play as its id. Consecutive plays that
+        share the same list object are only hashed once.
+
+        Args:
+            lineups (List[List[str]]): The lineup of every play.
+
+        Returns:
+            np.ndarray: The int64 lineup id of every play.
+        """
+        ids = np.empty(len(lineups), dtype=np.int64)
+        last: Optional[List[str]] = None
+        last_id = 0
+        for pos, five in enumerate(lineups):
+            if five is not last:
+                last, last_id = five, self.intern(five)
+            ids[pos] = last_id
+        return ids
+
+    def to_frame(
+        self,
+        lineup_ids: Optional[Iterable[int]] = None
+    ) -> pd.DataFrame:
+        """
+        Returns the lineup dictionary table.
+
+        Args:
+            lineup_ids (Iterable[int], optional): The ids of the lineups to
+                include. Defaults to None, i.e. all lineups.
+
+        Returns:
+            pd.DataFrame: A dataframe with the `LineupID` and the sorted
+                `Player_1` to `Player_5` of every lineup. The lineups of
+                fewer or more than five players are fitted as in
+                `fit_lineup`.
+        """
+        with self.lock:
+            if lineup_ids is None:
+                items = list(self.lineups.items())
+            else:
+                items = [(i, self.lineups[i]) for i in lineup_ids]
+        df = pd.DataFrame(
+            [fit_lineup(players) for _, players in items],
+            columns=[f"Player_{i + 1}" for i in range(5)],
+            dtype=object
+        )
+        df.insert(0, "LineupID", np.array(
+            [lineup_id for lineup_id, _ in items], dtype=np.int64))
+        return df
+
+
+def get_default_registry() -> LineupRegistry:
+    """
+    Returns the lineup registry shared by all calls that were not given a
+    registry explicitly. It is created on first use.
+
+    Returns:
+        LineupRegistry: The shared registry.
+    """
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = LineupRegistry()
+    return _default_registry
+
+
+def make_lineup_columns(
+    lineups: List[List[str]],
+    prefix: str
+) -> pd.DataFrame:
+    """
+    Splits the lineup of every play into five fixed-width categorical player
+    columns, e.g. `Lineup_A_1` to `Lineup_A_5`, with the players sorted by
+    name, so that equal lineups have equal rows. The lineups of fewer or
+    more than five players are fitted as in `fit_lineup`.
+
+    Args:
+        lineups (List[List[str]]): The lineup of every play.
+        prefix (str): The prefix of the columns, e.g. "Lineup_A".
+
+    Returns:
+        pd.DataFrame: A dataframe with the five player columns.
+    """
+    cache: Dict[int, List[Optional[str]]] = {}
+    rows = []
+    for five in lineups:
+        key = id(five)
+        if key not in cache:
+            cache[key] = fit_lineup(five)
+        rows.append(cache[key])
+    df = pd.DataFrame(
+        rows, columns=[f"{prefix}_{i + 1}" for i in range(5)], dtype=object)
+    return df.astype("category")
+
+
+POINTS = {"2FGM": 2, "3FGM": 3, "FTM": 1}
+FIELD_GOAL_ATTEMPTS = ["2FGM", "2FGA", "3FGM", "3FGA"]
+FREE_THROW_ATTEMPTS = ["FTM", "FTA"]
+
+
+def make_stints(
+    pbp_df: pd.DataFrame,
+    registry: Optional[LineupRegistry] = None
+) -> pd.DataFrame:
+    """
+    Makes the stint table of play-by-play data with lineups, i.e. one row
+    per contiguous run of plays with the same ten players on court. The
+    data may contain several games, e.g. a whole season.
+
+    The possessions are estimated per team as
+    `FGA + 0.44 * FTA - offensive rebounds + turnovers`.
+
+    Args:
+        pbp_df (pd.DataFrame): The play-by-play data with lineups, as
+            returned by `get_game_pbp_data_lineups` with the "list" or "id"
+            lineup format.
+        registry (LineupRegistry, optional): The registry of the lineup ids,
+            used for the "list" lineup format. Defaults to None, i.e. the
+            default registry.
+
+    Raises:
+        ValueError: If the data have no `Lineup_A` and `Lineup_B` columns.
+
+    Returns:
+        pd.DataFrame: A dataframe with the season, the game code, the stint
+            number, the first and last `PERIOD`, `MARKERTIME` and
+            `TRUE_NUMBEROFPLAY`, the home and away lineup ids (`Lineup_A`,
+            `Lineup_B`), the number of plays and the points and possessions
+            of the home (`_A`) and away (`_B`) teams during each stint.
+    """
+    if not {"Lineup_A", "Lineup_B"}.issubset(pbp_df.columns):
+        raise ValueError(
+            "The play-by-play data have no Lineup_A and Lineup_B columns. "
+            "Use the 'list' or 'id' lineup format."
+        )
+    if pbp_df.empty:
+        return pd.DataFrame()
+    if registry is None:
+        registry = get_default_registry()
+
+    lineup_cols = {}
+    for col in ["Lineup_A", "Lineup_B"]:
+        lineups = pbp_df[col]
+        lineup_cols[col] = (
+            registry.encode(lineups.tolist()) if lineups.dtype == object
+            else lineups.to_numpy(dtype=np.int64)
+        )
+    keys = np.column_stack([
+        pbp_df["Season"].to_numpy(dtype=np.int64),
+        pbp_df["Gamecode"].to_numpy(dtype=np.int64),
+        lineup_cols["Lineup_A"],
+        lineup_cols["Lineup_B"],
+    ])
+    changed = np.ones(len(keys), dtype=bool)
+    changed[1:] = (keys[1:] != keys[:-1]).any(axis=1)
+    stint = np.cumsum(changed)
+
+    playtype = pbp_df["PLAYTYPE"].astype(object)
+    is_home_team = pbp_df["IsHomeTeam"].astype(object)
+    is_home = (is_home_team == True).to_numpy()  # noqa: E712
+    is_away = (is_home_team == False).to_numpy()  # noqa: E712
+    points = playtype.map(POINTS).fillna(0).to_numpy(dtype=np.int64)
+    possessions = (
+        playtype.isin(FIELD_GOAL_ATTEMPTS).to_numpy() +
+        0.44 * playtype.isin(FREE_THROW_ATTEMPTS).to_numpy() -
+        (playtype == "O").to_numpy() +
+        (playtype == "TO").to_numpy()
+    )
+    df = pd.DataFrame({
+        "Season": pbp_df["Season"].to_numpy(),
+        "Gamecode": pbp_df["Gamecode"].to_numpy(),
+        "Stint": stint,
+        "PERIOD": pbp_df["PERIOD"].to_numpy(),
+        "MARKERTIME": pbp_df["MARKERTIME"].to_numpy(),
+        "TRUE_NUMBEROFPLAY": pbp_df["TRUE_NUMBEROFPLAY"].to_numpy(),
+        "Lineup_A": lineup_cols["Lineup_A"],
+        "Lineup_B": lineup_cols["Lineup_B"],
+        "POINTS_A": points * is_home,
+        "POINTS_B": points * is_away,
+        "POSSESSIONS_A": possessions * is_home,
+        "POSSESSIONS_B": possessions * is_away,
+    })
+    stints_df = df.groupby("Stint", sort=False).agg(
+        Season=("Season", "first"),
+        Gamecode=("Gamecode", "first"),
+        PERIOD_START=("PERIOD", "first"),
+        PERIOD_END=("PERIOD", "last"),
+        MARKERTIME_START=("MARKERTIME", "first"),
+        MARKERTIME_END=("MARKERTIME", "last"),
+        TRUE_NUMBEROFPLAY_START=("TRUE_NUMBEROFPLAY", "first"),
+        TRUE_NUMBEROFPLAY_END=("TRUE_NUMBEROFPLAY", "last"),
+        Lineup_A=("Lineup_A", "first"),
+        Lineup_B=("Lineup_B", "first"),
+        PLAYS=("Stint", "size"),
+        POINTS_A=("POINTS_A", "sum"),
+        POINTS_B=("POINTS_B", "sum"),
+        POSSESSIONS_A=("POSSESSIONS_A", "sum"),
+        POSSESSIONS_B=("POSSESSIONS_B", "sum"),
+    ).reset_index()
+    # number the stints within each game
+    stints_df["Stint"] = stints_df.groupby(
+        ["Season", "Gamecode"]).cumcount() + 1
+    stints_df = stints_df[["Season", "Gamecode"] + [
+        c for c in stints_df.columns if c not in ["Season", "Gamecode"]]]
+    return stints_df
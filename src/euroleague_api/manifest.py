@@ -0,0 +1,157 @@
+from typing import Dict
+import os
+import time
+import hashlib
+import sqlite3
+import threading
+import logging
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_COLS = ["Phase", "Round", "played", "homescore", "awayscore"]
+
+
+def make_game_fingerprints(game_codes_df: pd.DataFrame) -> pd.Series:
+    """
+    Makes a fingerprint of each game of the game codes dataframe, from the
+    fields that change when the data of a game change, e.g. its score.
+
+    Args:
+        game_codes_df (pd.DataFrame): The game codes dataframe, as returned
+            by `get_gamecodes_season`.
+
+    Returns:
+        pd.Series: The fingerprint of each game, with the index of
+            `game_codes_df`.
+    """
+    cols = [c for c in FINGERPRINT_COLS if c in game_codes_df.columns]
+    return game_codes_df[cols].astype(str).agg("|".join, axis=1).map(
+        lambda key: hashlib.sha1(key.encode()).hexdigest()[:16]
+    )
+
+
+class SyncManifest:
+    """
+    A persistent record of the games already collected, keyed by
+    (competition, season, gamecode, dataset), so that an incremental sync
+    only fetches the games that are new or have changed since they were
+    collected. It is stored in an sqlite file.
+
+    Args:
+        path (str): The path of the manifest file. Created if it does not
+            exist.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS fetched ("
+                "competition TEXT, season INTEGER, gamecode INTEGER, "
+                "dataset TEXT, fingerprint TEXT, fetched REAL, "
+                "PRIMARY KEY (competition, season, gamecode, dataset))"
+            )
+
+    def get_fetched(
+        self,
+        competition: str,
+        season: int,
+        dataset: str
+    ) -> Dict[int, str]:
+        """
+        Returns the games of a season already collected for a dataset.
+
+        Args:
+
+            competition (str): The competition code.
+
+            season (int): The start year of the season.
+
+            dataset (str): The name of the dataset, e.g. "shots".
+
+        Returns:
+
+            Dict[int, str]: The fingerprint of each collected game code.
+        """
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT gamecode, fingerprint FROM fetched "
+                "WHERE competition = ? AND season = ? AND dataset = ?",
+                (competition, season, dataset)
+            ).fetchall()
+        return dict(rows)
+
+    def record(
+        self,
+        competition: str,
+        season: int,
+        gamecode: int,
+        dataset: str,
+        fingerprint: str
+    ) -> None:
+        """
+        Records that a game has been collected for a dataset.
+
+        Args:
+
+            competition (str): The competition code.
+
+            season (int): The start year of the season.
+
+            gamecode (int): The game code.
+
+            dataset (str): The name of the dataset, e.g. "shots".
+
+            fingerprint (str): The fingerprint of the game when it was
+                collected.
+        """
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO fetched VALUES (?, ?, ?, ?, ?, ?)",
+                (competition, season, int(gamecode), dataset, fingerprint,
+                 time.time())
+            )
+
+    def select_pending_games(
+        self,
+        competition: str,
+        season: int,
+        dataset: str,
+        game_codes_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Selects the games that have not been collected for a dataset, or
+        that have changed since they were collected.
+
+        Args:
+
+            competition (str): The competition code.
+
+            season (int): The start year of the season.
+
+            dataset (str): The name of the dataset, e.g. "shots".
+
+            game_codes_df (pd.DataFrame): The candidate games with a
+                `fingerprint` column.
+
+        Returns:
+
+            pd.DataFrame: The rows of `game_codes_df` to collect.
+        """
+        fetched = self.get_fetched(competition, season, dataset)
+        stored = game_codes_df["gameCode"].map(fetched)
+        pending_df = game_codes_df[stored != game_codes_df["fingerprint"]]
+        logger.info(
+            "%d of %d games of season %s are pending for dataset %s.",
+            len(pending_df), len(game_codes_df), season, dataset
+        )
+        return pending_df
+
+    def __repr__(self):
+        return f"SyncManifest({self.path!r})"
@@ -1,10 +1,27 @@
+from typing import Callable, Iterator, Optional
 import logging
 from json.decoder import JSONDecodeError
 import pandas as pd
 import numpy as np
-from .EuroLeagueData import EuroLeagueData
-from .boxscore_data import BoxScoreData
-from .utils import get_requests, get_pbp_lineups
+from .EuroLeagueData import EuroLeagueData, AsyncEuroLeagueData
+from .boxscore_data import BoxScoreData, AsyncBoxScoreData
+from .utils import (
+    get_requests,
+    get_requests_async,
+    get_pbp_lineups,
+    get_game_pbp_lineups,
+    get_game_data_from_row,
+    map_with_workers,
+    map_with_processes,
+    format_lineups,
+    concat_game_data,
+    raise_error,
+    progress_range
+)
+from .events import emit
+from .decoding import decode_json, make_records_df, strip, clean_name
+from .lineups import LineupRegistry, LINEUP_FORMATS, make_stints
+from .schemas import concat_frames
 
 logger = logging.getLogger(__name__)
 
@@ -47,48 +64,94 @@ class PlayByPlay(EuroLeagueData):
 
             pd.DataFrame: A dataframe with the play-by-play data of the game.
         """
-        url = "https://live.euroleague.net/api/PlaybyPlay"
-        params = {
-            "gamecode": gamecode,
-            "seasoncode": f"{self.competition}{season}"
-        }
-        r = get_requests(url, params=params)
+        data = self.get_play_by_play_payload(season, gamecode)
+        df = self.make_play_by_play_df(
+            data, season, gamecode, include_ishometeam)
+        return self.apply_schema(df, "play_by_play")
+
+    def get_play_by_play_payload(self, season: int, gamecode: int) -> dict:
+        """
+        Gets the raw payload of the PlaybyPlay endpoint of a game.
+
+        Args:
+
+            season (int): The start year of the season
+
+            gamecode (int): The game-code of the game of interest.
+                It can be found on Euroleague's website.
+
+        Returns:
+
+            dict: The decoded JSON data of the endpoint.
+        """
+        url = self.make_live_game_url("PlaybyPlay")
+        params = self.make_live_game_params(season, gamecode)
+        r = get_requests(url, params=params, transport=self.transport)
         try:
-            data = r.json()
+            data = decode_json(r)
         except JSONDecodeError as exc:
             logger.error(
-                f"Game code, {gamecode}, season {season}, "
-                "did not return valid JSON data."
+                "Game code, %s, season %s, did not return valid JSON data.",
+                gamecode, season
             )
             raise exc
+        return data
+
+    @staticmethod
+    def make_play_by_play_df(
+        data: dict,
+        season: int,
+        gamecode: int,
+        include_ishometeam: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Makes the play-by-play dataframe of a game from the JSON response of
+        the PlaybyPlay endpoint.
+
+        Args:
+
+            data (dict): The decoded JSON response.
+
+            season (int): The start year of the season
 
+            gamecode (int): The game-code of the game of interest.
+
+            include_ishometeam (bool, optional): A bool indicator whether to
+                include the `IsHomeTeam` column. Defaults to False.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the play-by-play data of the game.
+        """
         periods = [
             'FirstQuarter', 'SecondQuarter', 'ThirdQuarter', 'ForthQuarter',
             'ExtraTime'
         ]
-        all_data = []
+        plays = []
+        period_numbers = []
         for p, period in enumerate(periods):
             if data[period]:
-                df = pd.json_normalize(data[period])
-                df["PERIOD"] = p + 1
-                all_data.append(df)
+                plays.extend(data[period])
+                period_numbers.extend([p + 1] * len(data[period]))
 
-        if not all_data:
+        if not plays:
             logger.warning(
-                f"No play-by-play data found for gamecode {gamecode} "
-                f" and season {season}"
+                "No play-by-play data found for gamecode %s and season %s",
+                gamecode, season
             )
             return pd.DataFrame()
 
-        pbp_df = pd.concat(all_data).reset_index(drop=True)
-        pbp_df["PLAYER"] = (
-            pbp_df["PLAYER"].str.replace("  ", " ")
-            .str.replace(" , ", ", ").str.strip()
+        pbp_df = make_records_df(
+            plays,
+            columns={"PERIOD": period_numbers},
+            converters={
+                "PLAYER": clean_name,
+                "CODETEAM": strip,
+                "PLAYER_ID": strip,
+                "PLAYTYPE": strip,
+                "MARKERTIME": strip,
+            }
         )
-        pbp_df['CODETEAM'] = pbp_df['CODETEAM'].str.strip()
-        pbp_df['PLAYER_ID'] = pbp_df['PLAYER_ID'].str.strip()
-        pbp_df["PLAYTYPE"] = pbp_df["PLAYTYPE"].str.strip()
-        pbp_df["MARKERTIME"] = pbp_df["MARKERTIME"].str.strip()
         if include_ishometeam:  # for backward compatibility
             home_team = data["CodeTeamA"]
             away_team = data["CodeTeamB"]
@@ -108,7 +171,8 @@ class PlayByPlay(EuroLeagueData):
     def get_game_play_by_play_data_round(
         self,
         season: int,
-        round_number: int
+        round_number: int,
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the play-by-play data of *all* games in a single
@@ -117,18 +181,22 @@ class PlayByPlay(EuroLeagueData):
         Args:
             season (int): The start year of the season
             round_number (int): The round of the season
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
 
         Returns:
             pd.DataFrame: A dataframe with the play-by-play data of all games
                 in a single round_number
         """
         df = self.get_round_data_from_game_data(
-            season, round_number, self.get_game_play_by_play_data)
+            season, round_number, self.get_game_play_by_play_data,
+            max_workers=max_workers)
         return df
 
     def get_game_play_by_play_data_single_season(
         self,
-        season: int
+        season: int,
+        max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the play-by-play data of *all* games in a single
@@ -138,17 +206,21 @@ class PlayByPlay(EuroLeagueData):
 
             season (int): The start year of the season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with the play-by-play data of all games
                 in a single season
         """
         data_df = self.get_season_data_from_game_data(
-            season, self.get_game_play_by_play_data)
+            season, self.get_game_play_by_play_data,
+            max_workers=max_workers)
         return data_df
 
     def get_game_play_by_play_data_range_seasons(
-        self, start_season: int, end_season: int
+        self, start_season: int, end_season: int, max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the play-by-play data of *all* games in a range of
@@ -160,20 +232,73 @@ class PlayByPlay(EuroLeagueData):
 
             end_season (int): The start year of the end season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with the play-by-play data of all games
                 in range of seasons
         """
         df = self.get_range_seasons_data(
-            start_season, end_season, self.get_game_play_by_play_data)
+            start_season, end_season, self.get_game_play_by_play_data,
+            max_workers=max_workers)
         return df
 
+    def iter_game_play_by_play_data_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of
+        `get_game_play_by_play_data_single_season`. It yields the play-by-play
+        data of each game as soon as it is collected.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_season_data_from_game_data(
+            season, self.get_game_play_by_play_data, max_workers=max_workers)
+
+    def iter_game_play_by_play_data_range_seasons(
+        self, start_season: int, end_season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of
+        `get_game_play_by_play_data_range_seasons`. It yields the play-by-play
+        data of each game as soon as it is collected.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_range_seasons_data(
+            start_season, end_season, self.get_game_play_by_play_data,
+            max_workers=max_workers)
+
     def get_game_pbp_data_lineups(
         self,
         season,
         gamecode,
-        validate=True
+        validate=True,
+        lineup_format: str = "list",
+        registry: Optional[LineupRegistry] = None
     ) -> pd.DataFrame:
         """
         Get the play-by-play (PBP) data enriched with the teams' lineups for
@@ -216,6 +341,14 @@ class PlayByPlay(EuroLeagueData):
                 dataframe with two extra columns, which validate the validity
                 and consistency of the extracted lineup. Defaults to True.
 
+            lineup_format (str, optional): The representation of the
+                lineups, one of "list", "id" and "columns", see
+                `get_pbp_lineups`. Defaults to "list".
+
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids, when `lineup_format` is "id". Defaults to None, i.e. the
+                default registry.
+
         Returns:
 
             pd.DataFrame: A dataframe with the play-by-play enriched with
@@ -223,33 +356,61 @@ class PlayByPlay(EuroLeagueData):
         """
 
         # Fetch play-by-play data
-        pbp_data = self.get_game_play_by_play_data(
-            season=season, gamecode=gamecode, include_ishometeam=True)
+        pbp_data = self.make_play_by_play_df(
+            self.get_play_by_play_payload(season, gamecode),
+            season, gamecode, include_ishometeam=True)
 
         # Get the starting line-ups from boxscore data
-        boxscoredata = BoxScoreData(competition=self.competition)
+        boxscoredata = BoxScoreData(
+            competition=self.competition, transport=self.transport)
         try:
             game_bxscr_stats = boxscoredata.get_players_boxscore_stats(
                 season=season, gamecode=gamecode)
         except Exception as e:  # noqa: E722
             logger.warning(
-                f"Something went wrong when fetching boxscore data for "
-                f"game {gamecode}, season {season}.\nError message: {e}. "
-                "\nSkip and continue"
+                "Something went wrong when fetching boxscore data for game "
+                "%s, season %s.\nError message: %s. \nSkip and continue",
+                gamecode, season, e
             )
             game_bxscr_stats = pd.DataFrame()
 
         pbp_df = get_pbp_lineups(
             pbp_df=pbp_data,
             boxscore_df=game_bxscr_stats,
-            validate=validate
+            validate=validate,
+            lineup_format=lineup_format,
+            registry=registry
         )
-        return pbp_df
+        return self.apply_schema(pbp_df, "play_by_play")
+
+    def make_pbp_lineups_fun(
+        self,
+        lineup_format: str = "list",
+        registry: Optional[LineupRegistry] = None
+    ) -> Callable[[int, int], pd.DataFrame]:
+        """
+        Makes a function of the season and the game code that gets the
+        play-by-play data with lineups in the given format.
+
+        Args:
+            lineup_format (str, optional): The representation of the
+                lineups. Defaults to "list".
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids. Defaults to None, i.e. the default registry.
+
+        Returns:
+            Callable[[int, int], pd.DataFrame]: The function.
+        """
+        return lambda season, gamecode: self.get_game_pbp_data_lineups(
+            season, gamecode, lineup_format=lineup_format, registry=registry)
 
     def get_game_pbp_data_lineups_round(
         self,
         season: int,
-        round_number: int
+        round_number: int,
+        max_workers: int = 1,
+        lineup_format: str = "list",
+        registry: Optional[LineupRegistry] = None
     ) -> pd.DataFrame:
         """
         A function that gets the play-by-play with lineups data of *all* games
@@ -258,38 +419,190 @@ class PlayByPlay(EuroLeagueData):
         Args:
             season (int): The start year of the season
             round_number (int): The round of the season
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+            lineup_format (str, optional): The representation of the
+                lineups, one of "list", "id" and "columns", see
+                `get_pbp_lineups`. Defaults to "list".
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids, when `lineup_format` is "id". Defaults to None, i.e. the
+                default registry.
 
         Returns:
             pd.DataFrame: A dataframe with the play-by-play data with lineups
                 of all games in a single round
         """
         df = self.get_round_data_from_game_data(
-            season, round_number, self.get_game_pbp_data_lineups)
+            season, round_number,
+            self.make_pbp_lineups_fun(lineup_format, registry),
+            max_workers=max_workers)
         return df
 
+    def get_games_pbp_data_lineups(
+        self,
+        game_codes_df: pd.DataFrame,
+        season: int,
+        max_workers: int = 1,
+        processes: int = 1,
+        validate: bool = True,
+        lineup_format: str = "list",
+        registry: Optional[LineupRegistry] = None
+    ) -> pd.DataFrame:
+        """
+        A function that gets the play-by-play data enriched with team lineups
+        of a collection of games in three stages:
+
+            1. The play-by-play and the boxscore of every game are fetched
+            concurrently, as separate tasks of one pool of worker threads.
+
+            2. The starters of every game are joined from the table of the
+            fetched boxscores.
+
+            3. The lineups are reconstructed across games in a pool of
+            worker processes, since it is CPU bound, and converted to the
+            given representation.
+
+        Args:
+
+            game_codes_df (pd.DataFrame): A dataframe of the game codes to
+                collect
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of requests
+                sent concurrently. Defaults to 1.
+
+            processes (int, optional): The number of worker processes of
+                the lineup reconstruction. Defaults to 1, i.e. in the current
+                process.
+
+            validate (bool, optional): If to validate the on-court players.
+                Defaults to True.
+
+            lineup_format (str, optional): The representation of the
+                lineups, one of "list", "id" and "columns", see
+                `get_pbp_lineups`. Defaults to "list".
+
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids, when `lineup_format` is "id". Defaults to None, i.e. the
+                default registry.
+
+        Raises:
+
+            ValueError: If lineup_format value is not valid.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the play-by-play data with lineups
+                of all games in the collection
+        """
+        raise_error(lineup_format, "Lineup format", LINEUP_FORMATS, False)
+        boxscoredata = BoxScoreData(
+            competition=self.competition, transport=self.transport)
+        game_requests = [
+            lambda season, gamecode: self.make_play_by_play_df(
+                self.get_play_by_play_payload(season, gamecode),
+                season, gamecode, include_ishometeam=True),
+            boxscoredata.get_players_boxscore_stats,
+        ]
+        rows = [row for _, row in game_codes_df.iterrows()]
+        results = map_with_workers(
+            lambda task: get_game_data_from_row(task[0], season, task[1]),
+            [(row, fun) for row in rows for fun in game_requests],
+            max_workers=max_workers,
+            desc=f"Season {season}"
+        )
+        pbp_results = results[0::2]
+        boxscore_df = concat_game_data(results[1::2])
+
+        starters = {}
+        if not boxscore_df.empty:
+            starters_df = boxscore_df.loc[
+                boxscore_df["IsStarter"] == 1,
+                ["Gamecode", "Home", "Team", "Player", "IsStarter"]
+            ]
+            starters = dict(tuple(starters_df.groupby("Gamecode")))
+        games = []
+        for pbp_df in pbp_results:
+            if pbp_df is None:
+                continue
+            gamecode = pbp_df["Gamecode"].iloc[0]
+            if gamecode not in starters:
+                logger.warning(
+                    "Game %s, season %s has no starters in the boxscore "
+                    "data. Skip and continue", gamecode, season
+                )
+                emit("no_starters", season=season, gamecode=gamecode)
+                continue
+            games.append((pbp_df, starters[gamecode], validate))
+
+        lineups_results = map_with_processes(
+            get_game_pbp_lineups,
+            games,
+            processes=processes,
+            desc=f"Lineups {season}"
+        )
+        return concat_game_data([
+            self.apply_schema(
+                format_lineups(df, lineup_format, registry), "play_by_play")
+            for df in lineups_results if df is not None
+        ])
+
     def get_game_pbp_data_lineups_single_season(
         self,
-        season: int
+        season: int,
+        max_workers: int = 1,
+        lineup_format: str = "list",
+        processes: int = 1,
+        registry: Optional[LineupRegistry] = None
     ) -> pd.DataFrame:
         """
         A function that gets the play-by-play data enriched with team lineups
-        of *all* games in a single season
+        of *all* games in a single season, see `get_games_pbp_data_lineups`.
 
         Args:
 
             season (int): The start year of the season
 
+            max_workers (int, optional): The maximum number of requests
+                sent concurrently. Defaults to 1.
+
+            lineup_format (str, optional): The representation of the
+                lineups, one of "list", "id" and "columns", see
+                `get_pbp_lineups`. Defaults to "list".
+
+            processes (int, optional): The number of worker processes of
+                the lineup reconstruction. Defaults to 1.
+
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids, when `lineup_format` is "id". Defaults to None, i.e. the
+                default registry.
+
         Returns:
 
             pd.DataFrame: A dataframe with the play-by-play data of all games
                 in a single season
         """
-        data_df = self.get_season_data_from_game_data(
-            season, self.get_game_pbp_data_lineups)
+        game_codes_df = self.get_gamecodes_season(season)
+        season_game_codes_df = self.select_season_game_codes(game_codes_df)
+        data_df = self.get_games_pbp_data_lineups(
+            season_game_codes_df,
+            season,
+            max_workers=max_workers,
+            processes=processes,
+            lineup_format=lineup_format,
+            registry=registry
+        )
         return data_df
 
     def get_game_pbp_data_lineups_range_seasons(
-        self, start_season: int, end_season: int
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 1,
+        lineup_format: str = "list",
+        processes: int = 1,
+        registry: Optional[LineupRegistry] = None
     ) -> pd.DataFrame:
         """
         A function that gets the play-by-play data enriched with team lineups
@@ -301,11 +614,533 @@ class PlayByPlay(EuroLeagueData):
 
             end_season (int): The start year of the end season
 
+            max_workers (int, optional): The maximum number of requests
+                sent concurrently. Defaults to 1.
+
+            lineup_format (str, optional): The representation of the
+                lineups, one of "list", "id" and "columns", see
+                `get_pbp_lineups`. Defaults to "list".
+
+            processes (int, optional): The number of worker processes of
+                the lineup reconstruction. Defaults to 1.
+
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids, when `lineup_format` is "id". Defaults to None, i.e. the
+                default registry.
+
         Returns:
 
             pd.DataFrame: A dataframe with the play-by-play data of all games
                 in range of seasons
         """
-        df = self.get_range_seasons_data(
-            start_season, end_season, self.get_game_pbp_data_lineups)
+        data = []
+        for season in progress_range(
+                start_season, end_season + 1, desc="Season loop", leave=True):
+            data.append(self.get_game_pbp_data_lineups_single_season(
+                season,
+                max_workers=max_workers,
+                lineup_format=lineup_format,
+                processes=processes,
+                registry=registry
+            ))
+        df = concat_frames(data)
+        df.reset_index(drop=True, inplace=True)
+        return df
+
+    def iter_game_pbp_data_lineups_single_season(
+        self,
+        season: int,
+        max_workers: int = 1,
+        lineup_format: str = "list",
+        registry: Optional[LineupRegistry] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_pbp_data_lineups_single_season`.
+        It yields the play-by-play data enriched with team lineups of each game
+        as soon as it is collected.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+            lineup_format (str, optional): The representation of the
+                lineups, one of "list", "id" and "columns", see
+                `get_pbp_lineups`. Defaults to "list".
+
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids, when `lineup_format` is "id". Defaults to None, i.e. the
+                default registry.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_season_data_from_game_data(
+            season, self.make_pbp_lineups_fun(lineup_format, registry),
+            max_workers=max_workers)
+
+    def iter_game_pbp_data_lineups_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 1,
+        lineup_format: str = "list",
+        registry: Optional[LineupRegistry] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_pbp_data_lineups_range_seasons`.
+        It yields the play-by-play data enriched with team lineups of each game
+        as soon as it is collected.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+            lineup_format (str, optional): The representation of the
+                lineups, one of "list", "id" and "columns", see
+                `get_pbp_lineups`. Defaults to "list".
+
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids, when `lineup_format` is "id". Defaults to None, i.e. the
+                default registry.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_range_seasons_data(
+            start_season, end_season,
+            self.make_pbp_lineups_fun(lineup_format, registry),
+            max_workers=max_workers)
+
+    def get_game_stints(
+        self,
+        season: int,
+        gamecode: int,
+        registry: Optional[LineupRegistry] = None
+    ) -> pd.DataFrame:
+        """
+        Get the stint table of a game, i.e. one row per contiguous run of
+        plays with the same lineups on court, with the points and the
+        estimated possessions of each team. See `make_stints`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            gamecode (int): The game-code of the game of interest.
+                It can be found on Euroleague's website.
+
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids. Defaults to None, i.e. the default registry.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the stints of the game
+        """
+        pbp_df = self.get_game_pbp_data_lineups(
+            season, gamecode, validate=False, lineup_format="id",
+            registry=registry)
+        return make_stints(pbp_df, registry=registry)
+
+    def get_game_stints_single_season(
+        self,
+        season: int,
+        max_workers: int = 1,
+        registry: Optional[LineupRegistry] = None,
+        processes: int = 1
+    ) -> pd.DataFrame:
+        """
+        A function that gets the stint table of *all* games in a single
+        season, from the play-by-play data with lineups of the season, see
+        `get_games_pbp_data_lineups`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of requests
+                sent concurrently. Defaults to 1.
+
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids. Defaults to None, i.e. the default registry.
+
+            processes (int, optional): The number of worker processes of
+                the lineup reconstruction. Defaults to 1.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the stints of all games in a single
+                season
+        """
+        game_codes_df = self.get_gamecodes_season(season)
+        season_game_codes_df = self.select_season_game_codes(game_codes_df)
+        pbp_df = self.get_games_pbp_data_lineups(
+            season_game_codes_df,
+            season,
+            max_workers=max_workers,
+            processes=processes,
+            validate=False,
+            lineup_format="id",
+            registry=registry
+        )
+        return make_stints(pbp_df, registry=registry)
+
+    def get_game_stints_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 1,
+        registry: Optional[LineupRegistry] = None,
+        processes: int = 1
+    ) -> pd.DataFrame:
+        """
+        A function that gets the stint table of *all* games in a range of
+        seasons
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of requests
+                sent concurrently. Defaults to 1.
+
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids. Defaults to None, i.e. the default registry.
+
+            processes (int, optional): The number of worker processes of
+                the lineup reconstruction. Defaults to 1.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the stints of all games in a range
+                of seasons
+        """
+        data = []
+        for season in progress_range(
+                start_season, end_season + 1, desc="Season loop", leave=True):
+            data.append(self.get_game_stints_single_season(
+                season,
+                max_workers=max_workers,
+                registry=registry,
+                processes=processes
+            ))
+        df = concat_frames(data)
+        df.reset_index(drop=True, inplace=True)
+        return df
+
+
+class AsyncPlayByPlay(AsyncEuroLeagueData):
+    """
+    The async counterpart of the `PlayByPlay` class.
+
+    Args:
+        competition (str, optional): The competition code, inherited from the
+            `AsyncEuroLeagueData` class. Choose one of:
+            - 'E' for Euroleague
+            - 'U' for Eurocup
+            Defaults to "E".
+        transport (AsyncHTTPTransport, optional): The async HTTP transport,
+            inherited from the `AsyncEuroLeagueData` class. Defaults to None.
+    """
+
+    async def get_game_play_by_play_data(
+        self,
+        season: int,
+        gamecode: int,
+        include_ishometeam: bool = False,
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `PlayByPlay.get_game_play_by_play_data`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            gamecode (int): The game-code of the game of interest.
+
+            include_ishometeam (bool, optional): A bool indicator whether to
+                include the `IsHomeTeam` column. Defaults to False.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the play-by-play data of the game.
+        """
+        data = await self.get_play_by_play_payload(season, gamecode)
+        df = PlayByPlay.make_play_by_play_df(
+            data, season, gamecode, include_ishometeam)
+        return self.apply_schema(df, "play_by_play")
+
+    async def get_play_by_play_payload(
+        self,
+        season: int,
+        gamecode: int
+    ) -> dict:
+        """
+        The async counterpart of `PlayByPlay.get_play_by_play_payload`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            gamecode (int): The game-code of the game of interest.
+
+        Returns:
+
+            dict: The decoded JSON data of the endpoint.
+        """
+        url = self.make_live_game_url("PlaybyPlay")
+        params = self.make_live_game_params(season, gamecode)
+        r = await get_requests_async(
+            url, params=params, transport=self.transport)
+        try:
+            data = decode_json(r)
+        except JSONDecodeError as exc:
+            logger.error(
+                "Game code, %s, season %s, did not return valid JSON data.",
+                gamecode, season
+            )
+            raise exc
+        return data
+
+    async def get_game_play_by_play_data_round(
+        self,
+        season: int,
+        round_number: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `PlayByPlay` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the play-by-play data
+                of all games in a single round
+        """
+        df = await self.get_round_data_from_game_data(
+            season, round_number, self.get_game_play_by_play_data,
+            max_workers=max_workers)
+        return df
+
+    async def get_game_play_by_play_data_single_season(
+        self,
+        season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `PlayByPlay` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the play-by-play data
+                of all games in a single season
+        """
+        df = await self.get_season_data_from_game_data(
+            season, self.get_game_play_by_play_data, max_workers=max_workers)
+        return df
+
+    async def get_game_play_by_play_data_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `PlayByPlay` method of the same
+        name.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the play-by-play data
+                of all games in a range of seasons
+        """
+        df = await self.get_range_seasons_data(
+            start_season, end_season, self.get_game_play_by_play_data,
+            max_workers=max_workers)
+        return df
+
+    async def get_game_pbp_data_lineups(
+        self,
+        season,
+        gamecode,
+        validate=True,
+        lineup_format: str = "list",
+        registry: Optional[LineupRegistry] = None
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `PlayByPlay.get_game_pbp_data_lineups`. The
+        play-by-play and boxscore data are fetched concurrently.
+
+        Args:
+
+            season (int): The start year of the season
+
+            gamecode (int): The game-code of the game of interest.
+
+            validate (bool, optional): A bool indicator whether to enrich the
+                dataframe with two extra columns, which validate the validity
+                and consistency of the extracted lineup. Defaults to True.
+
+            lineup_format (str, optional): The representation of the
+                lineups, one of "list", "id" and "columns", see
+                `get_pbp_lineups`. Defaults to "list".
+
+            registry (LineupRegistry, optional): The registry of the lineup
+                ids, when `lineup_format` is "id". Defaults to None, i.e. the
+                default registry.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the play-by-play enriched with
+                teams' lineups
+        """
+        boxscoredata = AsyncBoxScoreData(
+            competition=self.competition, transport=self.transport)
+        import asyncio
+
+        pbp_payload, game_bxscr_stats = await asyncio.gather(
+            self.get_play_by_play_payload(season, gamecode),
+            boxscoredata.get_players_boxscore_stats(
+                season=season, gamecode=gamecode),
+            return_exceptions=True
+        )
+        if isinstance(pbp_payload, BaseException):
+            raise pbp_payload
+        pbp_data = PlayByPlay.make_play_by_play_df(
+            pbp_payload, season, gamecode, include_ishometeam=True)
+        if isinstance(game_bxscr_stats, BaseException):
+            logger.warning(
+                "Something went wrong when fetching boxscore data for game "
+                "%s, season %s.\nError message: %s. \nSkip and continue",
+                gamecode, season, game_bxscr_stats
+            )
+            game_bxscr_stats = pd.DataFrame()
+
+        pbp_df = get_pbp_lineups(
+            pbp_df=pbp_data,
+            boxscore_df=game_bxscr_stats,
+            validate=validate,
+            lineup_format=lineup_format,
+            registry=registry
+        )
+        return self.apply_schema(pbp_df, "play_by_play")
+
+    async def get_game_pbp_data_lineups_round(
+        self,
+        season: int,
+        round_number: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `PlayByPlay` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the play-by-play data with lineups
+                of all games in a single round
+        """
+        df = await self.get_round_data_from_game_data(
+            season, round_number, self.get_game_pbp_data_lineups,
+            max_workers=max_workers)
+        return df
+
+    async def get_game_pbp_data_lineups_single_season(
+        self,
+        season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `PlayByPlay` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the play-by-play data with lineups
+                of all games in a single season
+        """
+        df = await self.get_season_data_from_game_data(
+            season, self.get_game_pbp_data_lineups, max_workers=max_workers)
+        return df
+
+    async def get_game_pbp_data_lineups_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `PlayByPlay` method of the same
+        name.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the play-by-play data with lineups
+                of all games in a range of seasons
+        """
+        df = await self.get_range_seasons_data(
+            start_season, end_season, self.get_game_pbp_data_lineups,
+            max_workers=max_workers)
         return df
@@ -5,6 +5,7 @@ from .utils import (
     raise_error,
     get_requests
 )
+from .decoding import decode_json, json_normalize
 
 
 class PlayerStats(EuroLeagueData):
@@ -99,14 +100,14 @@ class PlayerStats(EuroLeagueData):
 
         url_ = f"{self.url}/statistics/players/{endpoint}"
 
-        r = get_requests(url_, params=params)
-        data = r.json()
+        r = get_requests(url_, params=params, transport=self.transport)
+        data = decode_json(r)
         if data["total"] > len(data["players"]):
             params["limit"] = data["total"] + 1
-            r = get_requests(url_, params=params)
-            data = r.json()
-        df = pd.json_normalize(data["players"])
-        return df
+            r = get_requests(url_, params=params, transport=self.transport)
+            data = decode_json(r)
+        df = json_normalize(data["players"])
+        return self.apply_schema(df, "player_stats")
 
     def get_player_stats_all_seasons(
         self,
@@ -522,10 +523,10 @@ class PlayerStats(EuroLeagueData):
 
         url_ = f"{self.url_v2}/stats/players/leaders"
 
-        r = get_requests(url_, params=params)
-        data = r.json()
-        df = pd.json_normalize(data["data"])
-        return df
+        r = get_requests(url_, params=params, transport=self.transport)
+        data = decode_json(r)
+        df = json_normalize(data["data"])
+        return self.apply_schema(df, "player_stats_leaders")
 
     def get_player_stats_leaders_all_seasons(
         self,
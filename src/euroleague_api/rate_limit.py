@@ -0,0 +1,365 @@
+from typing import Optional, Dict
+import time
+import random
+import threading
+import logging
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket. Tokens are added at `rate` per second, up to
+    `burst` tokens, and each request consumes one token.
+
+    Args:
+        rate (float): The number of requests per second.
+        burst (int, optional): The maximum number of requests sent at once.
+            Defaults to 1.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError(f"rate, {rate}, must be positive.")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserves a token and returns the time to wait before using it. The
+        caller sleeps, so that it works for both threads and coroutines.
+
+        Returns:
+            float: The waiting time in seconds.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class ConcurrencyLimit:
+    """
+    A thread-safe, adjustable bound of the number of requests in flight,
+    i.e. a semaphore whose number of permits can change while it is held.
+
+    Args:
+        limit (int): The initial and maximum number of requests in flight.
+    """
+
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError(f"limit, {limit}, must be at least 1.")
+        self.max_limit = limit
+        self.limit = float(limit)
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def try_acquire(self) -> bool:
+        """
+        Takes a permit if one is free, without waiting.
+
+        Returns:
+            bool: True if a permit was taken.
+        """
+        with self.condition:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self) -> None:
+        """Takes a permit, waiting until one is free."""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self) -> None:
+        """Returns a permit."""
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify()
+
+    def decrease(self) -> None:
+        """Halves the limit, down to one request in flight."""
+        with self.condition:
+            self.limit = max(1.0, self.limit / 2)
+
+    def increase(self) -> None:
+        """
+        Increases the limit by one request per `limit` calls, i.e. by about
+        one request for every round of requests, up to the maximum.
+        """
+        with self.condition:
+            previous = int(self.limit)
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            if int(self.limit) > previous:
+                self.condition.notify_all()
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter with a token bucket per host.
+
+    In adaptive mode, the rate and the number of requests in flight of each
+    host are adapted to its error rate (AIMD). Whenever the host returns a
+    429 or 5xx response, its rate is halved, down to `min_rate`, and so is
+    its number of requests in flight, down to one. After every successful
+    response, its rate increases by `increase` requests per second, up to
+    its configured rate, and its number of requests in flight by about one
+    per round of requests, up to `max_concurrency`. Hence, the load on the
+    API shrinks when the error rate rises and it recovers when the API is
+    healthy again. The number of requests in flight is not bounded outside
+    the adaptive mode.
+
+    Args:
+        rate (float, optional): The default requests per second of each
+            host. Defaults to 10.
+        burst (int, optional): The default burst of each host.
+            Defaults to 10.
+        host_rates (Dict[str, float], optional): The requests per second of
+            specific hosts, e.g. `{"live.euroleague.net": 5}`.
+            Defaults to None.
+        adaptive (bool, optional): Whether to adapt the rates to the error
+            rate. Defaults to False.
+        min_rate (float, optional): The lowest rate of the adaptive mode.
+            Defaults to 0.5.
+        increase (float, optional): The additive increase of the adaptive
+            mode. Defaults to 0.1.
+        max_concurrency (int, optional): The maximum number of requests in
+            flight per host of the adaptive mode. Defaults to 10.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10,
+        burst: int = 10,
+        host_rates: Optional[Dict[str, float]] = None,
+        adaptive: bool = False,
+        min_rate: float = 0.5,
+        increase: float = 0.1,
+        max_concurrency: int = 10
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.host_rates = host_rates or {}
+        self.adaptive = adaptive
+        self.min_rate = min_rate
+        self.increase = increase
+        self.max_concurrency = max_concurrency
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.limits: Dict[str, ConcurrencyLimit] = {}
+        self.lock = threading.Lock()
+
+    def get_bucket(self, url: str) -> TokenBucket:
+        """Returns the token bucket of the host of a url."""
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(
+                    self.host_rates.get(host, self.rate), self.burst)
+            return self.buckets[host]
+
+    def get_limit(self, url: str) -> ConcurrencyLimit:
+        """Returns the concurrency limit of the host of a url."""
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.limits:
+                self.limits[host] = ConcurrencyLimit(self.max_concurrency)
+            return self.limits[host]
+
+    def acquire(self, url: str) -> None:
+        """
+        Waits until a request to the host of a url can be sent within its
+        number of requests in flight, in adaptive mode. Every call must be
+        followed by a call of `release` when the response is received.
+
+        Args:
+            url (str): The url of the request.
+        """
+        if self.adaptive:
+            self.get_limit(url).acquire()
+
+    def try_acquire(self, url: str) -> bool:
+        """
+        The non-blocking counterpart of `acquire`, e.g. for coroutines.
+
+        Args:
+            url (str): The url of the request.
+
+        Returns:
+            bool: True if the request can be sent.
+        """
+        if not self.adaptive:
+            return True
+        return self.get_limit(url).try_acquire()
+
+    def release(self, url: str) -> None:
+        """
+        Marks a request to the host of a url as no longer in flight.
+
+        Args:
+            url (str): The url of the request.
+        """
+        if self.adaptive:
+            self.get_limit(url).release()
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserves a request to the host of a url.
+
+        Args:
+            url (str): The url of the request.
+
+        Returns:
+            float: The time in seconds to wait before sending it.
+        """
+        return self.get_bucket(url).reserve()
+
+    def on_response(self, url: str, status_code: Optional[int]) -> None:
+        """
+        Adapts the rate and the number of requests in flight of a host to
+        the outcome of a request, in adaptive mode.
+
+        Args:
+            url (str): The url of the request.
+            status_code (int, optional): The status code of the response, or
+                None if the request failed to connect.
+        """
+        if not self.adaptive:
+            return
+        host = urlparse(url).netloc
+        bucket = self.get_bucket(url)
+        limit = self.get_limit(url)
+        max_rate = self.host_rates.get(host, self.rate)
+        failed = (
+            status_code is None or status_code == 429 or status_code >= 500)
+        with bucket.lock:
+            if failed:
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+            else:
+                bucket.rate = min(max_rate, bucket.rate + self.increase)
+        if failed:
+            limit.decrease()
+            logger.info(
+                "Reduced the request rate of %s to %.2f/s and its requests "
+                "in flight to %d.", host, bucket.rate, int(limit.limit)
+            )
+        else:
+            limit.increase()
+
+
+class RetryPolicy:
+    """
+    Retries of failed requests with jittered exponential backoff. The
+    `Retry-After` header of the response is honoured, when present.
+
+    Args:
+        max_retries (int, optional): The maximum number of retries.
+            Defaults to 5.
+        backoff_factor (float, optional): The base of the backoff, i.e. the
+            n-th retry waits up to `backoff_factor * 2 ** n` seconds.
+            Defaults to 0.5.
+        max_backoff (float, optional): The maximum waiting time in seconds.
+            Defaults to 60.
+        status_forcelist (tuple, optional): The status codes to retry.
+            Defaults to (429, 500, 502, 503, 504).
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60,
+        status_forcelist: tuple = (429, 500, 502, 503, 504)
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_forcelist = status_forcelist
+
+    def is_retryable(
+        self,
+        attempt: int,
+        response: Optional[requests.models.Response]
+    ) -> bool:
+        """
+        Whether a request should be retried.
+
+        Args:
+            attempt (int): The number of retries so far.
+            response (requests.models.Response, optional): The response, or
+                None if the request failed to connect or timed out.
+
+        Returns:
+            bool: True if the request should be retried.
+        """
+        if attempt >= self.max_retries:
+            return False
+        return (
+            response is None or
+            response.status_code in self.status_forcelist
+        )
+
+    def get_delay(
+        self,
+        attempt: int,
+        response: Optional[requests.models.Response]
+    ) -> float:
+        """
+        The waiting time before a retry. It is the `Retry-After` of the
+        response, if present, otherwise a "full jitter" exponential backoff.
+
+        Args:
+            attempt (int): The number of retries so far.
+            response (requests.models.Response, optional): The response, or
+                None if the request failed to connect or timed out.
+
+        Returns:
+            float: The waiting time in seconds.
+        """
+        retry_after = None
+        if response is not None:
+            retry_after = parse_retry_after(
+                response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        return random.uniform(0, backoff)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a `Retry-After` header, given either in seconds or as an HTTP
+    date.
+
+    Args:
+        value (str, optional): The value of the header.
+
+    Returns:
+        Optional[float]: The waiting time in seconds, or None if the value
+            is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
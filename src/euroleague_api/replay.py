@@ -0,0 +1,270 @@
+from typing import Dict, Optional
+import os
+import json
+import time
+import zipfile
+import threading
+import logging
+import requests
+from .cache import ResponseCache
+from .transport import HTTPTransport, build_response
+
+logger = logging.getLogger(__name__)
+
+INDEX = "index.json"
+
+
+class ResponseArchive:
+    """
+    A compact archive of recorded responses, i.e. a zip file with a deflated
+    body per request and a JSON index of their url, parameters, status and
+    content type. The requests are addressed as in `ResponseCache`, i.e. by
+    their url and their (sorted) parameters. An existing archive is loaded,
+    so that a recording can be extended.
+
+    Args:
+        path (str): The path of the archive, e.g. "season_2023.zip".
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self.entries: Dict[str, dict] = {}
+        self.bodies: Dict[str, bytes] = {}
+        self.lock = threading.Lock()
+        self.zipfile: Optional[zipfile.ZipFile] = None
+        if os.path.exists(self.path):
+            self.zipfile = zipfile.ZipFile(self.path)
+            self.entries = json.loads(self.zipfile.read(INDEX))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(
+        self,
+        url: str,
+        params: Optional[dict],
+        r: requests.models.Response
+    ) -> None:
+        """
+        Adds a response to the archive, replacing any previous response of
+        the same request. It is kept in memory until `save` is called.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables of the request.
+
+            r (requests.models.Response): The response object.
+        """
+        key = ResponseCache.make_key(url, params)
+        entry = {
+            "url": url,
+            "params": {
+                k: str(v) for k, v in (params or {}).items() if v is not None
+            },
+            "status": r.status_code,
+            "reason": r.reason,
+            "content_type": r.headers.get("Content-Type"),
+            "encoding": r.encoding,
+        }
+        with self.lock:
+            self.entries[key] = entry
+            self.bodies[key] = r.content
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None
+    ) -> Optional[requests.models.Response]:
+        """
+        Returns the recorded response of a request, if any.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables of the request.
+                Defaults to None.
+
+        Returns:
+
+            Optional[requests.models.Response]: The response object, or None
+                if the request was not recorded.
+        """
+        key = ResponseCache.make_key(url, params)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        with self.lock:
+            content = self.bodies.get(key)
+            if content is None and self.zipfile is not None:
+                content = self.zipfile.read(key)
+        headers = {}
+        if entry["content_type"]:
+            headers["Content-Type"] = entry["content_type"]
+        return build_response(
+            url=entry["url"],
+            status_code=entry["status"],
+            content=content or b"",
+            headers=headers,
+            reason=entry["reason"],
+            encoding=entry["encoding"],
+        )
+
+    def save(self) -> None:
+        """
+        Writes the archive, with the responses added since it was loaded. The
+        file is replaced atomically.
+        """
+        tmp_path = f"{self.path}.tmp"
+        with self.lock:
+            with zipfile.ZipFile(
+                    tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr(INDEX, json.dumps(self.entries))
+                for key in self.entries:
+                    if key in self.bodies:
+                        zf.writestr(key, self.bodies[key])
+                    elif self.zipfile is not None:
+                        zf.writestr(key, self.zipfile.read(key))
+            if self.zipfile is not None:
+                self.zipfile.close()
+            os.replace(tmp_path, self.path)
+            self.zipfile = zipfile.ZipFile(self.path)
+            self.bodies = {}
+        logger.info(
+            "%d responses saved to %s.", len(self.entries), self.path)
+
+    def close(self) -> None:
+        """Closes the archive file, without saving it."""
+        if self.zipfile is not None:
+            self.zipfile.close()
+            self.zipfile = None
+
+
+class RecordingTransport:
+    """
+    A transport that sends the requests with another transport and records
+    their responses to an archive, e.g. to replay a season pull offline with
+    `ReplayTransport`. The archive is saved when the transport is closed,
+    e.g.
+
+        with RecordingTransport(ResponseArchive("season.zip")) as transport:
+            PlayByPlay(transport=transport).get_game_play_by_play_data(
+                2023, 1)
+
+    Args:
+        archive (ResponseArchive): The archive of the responses.
+        transport (HTTPTransport, optional): The transport that sends the
+            requests. Defaults to None, i.e. a new `HTTPTransport`.
+    """
+
+    def __init__(
+        self,
+        archive: ResponseArchive,
+        transport: Optional[HTTPTransport] = None
+    ):
+        self.archive = archive
+        self.transport = transport if transport is not None \
+            else HTTPTransport()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None
+    ) -> requests.models.Response:
+        """
+        Sends a GET request and records its response.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables in get requests.
+                Defaults to None.
+
+            headers (dict, optional): the `header` variable in get requests.
+                Defaults to None.
+
+        Returns:
+
+            requests.models.Response: The response object.
+        """
+        r = self.transport.get(url, params=params, headers=headers)
+        self.archive.add(url, params, r)
+        return r
+
+    def close(self) -> None:
+        """Saves the archive and closes the transport, if it can be."""
+        self.archive.save()
+        close = getattr(self.transport, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class ReplayTransport:
+    """
+    A transport that serves the responses of an archive, without any
+    network, e.g. to develop and benchmark a pipeline deterministically. A
+    request that was not recorded gets a 404 response, which is raised by
+    `get_requests` as for a missing game.
+
+    Args:
+        archive (ResponseArchive): The archive of the responses.
+        latency (float, optional): The time in seconds that every response
+            is delayed by, to simulate the network. Defaults to 0.
+    """
+
+    def __init__(self, archive: ResponseArchive, latency: float = 0):
+        self.archive = archive
+        self.latency = latency
+        self.misses = 0
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None
+    ) -> requests.models.Response:
+        """
+        Returns the recorded response of a GET request.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables in get requests.
+                Defaults to None.
+
+            headers (dict, optional): the `header` variable in get requests.
+                Ignored. Defaults to None.
+
+        Returns:
+
+            requests.models.Response: The response object.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        r = self.archive.get(url, params)
+        if r is None:
+            self.misses += 1
+            logger.warning("No recorded response of %s %s.", url, params)
+            return build_response(url, 404, b"", reason="Not Recorded")
+        return r
+
+    def close(self) -> None:
+        """Closes the archive."""
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
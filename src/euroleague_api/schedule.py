@@ -1,7 +1,7 @@
 import pandas as pd
-import xmltodict
 from .EuroLeagueData import EuroLeagueData
 from .utils import get_requests
+from .decoding import make_records_df, iter_xml_records
 
 
 class Schedule(EuroLeagueData):
@@ -35,8 +35,7 @@ class Schedule(EuroLeagueData):
         params = {
             "seasonCode": f"{self.competition}{season}"
         }
-        r = get_requests(url, params=params)
-        schedule_dict = xmltodict.parse(r.text)
-        df = pd.DataFrame(schedule_dict["schedule"]["item"])
-        df["gameday"] = df["gameday"].astype(int)
+        r = get_requests(url, params=params, transport=self.transport)
+        df = make_records_df(
+            iter_xml_records(r.content, "item"), converters={"gameday": int})
         return df
@@ -0,0 +1,258 @@
+from typing import Any, Dict, List
+import logging
+import pandas as pd
+from .events import emit
+
+logger = logging.getLogger(__name__)
+
+# the string columns with at most this share of distinct values are stored
+# as categoricals by `downcast_column`.
+CATEGORY_RATIO = 0.5
+
+# the key of the `attrs` of a typed dataframe listing its columns cast by
+# `downcast_column`, whose type `concat_frames` decides again over all the
+# concatenated frames.
+DOWNCAST_ATTR = "downcast_columns"
+
+GAME_KEYS = {
+    "Season": "int16",
+    "Gamecode": "int16",
+}
+
+COUNT = "Int16"
+
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "play_by_play": {
+        **GAME_KEYS,
+        "TYPE": "Int8",
+        "NUMBEROFPLAY": "Int32",
+        "CODETEAM": "category",
+        "PLAYER_ID": "category",
+        "PLAYTYPE": "category",
+        "PLAYER": "category",
+        "TEAM": "category",
+        "DORSAL": "category",
+        "MINUTE": "Int8",
+        "MARKERTIME": "category",
+        "POINTS_A": COUNT,
+        "POINTS_B": COUNT,
+        "PLAYINFO": "category",
+        "TRUE_NUMBEROFPLAY": "int16",
+        "PERIOD": "int8",
+        "IsHomeTeam": "boolean",
+    },
+    "shots": {
+        **GAME_KEYS,
+        "NUM_ANOT": COUNT,
+        "TEAM": "category",
+        "ID_PLAYER": "category",
+        "PLAYER": "category",
+        "ID_ACTION": "category",
+        "ACTION": "category",
+        "POINTS": "Int8",
+        "COORD_X": "Int16",
+        "COORD_Y": "Int16",
+        "ZONE": "category",
+        "FASTBREAK": "category",
+        "SECOND_CHANCE": "category",
+        "POINTS_OFF_TURNOVER": "category",
+        "MINUTE": "Int8",
+        "CONSOLE": "category",
+        "POINTS_A": COUNT,
+        "POINTS_B": COUNT,
+    },
+    "boxscore_players": {
+        **GAME_KEYS,
+        "Home": "int8",
+        "Player_ID": "category",
+        "IsStarter": "Int8",
+        "IsPlaying": "Int8",
+        "Team": "category",
+        "Dorsal": "category",
+        "Player": "category",
+        "Minutes": "category",
+        "Points": COUNT,
+        "FieldGoalsMade2": COUNT,
+        "FieldGoalsAttempted2": COUNT,
+        "FieldGoalsMade3": COUNT,
+        "FieldGoalsAttempted3": COUNT,
+        "FreeThrowsMade": COUNT,
+        "FreeThrowsAttempted": COUNT,
+        "OffensiveRebounds": COUNT,
+        "DefensiveRebounds": COUNT,
+        "TotalRebounds": COUNT,
+        "Assistances": COUNT,
+        "Steals": COUNT,
+        "Turnovers": COUNT,
+        "BlocksFavour": COUNT,
+        "BlocksAgainst": COUNT,
+        "FoulsCommited": COUNT,
+        "FoulsReceived": COUNT,
+        "Valuation": COUNT,
+        "Plusminus": COUNT,
+    },
+}
+
+
+def downcast_column(s: pd.Series) -> pd.Series:
+    """
+    Downcasts a column without a schema, i.e. integers, and floats with
+    whole values, to the smallest (nullable) integer type that holds their
+    values and strings with few distinct values to categoricals. The other
+    floats are kept, so that no value changes.
+
+    Args:
+        s (pd.Series): The column.
+
+    Returns:
+        pd.Series: The downcast column.
+    """
+    if pd.api.types.is_bool_dtype(s.dtype):
+        return s
+    if pd.api.types.is_integer_dtype(s.dtype):
+        return pd.to_numeric(s, downcast="integer")
+    if pd.api.types.is_float_dtype(s.dtype):
+        values = s.dropna()
+        if len(values) and (values == values.round()).all():
+            return pd.to_numeric(s.astype("Int64"), downcast="integer")
+        return s
+    if pd.api.types.is_object_dtype(s.dtype) or \
+            pd.api.types.is_string_dtype(s.dtype):
+        try:
+            n_unique = s.nunique()
+        except TypeError:  # e.g. lists of players
+            return s
+        if n_unique <= CATEGORY_RATIO * len(s):
+            return s.astype("category")
+    return s
+
+
+def apply_schema(df: pd.DataFrame, dataset: str) -> pd.DataFrame:
+    """
+    Casts the columns of a dataframe to the schema of its dataset, see
+    `SCHEMAS`, i.e. categoricals for the codes and names, small and nullable
+    integers for the counts and coordinates. The columns outside the schema,
+    or of a dataset without a schema, e.g. the stats endpoints, are
+    downcast by `downcast_column`. A column that does not fit its type is
+    left as is.
+
+    The type of a downcast column depends on the values of the dataframe,
+    e.g. of a single game, so these columns are listed in the `attrs` of
+    the typed dataframe and typed again over the whole dataset when the
+    dataframes are concatenated by `concat_frames`.
+
+    Args:
+        df (pd.DataFrame): The dataframe.
+        dataset (str): The name of the dataset, e.g. "play_by_play".
+
+    Returns:
+        pd.DataFrame: The typed dataframe.
+    """
+    if df.empty:
+        return df
+    schema = SCHEMAS.get(dataset, {})
+    columns = {}
+    downcast = []
+    for col in df.columns:
+        try:
+            if col in schema:
+                columns[col] = df[col].astype(schema[col])
+                continue
+            columns[col] = downcast_column(df[col])
+            # the categoricals are already typed by the caller, e.g. the
+            # players of the lineups
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                downcast.append(col)
+        except (TypeError, ValueError) as e:
+            logger.warning(
+                "Column %s of dataset %s is not cast: %s", col, dataset, e)
+            emit("cast_error", dataset=dataset, column=col, message=str(e))
+            columns[col] = df[col]
+    typed_df = pd.DataFrame(columns, index=df.index)
+    typed_df.attrs[DOWNCAST_ATTR] = downcast
+    return typed_df
+
+
+def restore_column(s: pd.Series) -> pd.Series:
+    """
+    Reverts `downcast_column`, i.e. casts a categorical back to objects and
+    a nullable integer back to floats, with NaN for the missing values.
+
+    Args:
+        s (pd.Series): The downcast column.
+
+    Returns:
+        pd.Series: The column before the downcast.
+    """
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return s.astype(object)
+    if pd.api.types.is_extension_array_dtype(s.dtype) and \
+            pd.api.types.is_integer_dtype(s.dtype):
+        return s.astype("float64")
+    return s
+
+
+def concat_frames(dfs: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenates a collection of dataframes, e.g. one per game, keeping
+    their types. The categoricals are set to the union of their categories,
+    see `unify_categories`, and the columns downcast by `apply_schema` are
+    downcast again over all the values, so that their type is the same for
+    the whole dataset rather than a categorical in one game and strings in
+    another, which would be concatenated as objects.
+
+    Args:
+        dfs (List[pd.DataFrame]): The dataframes.
+
+    Returns:
+        pd.DataFrame: The concatenated dataframe.
+    """
+    downcast: Dict[str, None] = {}
+    for df in dfs:
+        downcast.update(dict.fromkeys(df.attrs.get(DOWNCAST_ATTR, [])))
+    if not downcast:
+        return pd.concat(unify_categories(dfs))
+    dfs = [
+        df.assign(**{
+            col: restore_column(df[col])
+            for col in downcast if col in df.columns
+        })
+        for df in dfs
+    ]
+    data_df = pd.concat(unify_categories(dfs))
+    for col in downcast:
+        if col in data_df.columns:
+            data_df[col] = downcast_column(data_df[col].infer_objects())
+    data_df.attrs[DOWNCAST_ATTR] = list(downcast)
+    return data_df
+
+
+def unify_categories(dfs: List[pd.DataFrame]) -> List[pd.DataFrame]:
+    """
+    Sets the categoricals of a collection of dataframes, e.g. one per game,
+    to the union of their categories, so that they stay categoricals when
+    they are concatenated.
+
+    Args:
+        dfs (List[pd.DataFrame]): The dataframes.
+
+    Returns:
+        List[pd.DataFrame]: The dataframes with the same categories.
+    """
+    categories: Dict[str, Dict] = {}
+    for df in dfs:
+        for col, dtype in df.dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                categories.setdefault(str(col), {}).update(
+                    dict.fromkeys(dtype.categories))
+    if not categories:
+        return dfs
+    return [
+        df.assign(**{
+            col: df[col].cat.set_categories(list(cats))
+            for col, cats in categories.items()
+            if col in df.columns
+            and isinstance(df[col].dtype, pd.CategoricalDtype)
+        })
+        for df in dfs
+    ]
@@ -0,0 +1,287 @@
+from typing import Any, List, Optional, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+import argparse
+import random
+import threading
+import time
+import logging
+import requests
+from .transport import HTTPTransport
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://api-live.euroleague.net"
+LIVE_URL = "https://live.euroleague.net"
+
+
+def restore_url(path: str) -> str:
+    """
+    Maps the path of a request to the stand-in server back to the url of the
+    Euroleague API, i.e. "/api/*" to the live API and everything else, e.g.
+    "/v1/results" and "/v3/competitions/...", to the main API.
+
+    Args:
+        path (str): The path of the request, without the query.
+
+    Returns:
+        str: The url of the Euroleague API.
+    """
+    if path.startswith("/api/"):
+        return f"{LIVE_URL}{path}"
+    return f"{BASE_URL}{path}"
+
+
+class StandInServer:
+    """
+    A local HTTP server that stands in for the Euroleague API, with the same
+    url layout, i.e. "/v1/results", "/v2/competitions/{c}/seasons/...",
+    "/v3/competitions/{c}/.../games/{code}/{endpoint}" and the live API
+    "/api/*". The responses come from another transport, e.g. a
+    `ReplayTransport`, and can be delayed and replaced by errors at random,
+    so that the concurrency and the retries of a pipeline can be benchmarked
+    deterministically. Point the package to it with a `RedirectTransport`,
+    e.g.
+
+        with StandInServer(ReplayTransport(archive), latency=0.05) as server:
+            transport = RedirectTransport(server.url)
+            df = ShotData(transport=transport).get_game_shot_data(2023, 1)
+
+    It runs in a background thread, with a thread per connection.
+
+    Args:
+        source (Any): The transport that makes the responses, i.e. any object
+            with a `get(url, params=None, headers=None)` method.
+        host (str, optional): The host to listen on. Defaults to
+            "127.0.0.1".
+        port (int, optional): The port to listen on. Defaults to 0, i.e. a
+            free port.
+        latency (float, optional): The time in seconds that every response
+            is delayed by. Defaults to 0.
+        jitter (float, optional): The maximum random time in seconds added
+            to the latency. Defaults to 0.
+        error_rate (float, optional): The probability that a request gets
+            an error instead of its response. Defaults to 0.
+        error_statuses (List[int], optional): The statuses of the errors,
+            drawn at random. Defaults to [503].
+        retry_after (float, optional): The `Retry-After` header of the
+            errors, in seconds. Defaults to None, i.e. no header.
+        seed (int, optional): The seed of the latency and error draws.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        error_statuses: Optional[List[int]] = None,
+        retry_after: Optional[float] = None,
+        seed: Optional[int] = None
+    ):
+        self.source = source
+        self.host = host
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses or [503]
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.httpd = ThreadingHTTPServer((host, port), StandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.standin = self  # type: ignore
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The base url of the server, e.g. "http://127.0.0.1:8000"."""
+        return f"http://{self.host}:{self.httpd.server_port}"
+
+    def start(self) -> "StandInServer":
+        """Starts serving in a background thread."""
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info("Stand-in server listening on %s.", self.url)
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and closes the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def draw(self) -> Tuple[float, Optional[int]]:
+        """Draws the delay of a request and its error status, if any."""
+        with self.lock:
+            self.requests += 1
+            delay = self.latency + self.random.uniform(0, self.jitter)
+            status = None
+            if self.random.random() < self.error_rate:
+                status = self.random.choice(self.error_statuses)
+                self.errors += 1
+        return delay, status
+
+    def respond(self, path: str) -> Tuple[int, dict, bytes]:
+        """
+        Makes the response of a request to the server.
+
+        Args:
+            path (str): The path of the request, with the query.
+
+        Returns:
+            Tuple[int, dict, bytes]: The status, the headers and the body.
+        """
+        delay, status = self.draw()
+        if delay:
+            time.sleep(delay)
+        if status is not None:
+            headers = {}
+            if self.retry_after is not None:
+                headers["Retry-After"] = str(self.retry_after)
+            return status, headers, b""
+        parts = urlsplit(path)
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        r = self.source.get(restore_url(parts.path), params=params or None)
+        headers = {}
+        if r.headers.get("Content-Type"):
+            headers["Content-Type"] = r.headers["Content-Type"]
+        return r.status_code, headers, r.content
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """The request handler of `StandInServer`."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status, headers, body = self.server.standin.respond(  # type: ignore
+            self.path)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class RedirectTransport:
+    """
+    A transport that sends the requests of the package to another server
+    with the same url layout, e.g. a `StandInServer`, by replacing the
+    scheme and the host of their url.
+
+    Args:
+        base_url (str): The base url of the server, e.g.
+            "http://127.0.0.1:8000".
+        transport (HTTPTransport, optional): The transport that sends the
+            requests. Defaults to None, i.e. a new `HTTPTransport`.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        transport: Optional[HTTPTransport] = None
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.transport = transport if transport is not None \
+            else HTTPTransport()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None
+    ) -> requests.models.Response:
+        """
+        Sends a GET request to the server.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables in get requests.
+                Defaults to None.
+
+            headers (dict, optional): the `header` variable in get requests.
+                Defaults to None.
+
+        Returns:
+
+            requests.models.Response: The response object.
+        """
+        parts = urlsplit(url)
+        return self.transport.get(
+            f"{self.base_url}{parts.path}", params=params, headers=headers)
+
+    def close(self) -> None:
+        """Closes the transport, if it can be."""
+        close = getattr(self.transport, "close", None)
+        if close is not None:
+            close()
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Serves an archive of recorded responses, see `replay.ResponseArchive`,
+    until interrupted, e.g.
+
+        python -m euroleague_api.server season.zip --port 8000 --latency 0.05
+    """
+    from .replay import ResponseArchive, ReplayTransport
+
+    parser = argparse.ArgumentParser(
+        description="A local stand-in server of the Euroleague API.")
+    parser.add_argument("archive", help="the archive of the responses")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0,
+                        help="the delay of every response in seconds")
+    parser.add_argument("--jitter", type=float, default=0,
+                        help="the maximum random extra delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0,
+                        help="the probability of an error response")
+    parser.add_argument("--error-status", type=int, action="append",
+                        help="the status of the errors, e.g. 429 or 503")
+    parser.add_argument("--retry-after", type=float, default=None,
+                        help="the Retry-After header of the errors")
+    parser.add_argument("--seed", type=int, default=None)
+    options = parser.parse_args(args)
+    server = StandInServer(
+        ReplayTransport(ResponseArchive(options.archive)),
+        host=options.host,
+        port=options.port,
+        latency=options.latency,
+        jitter=options.jitter,
+        error_rate=options.error_rate,
+        error_statuses=options.error_status,
+        retry_after=options.retry_after,
+        seed=options.seed,
+    )
+    print(f"Serving {options.archive} on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
+from typing import Iterator
 import logging
 from json.decoder import JSONDecodeError
 import pandas as pd
-from .EuroLeagueData import EuroLeagueData
-from .utils import get_requests
+from .EuroLeagueData import EuroLeagueData, AsyncEuroLeagueData
+from .utils import get_requests, get_requests_async
+from .decoding import decode_json, make_records_df, strip
 
 logger = logging.getLogger(__name__)
 
@@ -36,41 +38,64 @@ class ShotData(EuroLeagueData):
 
             pd.DataFrame: A dataframe with the shot data of the game.
         """
-        url = "https://live.euroleague.net/api/Points"
-        params = {
-            "gamecode": gamecode,
-            "seasoncode": f"{self.competition}{season}"
-        }
-        r = get_requests(url, params=params)
+        url = self.make_live_game_url("Points")
+        params = self.make_live_game_params(season, gamecode)
+        r = get_requests(url, params=params, transport=self.transport)
 
         try:
-            data = r.json()
+            data = decode_json(r)
         except JSONDecodeError as exc:
             logger.error(
-                f"Game code, {gamecode}, season {season}, "
-                "did not return valid JSON data."
+                "Game code, %s, season %s, did not return valid JSON data.",
+                gamecode, season
             )
             raise exc
+        df = self.make_shot_data_df(data, season, gamecode)
+        return self.apply_schema(df, "shots")
 
-        shots_df = pd.DataFrame(data['Rows'])
+    @staticmethod
+    def make_shot_data_df(
+        data: dict,
+        season: int,
+        gamecode: int
+    ) -> pd.DataFrame:
+        """
+        Makes the shot data dataframe of a game from the JSON response of the
+        Points endpoint.
+
+        Args:
+
+            data (dict): The decoded JSON response.
+
+            season (int): The start year of the season
+
+            gamecode (int): The game-code of the game of interest.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the shot data of the game.
+        """
         # team id, player id and action id contain trailing white space
+        shots_df = make_records_df(
+            data['Rows'],
+            converters={"TEAM": strip, "ID_PLAYER": strip, "ID_ACTION": strip}
+        )
         if not shots_df.empty:
-            shots_df['TEAM'] = shots_df['TEAM'].str.strip()
-            shots_df['ID_PLAYER'] = shots_df['ID_PLAYER'].str.strip()
-            shots_df['ID_ACTION'] = shots_df['ID_ACTION'].str.strip()
             shots_df.insert(0, 'Season', season)
             shots_df.insert(1, 'Gamecode', gamecode)
         return shots_df
 
     def get_game_shot_data_round(
-            self, season: int, round_number: int
-            ) -> pd.DataFrame:
+            self, season: int, round_number: int, max_workers: int = 1
+    ) -> pd.DataFrame:
         """
         A function that gets the shot data of *all* games in a single round
 
         Args:
             season (int): The start year of the season
             round_number (int): The round of the season
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
 
         Returns:
 
@@ -78,10 +103,13 @@ class ShotData(EuroLeagueData):
                 single round
         """
         data_df = self.get_round_data_from_game_data(
-            season, round_number, self.get_game_shot_data)
+            season, round_number, self.get_game_shot_data,
+            max_workers=max_workers)
         return data_df
 
-    def get_game_shot_data_single_season(self, season: int) -> pd.DataFrame:
+    def get_game_shot_data_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> pd.DataFrame:
         """
         A function that gets the shot data of *all* games in a single season
 
@@ -89,17 +117,21 @@ class ShotData(EuroLeagueData):
 
             season (int): The start year of the season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with the shot data of all games in a
                 single season
         """
         data_df = self.get_season_data_from_game_data(
-            season, self.get_game_shot_data)
+            season, self.get_game_shot_data,
+            max_workers=max_workers)
         return data_df
 
     def get_game_shot_data_range_seasons(
-        self, start_season: int, end_season: int
+        self, start_season: int, end_season: int, max_workers: int = 1
     ) -> pd.DataFrame:
         """
         A function that gets the shot data of *all* games in a range of seasons
@@ -110,11 +142,191 @@ class ShotData(EuroLeagueData):
 
             end_season (int): The start year of the end season
 
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
         Returns:
 
             pd.DataFrame: A dataframe with the shot data of all games in range
                 of seasons
         """
         df = self.get_range_seasons_data(
-            start_season, end_season, self.get_game_shot_data)
+            start_season, end_season, self.get_game_shot_data,
+            max_workers=max_workers)
+        return df
+
+    def iter_game_shot_data_single_season(
+        self, season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_shot_data_single_season`. It
+        yields the shot data of each game as soon as it is collected.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_season_data_from_game_data(
+            season, self.get_game_shot_data, max_workers=max_workers)
+
+    def iter_game_shot_data_range_seasons(
+        self, start_season: int, end_season: int, max_workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The streaming counterpart of `get_game_shot_data_range_seasons`. It
+        yields the shot data of each game as soon as it is collected.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 1.
+
+        Returns:
+
+            Iterator[pd.DataFrame]: A dataframe per game.
+        """
+        return self.iter_range_seasons_data(
+            start_season, end_season, self.get_game_shot_data,
+            max_workers=max_workers)
+
+
+class AsyncShotData(AsyncEuroLeagueData):
+    """
+    The async counterpart of the `ShotData` class.
+
+    Args:
+        competition (str, optional): The competition code, inherited from the
+            `AsyncEuroLeagueData` class. Choose one of:
+            - 'E' for Euroleague
+            - 'U' for Eurocup
+            Defaults to "E".
+        transport (AsyncHTTPTransport, optional): The async HTTP transport,
+            inherited from the `AsyncEuroLeagueData` class. Defaults to None.
+    """
+
+    async def get_game_shot_data(
+        self,
+        season: int,
+        gamecode: int,
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `ShotData.get_game_shot_data`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            gamecode (int): The game-code of the game of interest.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the shot data of the game.
+        """
+        url = self.make_live_game_url("Points")
+        params = self.make_live_game_params(season, gamecode)
+        r = await get_requests_async(
+            url, params=params, transport=self.transport)
+        try:
+            data = decode_json(r)
+        except JSONDecodeError as exc:
+            logger.error(
+                "Game code, %s, season %s, did not return valid JSON data.",
+                gamecode, season
+            )
+            raise exc
+        df = ShotData.make_shot_data_df(data, season, gamecode)
+        return self.apply_schema(df, "shots")
+
+    async def get_game_shot_data_round(
+        self,
+        season: int,
+        round_number: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `ShotData` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the shot data
+                of all games in a single round
+        """
+        df = await self.get_round_data_from_game_data(
+            season, round_number, self.get_game_shot_data,
+            max_workers=max_workers)
+        return df
+
+    async def get_game_shot_data_single_season(
+        self,
+        season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `ShotData` method of the same
+        name.
+
+        Args:
+
+            season (int): The start year of the season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the shot data
+                of all games in a single season
+        """
+        df = await self.get_season_data_from_game_data(
+            season, self.get_game_shot_data, max_workers=max_workers)
+        return df
+
+    async def get_game_shot_data_range_seasons(
+        self,
+        start_season: int,
+        end_season: int,
+        max_workers: int = 10
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of the `ShotData` method of the same
+        name.
+
+        Args:
+
+            start_season (int): The start year of the start season
+
+            end_season (int): The start year of the end season
+
+            max_workers (int, optional): The maximum number of games
+                fetched concurrently. Defaults to 10.
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the shot data
+                of all games in a range of seasons
+        """
+        df = await self.get_range_seasons_data(
+            start_season, end_season, self.get_game_shot_data,
+            max_workers=max_workers)
         return df
@@ -0,0 +1,187 @@
+from typing import Any, Dict, List, Optional
+import os
+import threading
+import logging
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def import_pyarrow():
+    """
+    Imports `pyarrow` and `pyarrow.parquet`.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ImportError(
+            "The Parquet sink requires pyarrow. Install it with "
+            "`pip install euroleague-api[parquet]`."
+        ) from exc
+    return pyarrow, pyarrow.parquet
+
+
+class ParquetSink:
+    """
+    A writer of a Hive-partitioned Parquet dataset, e.g.
+    `<directory>/Competition=E/Season=2023/Phase=RS/<gamecode>.parquet`.
+
+    Each game is written to its own file as soon as it is collected, so that
+    the collection runs with constant memory and a game that is collected
+    again overwrites its previous file. The partition columns are encoded in
+    the directory names only, and the string columns are dictionary-encoded.
+
+    The files share the schema of the dataset, which is unified with that of
+    every written game, e.g. a column that is all null in a game takes the
+    type of the other games, and an integer column with missing values in
+    another game becomes a float column. It is kept in the `_common_metadata`
+    file of the directory and the dataset is read with it.
+    `pyarrow` is an optional dependency, install it with
+    `pip install euroleague-api[parquet]`.
+
+    Args:
+        directory (str): The root directory of the dataset, one per type of
+            data, e.g. `warehouse/shots`. Created if it does not exist.
+        compression (str, optional): The Parquet compression codec.
+            Defaults to "zstd".
+    """
+    PARTITION_COLS = ["Competition", "Season", "Phase"]
+    SCHEMA_FILE = "_common_metadata"
+
+    def __init__(self, directory: str, compression: str = "zstd"):
+        _, pq = import_pyarrow()
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.compression = compression
+        self.lock = threading.Lock()
+        self.schema = None
+        schema_path = os.path.join(self.directory, self.SCHEMA_FILE)
+        if os.path.exists(schema_path):
+            self.schema = pq.read_schema(schema_path)
+
+    def make_path(self, partitions: Dict[str, Any], name: str) -> str:
+        """Returns the file path of a game in the given partition."""
+        parts = [
+            f"{col}={partitions[col]}"
+            for col in self.PARTITION_COLS if partitions.get(col) is not None
+        ]
+        return os.path.join(self.directory, *parts, f"{name}.parquet")
+
+    def write(
+        self,
+        df: pd.DataFrame,
+        partitions: Dict[str, Any],
+        name: str
+    ) -> str:
+        """
+        Writes the data of a game to its partition. The columns of the
+        partition keys are dropped, as they are encoded in the path.
+
+        Args:
+
+            df (pd.DataFrame): The data of the game.
+
+            partitions (Dict[str, Any]): The partition keys of the game, i.e.
+                `Competition`, `Season` and `Phase`. Missing keys are skipped.
+
+            name (str): The file name of the game, e.g. its game code.
+
+        Returns:
+
+            str: The path of the written file.
+        """
+        pa, pq = import_pyarrow()
+        path = self.make_path(partitions, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df = df.drop(columns=[c for c in self.PARTITION_COLS if c in df])
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        for i, field in enumerate(table.schema):
+            if pa.types.is_string(field.type) or \
+                    pa.types.is_large_string(field.type):
+                column = table.column(i).cast(pa.string())
+                table = table.set_column(
+                    i, field.name, column.dictionary_encode())
+        schema = self.update_schema(table.schema.remove_metadata())
+        table = table.cast(
+            pa.schema([schema.field(name) for name in table.column_names]))
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        pq.write_table(table, tmp_path, compression=self.compression)
+        os.replace(tmp_path, path)
+        return path
+
+    def update_schema(self, schema):
+        """
+        Unifies the schema of the dataset with that of a game, and saves it
+        if it changes.
+
+        Args:
+            schema (pyarrow.Schema): The schema of the game.
+
+        Returns:
+            pyarrow.Schema: The schema of the dataset.
+        """
+        pa, pq = import_pyarrow()
+        with self.lock:
+            if self.schema is None:
+                unified = schema
+            else:
+                unified = pa.unify_schemas(
+                    [self.schema, schema], promote_options="permissive")
+            if self.schema is None or not unified.equals(self.schema):
+                tmp_path = os.path.join(
+                    self.directory,
+                    f"{self.SCHEMA_FILE}.{threading.get_ident()}.tmp"
+                )
+                pq.write_metadata(unified, tmp_path)
+                os.replace(
+                    tmp_path, os.path.join(self.directory, self.SCHEMA_FILE))
+                self.schema = unified
+            return unified
+
+    def read(
+        self,
+        filters: Optional[List[tuple]] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Reads the dataset, or part of it, with Arrow-backed dtypes. The
+        filters on the partition columns only read the matching files.
+
+        Args:
+
+            filters (List[tuple], optional): Row filters in the `pyarrow`
+                format, e.g. `[("Season", ">=", 2020), ("Phase", "=", "RS")]`.
+                Defaults to None.
+
+            columns (List[str], optional): The columns to read. Defaults to
+                None, i.e. all columns.
+
+        Returns:
+
+            pd.DataFrame: The data.
+        """
+        pa, pq = import_pyarrow()
+        schema = self.schema
+        if schema is not None:
+            # the partition columns are not in the files, so their types
+            # are inferred from the directory names as without a schema
+            import pyarrow.dataset as ds
+            inferred = ds.dataset(self.directory, partitioning="hive").schema
+            for field in inferred:
+                if field.name in self.PARTITION_COLS:
+                    schema = schema.append(field)
+        table = pq.read_table(
+            self.directory,
+            filters=filters,
+            columns=columns,
+            partitioning="hive",
+            schema=schema,
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def __repr__(self):
+        return f"ParquetSink({self.directory!r})"
@@ -1,6 +1,7 @@
 import pandas as pd
-from .EuroLeagueData import EuroLeagueData
-from .utils import get_requests
+from .EuroLeagueData import EuroLeagueData, AsyncEuroLeagueData
+from .utils import get_requests, get_requests_async
+from .decoding import decode_json, json_normalize
 
 
 class Standings(EuroLeagueData):
@@ -47,23 +48,61 @@ class Standings(EuroLeagueData):
 
             pd.DataFrame: A dataframe with the standings of the teams
         """
-        available_endpoints = [
-            "calendarstandings", "streaks",
-            "aheadbehind", "margins",
-            "basicstandings"
-        ]
-
-        if endpoint not in available_endpoints:
-            raise ValueError(
-                "Standings endpoint, {endpoint}, is not applicable. Choose "
-                f"one of the following: {available_endpoints}"
-            )
-
-        url_ = (
-            f"{self.url}/seasons/{self.competition}{season}/"
-            f"rounds/{round_number}/{endpoint}"
-        )
-        r = get_requests(url_)
-        data = r.json()
-        df = pd.json_normalize(data["teams"])
+        url_ = self.make_standings_url(season, round_number, endpoint)
+        r = get_requests(url_, transport=self.transport)
+        data = decode_json(r)
+        df = json_normalize(data["teams"])
+        return df
+
+
+class AsyncStandings(AsyncEuroLeagueData):
+    """
+    The async counterpart of the `Standings` class.
+
+    Args:
+        competition (str, optional): The competition code, inherited from the
+            `AsyncEuroLeagueData` class. Choose one of:
+            - 'E' for Euroleague
+            - 'U' for Eurocup
+            Defaults to "E".
+        transport (AsyncHTTPTransport, optional): The async HTTP transport,
+            inherited from the `AsyncEuroLeagueData` class. Defaults to None.
+    """
+
+    async def get_standings(
+        self,
+        season: int,
+        round_number: int,
+        endpoint: str = "basicstandings",
+    ) -> pd.DataFrame:
+        """
+        The async counterpart of `Standings.get_standings`.
+
+        Args:
+
+            season (int): The start year of the season
+
+            round_number (int): The round number
+
+            endpoint (str, optional): The type of standing.
+            One of the following options
+            - calendarstandings
+            - streaks
+            - aheadbehind
+            - margins
+            - basicstandings
+            Defaults to "basicstandings".
+
+        Raises:
+
+            ValueError: If endpoint is not applicable
+
+        Returns:
+
+            pd.DataFrame: A dataframe with the standings of the teams
+        """
+        url_ = self.make_standings_url(season, round_number, endpoint)
+        r = await get_requests_async(url_, transport=self.transport)
+        data = decode_json(r)
+        df = json_normalize(data["teams"])
         return df
@@ -5,6 +5,7 @@ from .utils import (
     raise_error,
     get_requests
 )
+from .decoding import decode_json, json_normalize
 
 
 class TeamStats(EuroLeagueData):
@@ -92,14 +93,14 @@ class TeamStats(EuroLeagueData):
 
         url_ = f"{self.url}/statistics/teams/{endpoint}"
 
-        r = get_requests(url_, params=params)
-        data = r.json()
+        r = get_requests(url_, params=params, transport=self.transport)
+        data = decode_json(r)
         if data["total"] < len(data["teams"]):
             params["limit"] = len(data["teams"]) + 1
-            r = get_requests(url_, params=params)
-            data = r.json()
-        df = pd.json_normalize(data["teams"])
-        return df
+            r = get_requests(url_, params=params, transport=self.transport)
+            data = decode_json(r)
+        df = json_normalize(data["teams"])
+        return self.apply_schema(df, "team_stats")
 
     def get_team_stats_all_seasons(
         self,
@@ -461,10 +462,10 @@ class TeamStats(EuroLeagueData):
 
         url_ = f"{self.url_v2}/stats/clubs/leaders"
 
-        r = get_requests(url_, params=params)
-        data = r.json()
-        df = pd.json_normalize(data["data"])
-        return df
+        r = get_requests(url_, params=params, transport=self.transport)
+        data = decode_json(r)
+        df = json_normalize(data["data"])
+        return self.apply_schema(df, "team_stats_leaders")
 
     def get_team_stats_leaders_all_seasons(
         self,
@@ -0,0 +1,154 @@
+from typing import Any, Optional
+from contextvars import ContextVar
+from urllib.parse import urlsplit
+import re
+import time
+import pandas as pd
+from .events import EventLog, emit, has_listeners
+
+# the endpoint of the last request of the running thread or task, which the
+# decode and frame stages that follow it are attributed to
+_current_endpoint: ContextVar[Optional[str]] = ContextVar(
+    "current_endpoint", default=None)
+
+URL_PARAMETERS = [
+    (re.compile(r"/competitions/[^/]+"), "/competitions/{competition}"),
+    (re.compile(r"/seasons/[^/]+"), "/seasons/{season}"),
+    (re.compile(r"/games/\d+"), "/games/{gamecode}"),
+    (re.compile(r"/rounds/\d+"), "/rounds/{round}"),
+]
+
+PERCENTILES = [0.5, 0.95, 0.99]
+
+
+def get_url_template(url: str) -> str:
+    """
+    Returns the path of a url with its competition, season, game code and
+    round replaced by placeholders, e.g.
+    "/v3/competitions/{competition}/seasons/{season}/games/{gamecode}/stats",
+    so that the requests of an endpoint are grouped together. The query is
+    dropped, e.g. the season and game code of the live API.
+
+    Args:
+        url (str): The url of the request.
+
+    Returns:
+        str: The url template.
+    """
+    path = urlsplit(url).path
+    for pattern, placeholder in URL_PARAMETERS:
+        path = pattern.sub(placeholder, path)
+    return path
+
+
+def set_current_endpoint(endpoint: Optional[str]) -> None:
+    """Sets the endpoint the following stages are attributed to."""
+    _current_endpoint.set(endpoint)
+
+
+def get_current_endpoint() -> Optional[str]:
+    """The endpoint of the last request of the running thread or task."""
+    return _current_endpoint.get()
+
+
+class StageTimer:
+    """
+    A context manager that emits a "stage" event with the duration of its
+    block, see `time_stage`. The fields can be added in the block, e.g. the
+    number of rows of the built dataframe.
+    """
+
+    def __init__(self, stage: str, **fields: Any):
+        self.stage = stage
+        self.fields = fields
+        self.start: Optional[float] = None
+
+    def __enter__(self):
+        if has_listeners():
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        if self.start is None:
+            return
+        self.fields.setdefault("endpoint", get_current_endpoint())
+        emit(
+            "stage",
+            stage=self.stage,
+            elapsed=time.perf_counter() - self.start,
+            **self.fields
+        )
+
+
+def time_stage(stage: str, **fields: Any) -> StageTimer:
+    """
+    Times a stage of the processing of a response, e.g.
+
+        with time_stage("decode", bytes=len(r.content)):
+            data = json.loads(r.content)
+
+    and emits a "stage" event with its name, endpoint, duration (s) and
+    fields, if anyone listens to the events. The endpoint defaults to that of
+    the last request of the running thread or task.
+
+    Args:
+        stage (str): The name of the stage, e.g. "decode", "frame" or
+            "lineups".
+        fields (Any): The fields of the event, e.g. `bytes` or `endpoint`.
+
+    Returns:
+        StageTimer: The context manager.
+    """
+    return StageTimer(stage, **fields)
+
+
+class TimingLog(EventLog):
+    """
+    Records the timing events of the package in memory, i.e. the requests,
+    the stages of their processing and the collected games, and summarises
+    their durations per endpoint, e.g.
+
+        with TimingLog() as timings:
+            df = pbp.get_game_pbp_data_lineups_single_season(2023)
+        timings.print_summary()
+
+    shows if a season is bound by the network, the JSON decoding, the
+    dataframe building or the lineup reconstruction.
+    """
+
+    def __init__(self):
+        super().__init__(events=["request", "stage", "game"])
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Summarises the recorded durations per stage and endpoint, where the
+        stage of the requests is "request" and that of the games is "game".
+
+        Returns:
+            pd.DataFrame: The number of events, the total, p50, p95 and p99
+                durations in milliseconds, and the bytes, indexed by stage
+                and endpoint.
+        """
+        columns = ["count", "total_ms"] + [
+            f"p{round(q * 100)}_ms" for q in PERCENTILES] + ["bytes"]
+        if not self.records:
+            return pd.DataFrame(columns=columns)
+        df = pd.DataFrame(self.records)
+        for col, default in [("stage", None), ("endpoint", ""), ("bytes", 0)]:
+            if col not in df.columns:
+                df[col] = default
+        df["stage"] = df["stage"].fillna(df["event"])
+        df["endpoint"] = df["endpoint"].fillna("")
+        df["bytes"] = df["bytes"].fillna(0)
+        df["elapsed_ms"] = df["elapsed"] * 1e3
+        grouped = df.groupby(["stage", "endpoint"], sort=True)
+        summary = grouped["elapsed_ms"].agg(["count", "sum"])
+        summary.columns = columns[:2]
+        for q, col in zip(PERCENTILES, columns[2:-1]):
+            summary[col] = grouped["elapsed_ms"].quantile(q)
+        summary["bytes"] = grouped["bytes"].sum().astype("int64")
+        return summary
+
+    def print_summary(self) -> None:
+        """Prints the summary of the recorded durations."""
+        print(self.summary().round(2).to_string())
@@ -0,0 +1,444 @@
+from typing import Optional, Mapping, TYPE_CHECKING
+import time
+import threading
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from .events import emit
+
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .rate_limit import RateLimiter, RetryPolicy
+
+logger = logging.getLogger(__name__)
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+# the time in seconds between the attempts of a coroutine to send a request
+# within the number of requests in flight of an adaptive rate limiter
+ACQUIRE_INTERVAL = 0.01
+
+
+class HTTPTransport:
+    """
+    A pooled, keep-alive HTTP transport used by all `EuroLeagueData`
+    classes. A single `requests.Session` is kept open, so that consecutive
+    requests to the same host reuse the TCP/TLS connection.
+
+    Any object with a `get(url, params=None, headers=None)` method returning
+    a `requests.Response`-like object can be used instead, e.g. a test
+    double.
+
+    Args:
+        pool_connections (int, optional): The number of hosts to keep a
+            connection pool for. Defaults to 10.
+        pool_maxsize (int, optional): The maximum number of connections kept
+            alive per host. Should be at least the number of concurrent
+            requests. Defaults to 10.
+        timeout (float, optional): The request timeout in seconds.
+            Defaults to 60.
+        cache (ResponseCache, optional): An on-disk response cache, which is
+            looked up before sending a request. Defaults to None, i.e. no
+            caching.
+        rate_limiter (RateLimiter, optional): A client-side rate limiter,
+            applied to every request sent. Defaults to None.
+        retry (RetryPolicy, optional): The retry policy of failed requests,
+            e.g. 429 and 5xx responses. Defaults to None, i.e. no retries.
+    """
+    DEFAULT_HEADERS = {
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        timeout: float = 60,
+        cache: Optional["ResponseCache"] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        retry: Optional["RetryPolicy"] = None
+    ):
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.session = requests.Session()
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None
+    ) -> requests.models.Response:
+        """
+        Sends a GET request over the pooled session. The response cache is
+        looked up first, then the request is rate-limited and retried
+        according to the transport's settings.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables in get requests.
+                Defaults to None.
+
+            headers (dict, optional): the `header` variable in get requests.
+                Defaults to None.
+
+        Returns:
+
+            requests.models.Response: The response object.
+        """
+        if self.cache is not None:
+            r = self.cache.get(url, params)
+            if r is not None:
+                return r
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                time.sleep(self.rate_limiter.reserve(url))
+            try:
+                r = self.send(url, params, headers)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = get_retry_delay(
+                    url, attempt, None, self.rate_limiter, self.retry)
+                if delay is None:
+                    raise
+            else:
+                delay = get_retry_delay(
+                    url, attempt, r, self.rate_limiter, self.retry)
+                if delay is None:
+                    break
+            time.sleep(delay)
+            attempt += 1
+        if self.cache is not None:
+            self.cache.set(url, params, r)
+        return r
+
+    def send(
+        self,
+        url: str,
+        params: Optional[dict],
+        headers: Optional[dict]
+    ) -> requests.models.Response:
+        """
+        Sends a single GET request, within the number of requests in flight
+        of the rate limiter, if any.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables in get requests.
+
+            headers (dict, optional): the `header` variable in get requests.
+
+        Returns:
+
+            requests.models.Response: The response object.
+        """
+        if self.rate_limiter is None:
+            return self.session.get(
+                url, params=params, headers=headers, timeout=self.timeout)
+        self.rate_limiter.acquire(url)
+        try:
+            return self.session.get(
+                url, params=params, headers=headers, timeout=self.timeout)
+        finally:
+            self.rate_limiter.release(url)
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def get_retry_delay(
+    url: str,
+    attempt: int,
+    response: Optional[requests.models.Response],
+    rate_limiter: Optional["RateLimiter"] = None,
+    retry: Optional["RetryPolicy"] = None
+) -> Optional[float]:
+    """
+    Feeds the outcome of a request to the rate limiter and returns the
+    waiting time before retrying it, if it should be retried.
+
+    Args:
+
+        url (str): The url of the request.
+
+        attempt (int): The number of retries so far.
+
+        response (requests.models.Response, optional): The response, or None
+            if the request failed to connect or timed out.
+
+        rate_limiter (RateLimiter, optional): The rate limiter of the
+            transport. Defaults to None.
+
+        retry (RetryPolicy, optional): The retry policy of the transport.
+            Defaults to None.
+
+    Returns:
+
+        Optional[float]: The waiting time in seconds, or None if the request
+            should not be retried.
+    """
+    status_code = None if response is None else response.status_code
+    if rate_limiter is not None:
+        rate_limiter.on_response(url, status_code)
+    if retry is None or not retry.is_retryable(attempt, response):
+        return None
+    delay = retry.get_delay(attempt, response)
+    logger.warning(
+        "Request to %s failed with status %s. Retry %d/%d in %.2fs.",
+        url, status_code, attempt + 1, retry.max_retries, delay
+    )
+    emit("retry", url=url, status=status_code, attempt=attempt + 1,
+         delay=delay)
+    return delay
+
+
+def get_default_transport() -> HTTPTransport:
+    """
+    Returns the transport shared by all `EuroLeagueData` instances that were
+    not given a transport explicitly. It is created on first use.
+
+    Returns:
+
+        HTTPTransport: The shared transport.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = HTTPTransport()
+    return _default_transport
+
+
+def build_response(
+    url: str,
+    status_code: int,
+    content: bytes,
+    headers: Optional[Mapping[str, str]] = None,
+    reason: Optional[str] = None,
+    encoding: Optional[str] = None
+) -> requests.models.Response:
+    """
+    Builds a `requests.Response` from a response that was not received via
+    `requests`, so that it can be handled the same way, e.g. `r.json()`,
+    `r.content` and `r.raise_for_status()`.
+
+    Args:
+
+        url (str): The url of the request.
+
+        status_code (int): The HTTP status code.
+
+        content (bytes): The (decompressed) response body.
+
+        headers (Mapping[str, str], optional): The response headers.
+            Defaults to None.
+
+        reason (str, optional): The HTTP reason phrase. Defaults to None.
+
+        encoding (str, optional): The encoding of the body. Defaults to None.
+
+    Returns:
+
+        requests.models.Response: The response object.
+    """
+    r = requests.models.Response()
+    r.url = url
+    r.status_code = status_code
+    r._content = content
+    r.headers = CaseInsensitiveDict(headers or {})
+    r.reason = reason  # type: ignore
+    r.encoding = encoding
+    return r
+
+
+class AsyncHTTPTransport:
+    """
+    A non-blocking, pooled HTTP transport used by the `Async*` classes. It is
+    backed by an `aiohttp.ClientSession`, which is created on first use in the
+    running event loop. `aiohttp` is an optional dependency, install it with
+    `pip install euroleague-api[async]`.
+
+    Args:
+        limit_per_host (int, optional): The maximum number of simultaneous
+            connections per host. Defaults to 10.
+        timeout (float, optional): The request timeout in seconds.
+            Defaults to 60.
+        cache (ResponseCache, optional): An on-disk response cache, which is
+            looked up before sending a request. Defaults to None, i.e. no
+            caching.
+        rate_limiter (RateLimiter, optional): A client-side rate limiter,
+            applied to every request sent. Defaults to None.
+        retry (RetryPolicy, optional): The retry policy of failed requests,
+            e.g. 429 and 5xx responses. Defaults to None, i.e. no retries.
+    """
+
+    def __init__(
+        self,
+        limit_per_host: int = 10,
+        timeout: float = 60,
+        cache: Optional["ResponseCache"] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        retry: Optional["RetryPolicy"] = None
+    ):
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.session = None
+
+    def get_session(self):
+        """
+        Returns the `aiohttp.ClientSession`, creating it if needed.
+
+        Raises:
+            ImportError: If `aiohttp` is not installed.
+        """
+        if self.session is None or self.session.closed:
+            try:
+                import aiohttp
+            except ImportError as exc:
+                raise ImportError(
+                    "The async classes require aiohttp. Install it with "
+                    "`pip install euroleague-api[async]`."
+                ) from exc
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.limit_per_host)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=HTTPTransport.DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None
+    ) -> requests.models.Response:
+        """
+        Sends a GET request without blocking the event loop.
+
+        Args:
+
+            url (str): The url of the request.
+
+            params (dict, optional): The `params` variables in get requests.
+                None values are dropped, as in `requests`. Defaults to None.
+
+            headers (dict, optional): the `header` variable in get requests.
+                Defaults to None.
+
+        Returns:
+
+            requests.models.Response: The response object.
+        """
+        if self.cache is not None:
+            r = self.cache.get(url, params)
+            if r is not None:
+                return r
+        query = None
+        if params:
+            query = {k: str(v) for k, v in params.items() if v is not None}
+        session = self.get_session()
+        import asyncio
+        import aiohttp
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve(url))
+            try:
+                r = await self.send(session, url, query, headers)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                delay = get_retry_delay(
+                    url, attempt, None, self.rate_limiter, self.retry)
+                if delay is None:
+                    raise
+            else:
+                delay = get_retry_delay(
+                    url, attempt, r, self.rate_limiter, self.retry)
+                if delay is None:
+                    break
+            await asyncio.sleep(delay)
+            attempt += 1
+        if self.cache is not None:
+            self.cache.set(url, params, r)
+        return r
+
+    async def send(
+        self,
+        session,
+        url: str,
+        query: Optional[dict],
+        headers: Optional[dict]
+    ) -> requests.models.Response:
+        """
+        Sends a single GET request, within the number of requests in flight
+        of the rate limiter, if any.
+
+        Args:
+
+            session (aiohttp.ClientSession): The session.
+
+            url (str): The url of the request.
+
+            query (dict, optional): The query parameters.
+
+            headers (dict, optional): the `header` variable in get requests.
+
+        Returns:
+
+            requests.models.Response: The response object.
+        """
+        import asyncio
+        if self.rate_limiter is not None:
+            while not self.rate_limiter.try_acquire(url):
+                await asyncio.sleep(ACQUIRE_INTERVAL)
+        try:
+            async with session.get(
+                    url, params=query, headers=headers) as resp:
+                content = await resp.read()
+                return build_response(
+                    url=str(resp.url),
+                    status_code=resp.status,
+                    content=content,
+                    headers=resp.headers,
+                    reason=resp.reason,
+                    encoding=resp.charset,
+                )
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release(url)
+
+    async def close(self) -> None:
+        """Closes the session and its pooled connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
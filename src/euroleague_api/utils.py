@@ -1,20 +1,51 @@
-from typing import Optional, List, Callable
+from typing import (
+    Optional, List, Dict, Callable, Awaitable, Any, Iterator, Deque
+)
+from collections import deque
+from itertools import islice
+from functools import partial
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
 import requests
 from requests.exceptions import HTTPError
 from json.decoder import JSONDecodeError
 import logging
 import pandas as pd
 import numpy as np
-from tqdm.auto import tqdm
+from .lineups import (
+    get_starting_fives,
+    reconstruct_lineups,
+    make_lineup_columns,
+    LineupRegistry,
+    LINEUP_FORMATS,
+    get_default_registry,
+    validate_on_court_players
+)
+from .transport import (
+    HTTPTransport,
+    AsyncHTTPTransport,
+    get_default_transport
+)
+from .schemas import concat_frames
+from .events import emit, has_listeners, record_events
+from .timing import (
+    get_url_template,
+    get_current_endpoint,
+    set_current_endpoint,
+    time_stage
+)
 
-logging.basicConfig(encoding='utf-8', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# the endpoint the lineup reconstruction is attributed to
+PBP_ENDPOINT = "/api/PlaybyPlay"
+
 
 def get_requests(
     url: str,
     params: dict = {},
-    headers: dict = {"Accept": "application/json"}
+    headers: dict = {"Accept": "application/json"},
+    transport: Optional[HTTPTransport] = None
 ) -> requests.models.Response:
     """
     A wrapper to `requests.get()` which handles unsuccesful requests too.
@@ -29,6 +60,10 @@ def get_requests(
         headers (dict, optional): the `header` variable in get requests.
             Defaults to {"Accept": "application/json"}.
 
+        transport (HTTPTransport, optional): The transport that sends the
+            request. Defaults to None, which uses the shared, pooled
+            transport.
+
     Raises:
 
         Requests Error: If get request was not succesful
@@ -37,7 +72,17 @@ def get_requests(
 
         requests.models.Response: The response object.
     """
-    r = requests.get(url, params=params, headers=headers, timeout=60)
+    if transport is None:
+        transport = get_default_transport()
+    if has_listeners():
+        endpoint = get_url_template(url)
+        set_current_endpoint(endpoint)
+        emit("request_start", url=url, endpoint=endpoint, params=params)
+        start = time.perf_counter()
+        r = transport.get(url, params=params, headers=headers)
+        emit_request(url, endpoint, params, r, time.perf_counter() - start)
+    else:
+        r = transport.get(url, params=params, headers=headers)
 
     if r.status_code != 200:
         r.raise_for_status()
@@ -45,6 +90,87 @@ def get_requests(
     return r
 
 
+async def get_requests_async(
+    url: str,
+    params: dict = {},
+    headers: dict = {"Accept": "application/json"},
+    *,
+    transport: AsyncHTTPTransport
+) -> requests.models.Response:
+    """
+    The async counterpart of `get_requests`, which does not block the event
+    loop.
+
+    Args:
+
+        url (str): The url of the request.
+
+        params (dict, optional): The `params` variables in get requests.
+            Defaults to {}.
+
+        headers (dict, optional): the `header` variable in get requests.
+            Defaults to {"Accept": "application/json"}.
+
+        transport (AsyncHTTPTransport): The transport that sends the request.
+
+    Raises:
+
+        Requests Error: If get request was not succesful
+
+    Returns:
+
+        requests.models.Response: The response object.
+    """
+    if has_listeners():
+        endpoint = get_url_template(url)
+        set_current_endpoint(endpoint)
+        emit("request_start", url=url, endpoint=endpoint, params=params)
+        start = time.perf_counter()
+        r = await transport.get(url, params=params, headers=headers)
+        emit_request(url, endpoint, params, r, time.perf_counter() - start)
+    else:
+        r = await transport.get(url, params=params, headers=headers)
+
+    if r.status_code != 200:
+        r.raise_for_status()
+
+    return r
+
+
+def progress_bar(**kwargs) -> Any:
+    """
+    Makes a `tqdm.auto` progress bar. `tqdm.auto` is imported on first use,
+    since it probes the notebook environment, which slows down the import
+    of the package.
+
+    Args:
+        kwargs: The keyword arguments of `tqdm`, e.g. `total` and `desc`.
+
+    Returns:
+        tqdm: The progress bar.
+    """
+    from tqdm.auto import tqdm
+
+    return tqdm(**kwargs)
+
+
+def progress_range(start: int, stop: int, **kwargs) -> Any:
+    """
+    The counterpart of `progress_bar` for `tqdm.auto.trange`.
+
+    Args:
+        start (int): The first value.
+        stop (int): The end value, excluded.
+        kwargs: The keyword arguments of `tqdm`, e.g. `desc`.
+
+    Returns:
+        tqdm: The range with a progress bar.
+    """
+    from tqdm.auto import trange
+
+    return trange(start, stop, **kwargs)
+
+
 def raise_error(
     var: Optional[str],
     descripitve_var: str,
@@ -81,10 +207,197 @@ def raise_error(
     return
 
 
+def emit_request(
+    url: str,
+    endpoint: str,
+    params: Optional[dict],
+    r: requests.models.Response,
+    elapsed: float
+) -> None:
+    """A function that emits the "request" event of a response, see
+    `events.emit`.
+
+    Args:
+        url (str): The url of the request.
+        endpoint (str): The url template of the request, see
+            `timing.get_url_template`.
+        params (dict, optional): The `params` variables of the request.
+        r (requests.models.Response): The response object.
+        elapsed (float): The time of the request in seconds, including the
+            retries.
+    """
+    emit(
+        "request",
+        url=url,
+        endpoint=endpoint,
+        params=params,
+        status=r.status_code,
+        bytes=len(r.content),
+        elapsed=elapsed
+    )
+
+
+def emit_game(
+    fun: Callable[..., Any],
+    season: int,
+    game_code: int,
+    start: float,
+    df: Optional[pd.DataFrame] = None
+) -> None:
+    """A function that emits the "game" event of a collected game, see
+    `events.emit`. It is attributed to the endpoint of the last request of
+    the game.
+
+    Args:
+        fun (Callable[..., Any]): The function that collected the game.
+        season (int): The start year of the season.
+        game_code (int): The game code of the game.
+        start (float): The `time.perf_counter` at the start of the game.
+        df (pd.DataFrame, optional): The game's data. Defaults to None,
+            i.e. the game failed.
+    """
+    if not has_listeners():
+        return
+    emit(
+        "game",
+        endpoint=get_current_endpoint(),
+        function=getattr(fun, "__qualname__", repr(fun)),
+        season=season,
+        gamecode=game_code,
+        elapsed=time.perf_counter() - start,
+        rows=0 if df is None else len(df),
+        ok=df is not None
+    )
+
+
+def log_game_error(err: Exception, game_code: int, season: int) -> None:
+    """A function that logs an error raised while collecting the data of a
+    single game.
+
+    Args:
+        err (Exception): The raised error
+        game_code (int): The game code of the game
+        season (int): The start year of the season.
+    """
+    if isinstance(err, HTTPError):
+        logger.error(
+            "HTTPError: Didn't find gamecode %s for season %s. \nError "
+            "message %s. \nSkip and continue.", game_code, season, err
+        )
+    elif isinstance(err, JSONDecodeError):
+        logger.error(
+            "JSONDecodeError: Game code, %s, season %s, did not return "
+            "valid JSON data. \nSkip and continue.", game_code, season
+        )
+    else:
+        logger.error(
+            "\nSomething went wrong for game %s, season %s.\nError "
+            "message: %s. \nSkip and continue", game_code, season, err
+        )
+    emit("game_error", season=season, gamecode=game_code,
+         error=type(err).__name__, message=str(err))
+
+
+def add_game_row_columns(
+    df: pd.DataFrame,
+    row: pd.Series,
+    season: int
+) -> Optional[pd.DataFrame]:
+    """A function that adds the Phase and Round columns of the game codes
+    dataframe row to the game's data.
+
+    Args:
+        df (pd.DataFrame): The game's data
+        row (pd.Series): A row of the game codes dataframe
+        season (int): The start year of the season.
+
+    Returns:
+        Optional[pd.DataFrame]: The game's data, or None if it is empty.
+    """
+    if df.empty:
+        logger.warning(
+            "Game %s, season %s returned no data.", row["gameCode"], season
+        )
+        emit("game_empty", season=season, gamecode=row["gameCode"])
+        return None
+    if ("Phase" not in df.columns) and ("Phase" in row):
+        df.insert(1, "Phase", row["Phase"])
+    if ("Round" not in df.columns) and ("Round" in row):
+        df.insert(2, "Round", row["Round"])
+    return df
+
+
+def get_game_data_from_row(
+    row: pd.Series,
+    season: int,
+    fun: Callable[[int, int], pd.DataFrame],
+    on_error: Optional[Callable[[pd.Series, Exception], None]] = None
+) -> Optional[pd.DataFrame]:
+    """A function that collects the data of a single game, given its row in
+    the game codes dataframe. Errors are logged and skipped.
+
+    Args:
+        row (pd.Series): A row of the game codes dataframe
+        season (int, optional): The start year of the season.
+        fun (Callable[[int, int], pd.DataFrame]): A callable function that
+            determines that type of data to be collected.
+        on_error (Callable[[pd.Series, Exception], None], optional): A
+            function called with the row and the error of a failed game,
+            e.g. to record it. Defaults to None.
+
+    Returns:
+        Optional[pd.DataFrame]: A dataframe with the game's data, or None if
+            the game returned no data or failed.
+    """
+    game_code = row["gameCode"]
+    start = time.perf_counter()
+    try:
+        df = fun(season, game_code)
+    except Exception as e:  # noqa: E722
+        log_game_error(e, game_code, season)
+        emit_game(fun, season, game_code, start)
+        if on_error is not None:
+            on_error(row, e)
+        return None
+    emit_game(fun, season, game_code, start, df)
+    return add_game_row_columns(df, row, season)
+
+
+async def get_game_data_from_row_async(
+    row: pd.Series,
+    season: int,
+    fun: Callable[[int, int], Awaitable[pd.DataFrame]]
+) -> Optional[pd.DataFrame]:
+    """The async counterpart of `get_game_data_from_row`.
+
+    Args:
+        row (pd.Series): A row of the game codes dataframe
+        season (int, optional): The start year of the season.
+        fun (Callable[[int, int], Awaitable[pd.DataFrame]]): A coroutine
+            function that determines that type of data to be collected.
+
+    Returns:
+        Optional[pd.DataFrame]: A dataframe with the game's data, or None if
+            the game returned no data or failed.
+    """
+    game_code = row["gameCode"]
+    start = time.perf_counter()
+    try:
+        df = await fun(season, game_code)
+    except Exception as e:  # noqa: E722
+        log_game_error(e, game_code, season)
+        emit_game(fun, season, game_code, start)
+        return None
+    emit_game(fun, season, game_code, start, df)
+    return add_game_row_columns(df, row, season)
+
+
 def get_data_over_collection_of_games(
     game_codes_df,
     season: int,
-    fun: Callable[[int, int], pd.DataFrame]
+    fun: Callable[[int, int], pd.DataFrame],
+    max_workers: int = 1,
+    on_error: Optional[Callable[[pd.Series, Exception], None]] = None
 ) -> pd.DataFrame:
     """A function that collects data over a collection of games given their
     game codes. It is a wrapper function that calls the `fun` function
@@ -102,50 +415,376 @@ def get_data_over_collection_of_games(
             - get_game_boxscore_quarter_data
             - get_player_boxscore_stats_data
             - get_game_metadata
+        max_workers (int, optional): The maximum number of games fetched
+            concurrently. Defaults to 1, i.e. games are fetched sequentially.
+            The output is in the order of `game_codes_df` regardless.
+        on_error (Callable[[pd.Series, Exception], None], optional): A
+            function called with the row and the error of each failed game,
+            e.g. to record the failed games for a later retry.
+            Defaults to None, i.e. failed games are only logged.
+
+    Returns:
+        pd.DataFrame: A dataframe with the corresponding data of all
+            games in the collection.
+    """
+    results = map_over_game_rows(
+        game_codes_df,
+        season,
+        lambda row: get_game_data_from_row(row, season, fun, on_error),
+        max_workers=max_workers
+    )
+    return concat_game_data(results)
 
 
+def map_over_game_rows(
+    game_codes_df: pd.DataFrame,
+    season: int,
+    fun: Callable[[pd.Series], Any],
+    max_workers: int = 1
+) -> List[Any]:
+    """A function that calls `fun` on every row of the game codes dataframe,
+    with a bounded pool of worker threads.
+
+    Args:
+        game_codes_df (pd.DataFrame): A dataframe of the game codes to collect
+        season (int): The start year of the season, for the progress bar.
+        fun (Callable[[pd.Series], Any]): A callable function of a row.
+        max_workers (int, optional): The maximum number of rows processed
+            concurrently. Defaults to 1, i.e. sequentially.
+
+    Raises:
+        ValueError: If `max_workers` is not positive.
+
+    Returns:
+        List[Any]: The results of `fun`, in the order of `game_codes_df`.
+    """
+    rows = [row for _, row in game_codes_df.iterrows()]
+    return map_with_workers(
+        fun, rows, max_workers=max_workers, desc=f"Season {season}")
+
+
+def map_with_workers(
+    fun: Callable[[Any], Any],
+    items: List[Any],
+    max_workers: int = 1,
+    desc: Optional[str] = None
+) -> List[Any]:
+    """A function that calls `fun` on every item of a list, with a bounded
+    pool of worker threads and a progress bar.
+
+    Args:
+        fun (Callable[[Any], Any]): A callable function of an item.
+        items (List[Any]): The items.
+        max_workers (int, optional): The maximum number of items processed
+            concurrently. Defaults to 1, i.e. sequentially.
+        desc (str, optional): The description of the progress bar.
+            Defaults to None.
+
+    Raises:
+        ValueError: If `max_workers` is not positive.
+
+    Returns:
+        List[Any]: The results of `fun`, in the order of `items`.
+    """
+    return list(iter_with_workers(fun, items, max_workers, desc))
+
+
+def map_with_processes(
+    fun: Callable[..., Any],
+    items: List[tuple],
+    processes: int = 1,
+    desc: Optional[str] = None
+) -> List[Any]:
+    """A function that calls `fun` on the arguments of every item of a list,
+    with a pool of worker processes and a progress bar. It is meant for CPU
+    bound work, e.g. parsing, where threads are serialised by the GIL. `fun`
+    and the items must be picklable, i.e. `fun` is a module-level function.
+
+    Args:
+        fun (Callable[..., Any]): A module-level function.
+        items (List[tuple]): The arguments of each call.
+        processes (int, optional): The number of worker processes. Defaults
+            to 1, i.e. sequentially in the current process.
+        desc (str, optional): The description of the progress bar.
+            Defaults to None.
+
+    Raises:
+        ValueError: If `processes` is not positive.
+
+    Returns:
+        List[Any]: The results of `fun`, in the order of `items`.
+    """
+    if processes < 1:
+        raise ValueError(
+            f"processes, {processes}, must be a positive integer."
+        )
+    with progress_bar(total=len(items), desc=desc, leave=True) as pbar:
+        if processes == 1 or not items:
+            results = []
+            for args in items:
+                results.append(fun(*args))
+                pbar.update()
+            return results
+        chunksize = max(1, len(items) // (4 * processes))
+        # the events of the workers are sent back with their results
+        forward_events = has_listeners()
+        if forward_events:
+            fun = partial(record_events, fun)
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = []
+            for result in executor.map(
+                    fun, *zip(*items), chunksize=chunksize):
+                if forward_events:
+                    result, records = result
+                    for record in records:
+                        emit(**record)
+                results.append(result)
+                pbar.update()
+            return results
+
+
+def iter_with_workers(
+    fun: Callable[[Any], Any],
+    items: List[Any],
+    max_workers: int = 1,
+    desc: Optional[str] = None
+) -> Iterator[Any]:
+    """A function that lazily calls `fun` on every item of a list, with a
+    bounded pool of worker threads and a progress bar. At most
+    `2 * max_workers` results are pending at any time, so that memory stays
+    bounded when the consumer is slower than the workers.
+
+    Args:
+        fun (Callable[[Any], Any]): A callable function of an item.
+        items (List[Any]): The items.
+        max_workers (int, optional): The maximum number of items processed
+            concurrently. Defaults to 1, i.e. sequentially.
+        desc (str, optional): The description of the progress bar.
+            Defaults to None.
+
+    Raises:
+        ValueError: If `max_workers` is not positive.
+
+    Returns:
+        Iterator[Any]: The results of `fun`, in the order of `items`.
+    """
+    if max_workers < 1:
+        raise ValueError(
+            f"max_workers, {max_workers}, must be a positive integer."
+        )
+    pbar = progress_bar(total=len(items), desc=desc, leave=True)
+    if max_workers == 1:
+        return iter_sequentially(fun, items, pbar)
+    return iter_concurrently(fun, items, max_workers, pbar)
+
+
+def iter_sequentially(
+    fun: Callable[[Any], Any],
+    items: List[Any],
+    pbar: Any
+) -> Iterator[Any]:
+    """The sequential implementation of `iter_with_workers`."""
+    with pbar:
+        for item in items:
+            yield fun(item)
+            pbar.update()
+
+
+def iter_concurrently(
+    fun: Callable[[Any], Any],
+    items: List[Any],
+    max_workers: int,
+    pbar: Any
+) -> Iterator[Any]:
+    """The threaded implementation of `iter_with_workers`."""
+    pending: Deque[Future] = deque()
+    remaining = iter(items)
+    with pbar, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in islice(remaining, 2 * max_workers):
+            pending.append(executor.submit(fun, item))
+        while pending:
+            result = pending.popleft().result()
+            for item in islice(remaining, 1):
+                pending.append(executor.submit(fun, item))
+            pbar.update()
+            yield result
+
+
+def iter_data_over_collection_of_games(
+    game_codes_df,
+    season: int,
+    fun: Callable[[int, int], pd.DataFrame],
+    max_workers: int = 1
+) -> Iterator[pd.DataFrame]:
+    """The streaming counterpart of `get_data_over_collection_of_games`. It
+    yields the data of each game as soon as it is collected, in the order of
+    `game_codes_df`, skipping the games that returned no data.
+
+    Args:
+        game_codes_df (pd.DataFrame): A dataframe of the game codes to collect
+        season (int, optional): The start year of the season.
+        fun (Callable[[int, int], pd.DataFrame]): A callable function that
+            determines that type of data to be collected.
+        max_workers (int, optional): The maximum number of games fetched
+            concurrently. Defaults to 1, i.e. games are fetched sequentially.
+
+    Returns:
+        Iterator[pd.DataFrame]: The dataframe of each game.
+    """
+    rows = [row for _, row in game_codes_df.iterrows()]
+    results = iter_with_workers(
+        lambda row: get_game_data_from_row(row, season, fun),
+        rows,
+        max_workers=max_workers,
+        desc=f"Season {season}"
+    )
+    return (df for df in results if df is not None)
+
+
+def get_game_datasets_from_row(
+    row: pd.Series,
+    season: int,
+    fun: Callable[[int, int], Dict[str, pd.DataFrame]]
+) -> Optional[Dict[str, Optional[pd.DataFrame]]]:
+    """A function that collects several datasets of a single game, given its
+    row in the game codes dataframe. Errors are logged and skipped.
+
+    Args:
+        row (pd.Series): A row of the game codes dataframe
+        season (int, optional): The start year of the season.
+        fun (Callable[[int, int], Dict[str, pd.DataFrame]]): A callable
+            function that returns the game's dataframes keyed by dataset.
+
+    Returns:
+        Optional[Dict[str, Optional[pd.DataFrame]]]: The game's dataframes,
+            where an empty dataframe is None, or None if the game failed.
+    """
+    game_code = row["gameCode"]
+    try:
+        datasets = fun(season, game_code)
+    except Exception as e:  # noqa: E722
+        log_game_error(e, game_code, season)
+        return None
+    return {
+        name: add_game_row_columns(df, row, season)
+        for name, df in datasets.items()
+    }
+
+
+def get_datasets_over_collection_of_games(
+    game_codes_df,
+    season: int,
+    fun: Callable[[int, int], Dict[str, pd.DataFrame]],
+    max_workers: int = 1
+) -> Dict[str, pd.DataFrame]:
+    """A function that collects several datasets over a collection of games
+    given their game codes, e.g. all boxscore tables from a single request
+    per game.
+
+    Args:
+        game_codes_df (pd.DataFrame): A dataframe of the game codes to collect
+        season (int, optional): The start year of the season.
+        fun (Callable[[int, int], Dict[str, pd.DataFrame]]): A callable
+            function that returns the dataframes of a game keyed by dataset,
+            e.g. `get_boxscore_bundle`.
+        max_workers (int, optional): The maximum number of games fetched
+            concurrently. Defaults to 1, i.e. games are fetched sequentially.
+
+    Returns:
+        Dict[str, pd.DataFrame]: A dataframe per dataset with the data of all
+            games in the collection.
+    """
+    results = map_over_game_rows(
+        game_codes_df,
+        season,
+        lambda row: get_game_datasets_from_row(row, season, fun),
+        max_workers=max_workers
+    )
+    return concat_game_datasets(results)
+
+
+def concat_game_datasets(
+    results: List[Optional[Dict[str, Optional[pd.DataFrame]]]]
+) -> Dict[str, pd.DataFrame]:
+    """A function that concatenates the datasets of a collection of games,
+    skipping the games that failed.
+
+    Args:
+        results (List[Optional[Dict[str, Optional[pd.DataFrame]]]]): The
+            datasets of each game
+
+    Returns:
+        Dict[str, pd.DataFrame]: A dataframe per dataset with the data of all
+            games.
+    """
+    names: List[str] = []
+    for datasets in results:
+        for name in datasets or {}:
+            if name not in names:
+                names.append(name)
+    return {
+        name: concat_game_data(
+            [datasets.get(name) for datasets in results if datasets])
+        for name in names
+    }
+
+
+async def get_data_over_collection_of_games_async(
+    game_codes_df,
+    season: int,
+    fun: Callable[[int, int], Awaitable[pd.DataFrame]],
+    max_workers: int = 10
+) -> pd.DataFrame:
+    """The async counterpart of `get_data_over_collection_of_games`. All
+    games are scheduled on the running event loop, with at most
+    `max_workers` requests in flight at any time.
+
+    Args:
+        game_codes_df (pd.DataFrame): A dataframe of the game codes to collect
+        season (int, optional): The start year of the season.
+        fun (Callable[[int, int], Awaitable[pd.DataFrame]]): A coroutine
+            function that determines that type of data to be collected.
+        max_workers (int, optional): The maximum number of games fetched
+            concurrently. Defaults to 10.
+
     Returns:
         pd.DataFrame: A dataframe with the corresponding data of all
             games in the collection.
     """
-    data_list = []
-    for _, row in tqdm(game_codes_df.iterrows(),
-                       total=game_codes_df.shape[0],
-                       desc=f"Season {season}", leave=True):
-        game_code = row["gameCode"]
-        try:
-            df = fun(season, game_code)
-            if df.empty:
-                logger.warning(
-                    f"Game {game_code}, season {season} returned no data."
-                )
-                continue
-            if ("Phase" not in df.columns) and ("Phase" in row):
-                df.insert(1, "Phase", row["Phase"])
-            if ("Round" not in df.columns) and ("Round" in row):
-                df.insert(2, "Round", row["Round"])
-            data_list.append(df)
-        except HTTPError as err:
-            logger.error(
-                f"HTTPError: Didn't find gamecode {game_code} for season "
-                f"{season}. \nError message {err}. "
-                "\nSkip and continue."
-            )
-        except JSONDecodeError:
-            logger.error(
-                f"JSONDecodeError: Game code, {game_code}, "
-                f"season {season}, did not return valid JSON data. "
-                "\nSkip and continue."
-            )
-        except Exception as e:  # noqa: E722
-            logger.error(
-                f"\nSomething went wrong for game {game_code}, "
-                f"season {season}.\nError message: {e}. "
-                "\nSkip and continue"
-            )
+    if max_workers < 1:
+        raise ValueError(
+            f"max_workers, {max_workers}, must be a positive integer."
+        )
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def bounded(row):
+        async with semaphore:
+            return await get_game_data_from_row_async(row, season, fun)
+
+    rows = [row for _, row in game_codes_df.iterrows()]
+    # `gather` returns the results in the order of the input rows
+    results = await asyncio.gather(*(bounded(row) for row in rows))
+    return concat_game_data(results)
+
+
+def concat_game_data(results: List[Optional[pd.DataFrame]]) -> pd.DataFrame:
+    """A function that concatenates the data of a collection of games,
+    skipping the games that returned no data.
+
+    Args:
+        results (List[Optional[pd.DataFrame]]): The data of each game
+
+    Returns:
+        pd.DataFrame: A dataframe with the data of all games.
+    """
+    data_list = [df for df in results if df is not None]
 
     if data_list:
-        data_df = pd.concat(data_list, axis=0)
+        data_df = concat_frames(data_list)
         data_df.reset_index(drop=True, inplace=True)
     else:
         data_df = pd.DataFrame([])
@@ -156,6 +795,8 @@ def get_pbp_lineups(
     pbp_df: pd.DataFrame,
     boxscore_df: pd.DataFrame,
     validate=True,
+    lineup_format: str = "list",
+    registry: Optional[LineupRegistry] = None
 ) -> pd.DataFrame:
     """
     A function that extracts the lineups from play-by-play data.
@@ -165,67 +806,28 @@ def get_pbp_lineups(
         pbp_df (pd.DataFrame): The play-by-play dataframe.
         boxscore_df (pd.DataFrame): The boxscore dataframe.
         validate (bool, optional): If to validate if the on-court players
+        lineup_format (str, optional): The representation of the lineups.
+            Available values:
+            - list: `Lineup_A` and `Lineup_B` hold a list of five players.
+            - id: `Lineup_A` and `Lineup_B` hold int64 lineup ids, see
+              `LineupRegistry`. The players of each id are in the lineup
+              table of the registry, i.e. `registry.to_frame()`.
+            - columns: five categorical player columns per team, i.e.
+              `Lineup_A_1` to `Lineup_A_5` and `Lineup_B_1` to `Lineup_B_5`.
+            Defaults to "list".
+        registry (LineupRegistry, optional): The registry of the lineup ids.
+            Defaults to None, i.e. the default registry, see
+            `get_default_registry`.
+
+    Raises:
+
+        ValueError: If lineup_format value is not valid.
 
     Returns:
 
         pd.DataFrame: A dataframe with the lineups.
     """
-
-    def process_sub(five, player, sub_type):
-        opp_sub_type = "OUT" if sub_type == "IN" else "IN"
-        potential_indx = (
-            pbp_df.loc[idx + 1:].index[
-                (pbp_df.loc[idx + 1:, "PLAYTYPE"] == opp_sub_type)
-            ]
-        )
-        potential_nops = (
-            set(potential_indx).difference(processed_idxs)
-        )
-        if not potential_nops:
-            logger.warning(
-                f"No potential matching subs found for gamecode "
-                f"{gamecode} and season {season}"
-            )
-            return five
-        matching_idx = min(potential_nops)
-        processed_idxs.append(idx)
-        processed_idxs.append(matching_idx)
-        matching_row = pbp_df.loc[matching_idx]
-        invalid_mask = (
-            (matching_row["PLAYTYPE"] != opp_sub_type) or
-            (matching_row["CODETEAM"] != team) or
-            (matching_row["MARKERTIME"] != markertime)
-        )
-        if invalid_mask:
-            logger.warning(
-                f"Something went wrong for gamecode {gamecode} at sub "
-                f"index {idx} with matching sub index {matching_idx}"
-            )
-        player_sub = matching_row["PLAYER"]
-        player_in = player if sub_type == "IN" else player_sub
-        player_out = player_sub if sub_type == "IN" else player
-        if player_in == player_out:
-            # there are instance where the same player is subbed in and out
-            return five
-        elif player_out not in five:
-            logger.warning(
-                f"Player {player_out} not found in current lineup, "
-                f"{five}, for gamecode {gamecode} and season {season}."
-            )
-            return five
-        else:
-            pindx = five.index(player_out)
-            five = five[:pindx] + [player_in] + five[pindx + 1:]
-            return five
-
-    def validate_player(x, col1, col2):
-        flag = False
-        if (x["PLAYER"] is not None) and (x["PLAYTYPE"] != "OUT"):
-            if x["PLAYER"] in (x[col1] + x[col2]):
-                flag = True
-        else:
-            flag = True
-        return flag
+    raise_error(lineup_format, "Lineup format", LINEUP_FORMATS, False)
 
     if pbp_df.empty or (pbp_df is None):
         return pbp_df
@@ -252,78 +854,126 @@ def get_pbp_lineups(
     gamecode = gamecodes[0]
     season = seasons[0]
 
-    # Asign the starting lineups to the first entry of the PBP data.
-    pbp_df["Lineup_A"] = None
-    pbp_df["Lineup_B"] = None
-
-    # find home and away teams
-    hm_aw = boxscore_df[["Home", "Team"]].drop_duplicates()
-    home_team = hm_aw.loc[hm_aw["Home"] == 1, "Team"].values[0]
-    away_team = hm_aw.loc[hm_aw["Home"] == 0, "Team"].values[0]
-
-    starting_five = boxscore_df.loc[
-        boxscore_df["IsStarter"] == 1, ["Team", "Player"]
-    ]
-    starting_five['ID'] = starting_five.groupby('Team').cumcount()
-
-    # Pivot the DataFrame
-    starting_five = starting_five.pivot(
-        index='ID', columns='Team', values='Player')
-
-    # Reset index if needed
-    starting_five.reset_index(drop=True, inplace=True)
-    starting_five = starting_five[[home_team, away_team]]
-    # TODO: remove cleaning, this has been done in boxscore data
-    starting_five[home_team] = starting_five[home_team].str.replace(
-        "  ", " ").str.replace(" , ", ", ").str.strip()
-    starting_five[away_team] = starting_five[away_team].str.replace(
-        "  ", " ").str.replace(" , ", ", ").str.strip()
-    starting_five_dict = starting_five.to_dict(orient='list')
-
-    pbp_df.at[0, "Lineup_A"] = starting_five_dict[home_team]
-    pbp_df.at[0, "Lineup_B"] = starting_five_dict[away_team]
-    if "IsHomeTeam" not in pbp_df.columns:
-        pbp_df["IsHomeTeam"] = np.where(
-            pbp_df["CODETEAM"] == home_team, True,
-            np.where(pbp_df["CODETEAM"] == away_team,
-                     False, None)  # type: ignore
+    # find home and away teams and their starters
+    home_team, away_team, starting_five_home, starting_five_away = (
+        get_starting_fives(
+            homes=boxscore_df["Home"].to_numpy(),
+            teams=boxscore_df["Team"].to_numpy(),
+            players=boxscore_df["Player"].to_numpy(),
+            is_starter=(boxscore_df["IsStarter"] == 1).to_numpy(
+                dtype=bool, na_value=False),
         )
-    # start processing the sub entries, row by row.
-    processed_idxs: list = []
-    current_five_home = starting_five_dict[home_team].copy()
-    current_five_away = starting_five_dict[away_team].copy()
-    for idx, row in pbp_df.iterrows():
-        playtype = row["PLAYTYPE"]
-        # there are rare instances of an extra space in player name
-        player = (
-            row["PLAYER"] if row["PLAYER"] is None
-            else row["PLAYER"]
-        )
-        team = row["CODETEAM"]
-        markertime = row["MARKERTIME"]
-        if team != "":
-            is_home = home_team == team
-            five = current_five_home if is_home else current_five_away
-            if (playtype == "OUT") and (idx not in processed_idxs):
-                five = process_sub(five, player, playtype)
-            elif (playtype == "IN") and (idx not in processed_idxs):
-                five = process_sub(five, player, playtype)
-            if is_home:
-                current_five_home = five
-            else:
-                current_five_away = five
-
-        pbp_df.at[idx, "Lineup_A"] = current_five_home
-        pbp_df.at[idx, "Lineup_B"] = current_five_away
-
-    if validate:
-        lu_cols = [u for u in pbp_df.columns if u.startswith("Lineup_")]
-        pbp_df["validate_on_court_player"] = pbp_df.apply(
-            lambda x: validate_player(x, lu_cols[0], lu_cols[1]),
-            axis=1
+    )
+
+    with time_stage("lineups", endpoint=PBP_ENDPOINT, rows=len(pbp_df)):
+        # pair the substitutions in a single pass over the plays.
+        lineups_home, lineups_away = reconstruct_lineups(
+            playtypes=pbp_df["PLAYTYPE"].to_numpy(),
+            teams=pbp_df["CODETEAM"].to_numpy(),
+            players=pbp_df["PLAYER"].to_numpy(),
+            markertimes=pbp_df["MARKERTIME"].to_numpy(),
+            labels=pbp_df.index.to_numpy(),
+            home_team=home_team,
+            starting_five_home=starting_five_home,
+            starting_five_away=starting_five_away,
+            gamecode=gamecode,
+            season=season,
         )
+        pbp_df["Lineup_A"] = pd.Series(
+            lineups_home, index=pbp_df.index, dtype=object)
+        pbp_df["Lineup_B"] = pd.Series(
+            lineups_away, index=pbp_df.index, dtype=object)
+
+        if "IsHomeTeam" not in pbp_df.columns:
+            pbp_df["IsHomeTeam"] = np.where(
+                pbp_df["CODETEAM"] == home_team, True,
+                np.where(pbp_df["CODETEAM"] == away_team,
+                         False, None)  # type: ignore
+            )
+        if validate:
+            pbp_df["validate_on_court_player"] = validate_on_court_players(
+                pbp_df["PLAYER"].to_numpy(),
+                pbp_df["PLAYTYPE"].to_numpy(),
+                lineups_home,
+                lineups_away
+            )
 
     if "TRUE_NUMBEROFPLAY" in pbp_df.columns:
         pbp_df["TRUE_NUMBEROFPLAY"] = np.arange(pbp_df.shape[0])
 
+    return format_lineups(pbp_df, lineup_format, registry)
+
+
+def format_lineups(
+    pbp_df: pd.DataFrame,
+    lineup_format: str = "list",
+    registry: Optional[LineupRegistry] = None
+) -> pd.DataFrame:
+    """
+    A function that converts the `Lineup_A` and `Lineup_B` list columns of
+    the play-by-play data with lineups to the given representation.
+
+    Args:
+
+        pbp_df (pd.DataFrame): The play-by-play data with lineups in the
+            "list" format.
+        lineup_format (str, optional): The representation of the lineups,
+            see `get_pbp_lineups`. Defaults to "list".
+        registry (LineupRegistry, optional): The registry of the lineup ids.
+            Defaults to None, i.e. the default registry.
+
+    Returns:
+
+        pd.DataFrame: The play-by-play data with the lineups in the given
+            representation.
+    """
+    if lineup_format == "id":
+        if registry is None:
+            registry = get_default_registry()
+        pbp_df["Lineup_A"] = registry.encode(pbp_df["Lineup_A"].tolist())
+        pbp_df["Lineup_B"] = registry.encode(pbp_df["Lineup_B"].tolist())
+    elif lineup_format == "columns":
+        pbp_df = pd.concat(
+            [
+                pbp_df.drop(columns=["Lineup_A", "Lineup_B"]),
+                make_lineup_columns(
+                    pbp_df["Lineup_A"].tolist(), "Lineup_A"
+                ).set_axis(pbp_df.index),
+                make_lineup_columns(
+                    pbp_df["Lineup_B"].tolist(), "Lineup_B"
+                ).set_axis(pbp_df.index),
+            ],
+            axis=1
+        )
     return pbp_df
+
+
+def get_game_pbp_lineups(
+    pbp_df: pd.DataFrame,
+    starters_df: pd.DataFrame,
+    validate: bool = True
+) -> Optional[pd.DataFrame]:
+    """
+    A function that extracts the lineups of a single game in the "list"
+    format, given its starters. Errors are logged and skipped. It is a
+    module-level function, so that it can run in a process pool.
+
+    Args:
+
+        pbp_df (pd.DataFrame): The play-by-play data of the game.
+        starters_df (pd.DataFrame): The starters of the game, i.e. the rows
+            of the boxscore with `IsStarter` equal to 1.
+        validate (bool, optional): If to validate the on-court players.
+            Defaults to True.
+
+    Returns:
+
+        Optional[pd.DataFrame]: The play-by-play data with lineups, or None
+            if the lineups could not be extracted.
+    """
+    try:
+        return get_pbp_lineups(pbp_df, starters_df, validate=validate)
+    except Exception as e:  # noqa: E722
+        log_game_error(
+            e, pbp_df["Gamecode"].iloc[0], pbp_df["Season"].iloc[0])
+        return None
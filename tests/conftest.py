@@ -0,0 +1,121 @@
+"""
+The shared fixtures of the regression tests.
+
+`data/games.zip` is an archive of the responses of four games of season
+2023, recorded with `RecordingTransport` (see `replay.py`), i.e. their
+PlaybyPlay, Boxscore and Points payloads. They are synthetic, with the quirks
+of the real data: a substitution recorded late, a player subbed in and out
+at once, a pair of substitutions at different times, a player subbed out
+while not on the court, an unmatched substitution, an IN recorded before
+its OUT and an extra time.
+
+`data/reference.json.gz` holds the dataframes that the original
+implementations, i.e. before the rewrites of the lineup reconstruction and
+of the record decoding, returned for these games, with their dtypes, keyed
+by `<dataset>/<gamecode>`.
+"""
+import gzip
+import json
+import os
+from typing import Any, Dict, List, Optional
+import pandas as pd
+import pytest
+from euroleague_api.replay import ResponseArchive, ReplayTransport
+from euroleague_api.transport import build_response
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+SEASON = 2023
+GAMECODES = [1, 2, 3, 4]
+
+
+@pytest.fixture(scope="session")
+def transport():
+    """A transport that replays the recorded games."""
+    replay = ReplayTransport(
+        ResponseArchive(os.path.join(DATA_DIR, "games.zip")))
+    yield replay
+    replay.close()
+
+
+@pytest.fixture(scope="session")
+def reference() -> Dict[str, Any]:
+    """The outputs of the original implementations."""
+    with gzip.open(os.path.join(DATA_DIR, "reference.json.gz"), "rt") as f:
+        return json.load(f)
+
+
+def frame_from_json(frame: dict) -> pd.DataFrame:
+    """Makes a dataframe from its "split" JSON representation."""
+    return pd.DataFrame(frame["data"], columns=frame["columns"])
+
+
+def assert_matches_reference(
+    df: pd.DataFrame,
+    expected: Dict[str, Any],
+    columns: Optional[List[str]] = None
+) -> None:
+    """
+    Asserts that a dataframe has the values and the dtypes of a reference
+    output, in the given columns or in all of them. The values are compared
+    through their JSON representation, as they are stored.
+    """
+    actual = frame_from_json(
+        json.loads(df.to_json(orient="split", index=False)))
+    expected_df = frame_from_json(expected["frame"])
+    if columns is None:
+        columns = list(expected_df.columns)
+        assert list(actual.columns) == columns
+    pd.testing.assert_frame_equal(actual[columns], expected_df[columns])
+    assert {c: str(df[c].dtype) for c in columns} == {
+        c: expected["dtypes"][c] for c in columns}
+
+
+def make_archive(
+    path: str,
+    responses: List[tuple]
+) -> ResponseArchive:
+    """
+    Makes an archive of responses, e.g. a v1 results payload with unplayed
+    games, to replay them with a `ReplayTransport`.
+
+    Args:
+        path (str): The path of the archive.
+        responses (List[tuple]): The url, params, status and body of each
+            response.
+
+    Returns:
+        ResponseArchive: The saved archive.
+    """
+    archive = ResponseArchive(path)
+    for url, params, status, body in responses:
+        archive.add(url, params, build_response(url, status, body))
+    archive.save()
+    return archive
+
+
+def make_results_xml(played: Dict[int, bool]) -> bytes:
+    """
+    Makes the v1 results payload of a season.
+
+    Args:
+        played (Dict[int, bool]): Whether each game code is played.
+
+    Returns:
+        bytes: The XML document.
+    """
+    games = "".join(
+        f"<game><gameday>{(code - 1) // 2 + 1}</gameday><round>RS</round>"
+        f"<gamecode>E{SEASON}_{code}</gamecode>"
+        f"<gamenumber>{code}</gamenumber>"
+        f"<hometeam>HOME</hometeam><homecode>PAN</homecode>"
+        f"<homescore>{80 if is_played else 0}</homescore>"
+        f"<awayteam>AWAY</awayteam><awaycode>OLY</awaycode>"
+        f"<awayscore>{75 if is_played else 0}</awayscore>"
+        f"<date>Oct 12, {SEASON}</date><time>20:00</time>"
+        f"<played>{str(is_played).lower()}</played></game>"
+        for code, is_played in played.items()
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><results>'
+        f"{games}</results>"
+    ).encode()
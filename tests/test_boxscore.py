@@ -0,0 +1,31 @@
+import asyncio
+import logging
+import pytest
+from euroleague_api.boxscore_data import AsyncBoxScoreData, BoxScoreData
+from conftest import SEASON
+
+
+def test_incomplete_boxscore_is_logged(monkeypatch, caplog):
+    boxscoredata = BoxScoreData()
+    monkeypatch.setattr(
+        boxscoredata, "get_boxscore_payload", lambda season, gamecode: {})
+    with pytest.raises(KeyError):
+        boxscoredata.get_boxscore_data(SEASON, 1)
+    assert "returned incomplete data" in caplog.text
+    assert caplog.records[-1].levelno == logging.ERROR
+
+
+def test_async_incomplete_boxscore_is_logged(monkeypatch, caplog):
+    async def get_boxscore_payload(season, gamecode):
+        return {}
+
+    async def main():
+        async with AsyncBoxScoreData() as boxscoredata:
+            monkeypatch.setattr(
+                boxscoredata, "get_boxscore_payload", get_boxscore_payload)
+            await boxscoredata.get_boxscore_data(SEASON, 1)
+
+    with pytest.raises(KeyError):
+        asyncio.run(main())
+    assert "returned incomplete data" in caplog.text
+    assert caplog.records[-1].levelno == logging.ERROR
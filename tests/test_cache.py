@@ -0,0 +1,112 @@
+import os
+import types
+import pytest
+from euroleague_api import cache as cache_module
+from euroleague_api.cache import ResponseCache
+from euroleague_api.replay import ReplayTransport
+from euroleague_api.server import RedirectTransport, StandInServer
+from euroleague_api.transport import HTTPTransport, build_response
+from conftest import make_archive
+
+GAME_URL = "https://live.euroleague.net/api/PlaybyPlay"
+GAME_PARAMS = {"gamecode": 1, "seasoncode": "E2023"}
+OTHER_URL = "https://api-live.euroleague.net/v3/competitions/E/standings"
+
+
+class Clock:
+    """A controllable replacement of `time.time`."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(
+        cache_module, "time", types.SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(
+        os.path.join(tmp_path, "cache"),
+        ttl_played=None, ttl_live=60, ttl_default=3600)
+
+
+def store(cache, url, params, body=b"{}"):
+    cache.set(url, params, build_response(url, 200, body))
+
+
+def test_played_games_never_expire(cache, clock):
+    cache.mark_played("E2023", [1])
+    store(cache, GAME_URL, GAME_PARAMS)
+    clock.now += 10 ** 9
+    assert cache.get(GAME_URL, GAME_PARAMS) is not None
+
+
+def test_live_games_expire(cache, clock):
+    store(cache, GAME_URL, GAME_PARAMS)
+    clock.now += 59
+    assert cache.get(GAME_URL, GAME_PARAMS) is not None
+    clock.now += 2
+    assert cache.get(GAME_URL, GAME_PARAMS) is None
+
+
+def test_other_endpoints_expire_by_default(cache, clock):
+    store(cache, OTHER_URL, None)
+    clock.now += 3599
+    assert cache.get(OTHER_URL) is not None
+    clock.now += 2
+    assert cache.get(OTHER_URL) is None
+
+
+def test_policy_is_fixed_when_stored(cache, clock):
+    # a body cached while the game was in progress stays live
+    store(cache, GAME_URL, GAME_PARAMS, b"partial")
+    cache.mark_played("E2023", [1])
+    clock.now += 61
+    assert cache.get(GAME_URL, GAME_PARAMS) is None
+    # the body fetched after the game was played never expires
+    store(cache, GAME_URL, GAME_PARAMS, b"final")
+    clock.now += 10 ** 9
+    assert cache.get(GAME_URL, GAME_PARAMS).content == b"final"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    body_size = 1000
+    cache = ResponseCache(
+        os.path.join(tmp_path, "cache"), max_size=int(2.5 * body_size))
+    urls = [f"{OTHER_URL}/{i}" for i in range(3)]
+    for url in urls[:2]:
+        clock.now += 1
+        store(cache, url, None, os.urandom(body_size))
+    clock.now += 1
+    assert cache.get(urls[0]) is not None
+    clock.now += 1
+    store(cache, urls[2], None, os.urandom(body_size))
+    assert cache.get(urls[1]) is None
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[2]) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_transport_serves_cached_responses(tmp_path):
+    archive = make_archive(
+        os.path.join(tmp_path, "games.zip"),
+        [(GAME_URL, GAME_PARAMS, 200, b'{"Live": false}')]
+    )
+    cache = ResponseCache(os.path.join(tmp_path, "cache"))
+    with StandInServer(ReplayTransport(archive)) as server:
+        transport = RedirectTransport(
+            server.url, HTTPTransport(cache=cache))
+        first = transport.get(GAME_URL, params=GAME_PARAMS)
+        second = transport.get(GAME_URL, params=GAME_PARAMS)
+        transport.close()
+    assert first.content == second.content == b'{"Live": false}'
+    assert second.headers["X-Cache"] == "HIT"
+    assert server.requests == 1
@@ -0,0 +1,78 @@
+import json
+import pandas as pd
+import pytest
+from euroleague_api.boxscore_data import BoxScoreData
+from euroleague_api.decoding import (
+    decode_json, make_records_df, set_json_loads
+)
+from euroleague_api.shot_data import ShotData
+from conftest import GAMECODES, SEASON, assert_matches_reference
+
+LIVE_URL = "https://live.euroleague.net/api"
+PERIODS = [
+    "FirstQuarter", "SecondQuarter", "ThirdQuarter", "ForthQuarter",
+    "ExtraTime"
+]
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def json_loads(request):
+    """Decodes with the fastest available parser and with `json.loads`."""
+    set_json_loads(json.loads if request.param == "stdlib" else None)
+    yield request.param
+    set_json_loads()
+
+
+def get_payload(transport, endpoint: str, gamecode: int) -> dict:
+    r = transport.get(
+        f"{LIVE_URL}/{endpoint}",
+        params={"gamecode": gamecode, "seasoncode": f"E{SEASON}"})
+    assert r.status_code == 200
+    return decode_json(r)
+
+
+def get_records(transport, endpoint: str, gamecode: int) -> list:
+    payload = get_payload(transport, endpoint, gamecode)
+    if endpoint == "PlaybyPlay":
+        return [play for period in PERIODS for play in payload[period]]
+    if endpoint == "Points":
+        return payload["Rows"]
+    return [
+        player for team in payload["Stats"]
+        for player in team["PlayersStats"]
+    ]
+
+
+@pytest.mark.parametrize("gamecode", GAMECODES)
+@pytest.mark.parametrize("endpoint", ["PlaybyPlay", "Points", "Boxscore"])
+def test_records_df_matches_json_normalize(
+        transport, json_loads, endpoint, gamecode):
+    records = get_records(transport, endpoint, gamecode)
+    pd.testing.assert_frame_equal(
+        make_records_df(records), pd.json_normalize(records))
+
+
+def test_records_df_flattens_a_later_nested_record(transport):
+    records = get_records(transport, "Points", 1)
+    records = records[:-1] + [
+        {**records[-1], "COORDS": {"X": records[-1]["COORD_X"], "Y": 0}}
+    ]
+    df = make_records_df(records)
+    pd.testing.assert_frame_equal(df, pd.json_normalize(records))
+    assert df["COORDS.X"].notna().tolist() == [False] * (
+        len(records) - 1) + [True]
+
+
+@pytest.mark.parametrize("gamecode", GAMECODES)
+def test_shot_data_matches_reference(
+        transport, reference, json_loads, gamecode):
+    df = ShotData(transport=transport).get_game_shot_data(SEASON, gamecode)
+    assert_matches_reference(df, reference[f"shots/{gamecode}"])
+
+
+@pytest.mark.parametrize("gamecode", GAMECODES)
+def test_boxscore_players_match_reference(
+        transport, reference, json_loads, gamecode):
+    df = BoxScoreData(transport=transport).get_players_boxscore_stats(
+        SEASON, gamecode)
+    assert_matches_reference(df, reference[f"boxscore_players/{gamecode}"])
@@ -0,0 +1,150 @@
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+from euroleague_api.lineups import (
+    POINTS, LineupRegistry, get_starting_fives, make_stints
+)
+from euroleague_api.play_by_play_data import PlayByPlay
+from conftest import GAMECODES, SEASON, assert_matches_reference
+
+
+@pytest.fixture(autouse=True)
+def quiet_warnings(caplog):
+    # the quirks of the recorded games are logged as warnings
+    caplog.set_level(logging.ERROR, logger="euroleague_api")
+
+
+@pytest.mark.parametrize("gamecode", GAMECODES)
+def test_pbp_lineups_match_reference(transport, reference, gamecode):
+    df = PlayByPlay(transport=transport).get_game_pbp_data_lineups(
+        SEASON, gamecode, validate=False)
+    expected = reference[f"pbp_lineups/{gamecode}"]
+    columns = [
+        c for c in expected["frame"]["columns"]
+        if c != "validate_on_court_player"
+    ]
+    assert list(df.columns) == columns
+    assert_matches_reference(df, expected, columns)
+
+
+@pytest.mark.parametrize("gamecode", GAMECODES)
+def test_lineups_formats_are_consistent(transport, gamecode):
+    pbp = PlayByPlay(transport=transport)
+    lists = pbp.get_game_pbp_data_lineups(SEASON, gamecode, validate=False)
+    split = pbp.get_game_pbp_data_lineups(
+        SEASON, gamecode, validate=False, lineup_format="columns")
+    for team in ["Lineup_A", "Lineup_B"]:
+        players = split[[f"{team}_{i + 1}" for i in range(5)]].astype(object)
+        assert [
+            sorted(five) for five in lists[team]
+        ] == players.values.tolist()
+
+
+@pytest.mark.parametrize("gamecode", GAMECODES)
+def test_on_court_validation_matches_reference(
+        transport, reference, gamecode):
+    df = PlayByPlay(transport=transport).get_game_pbp_data_lineups(
+        SEASON, gamecode, validate=True)
+    assert_matches_reference(df, reference[f"pbp_lineups/{gamecode}"])
+
+
+def test_on_court_validation_flags_quirks(transport):
+    # the game with the late substitution has plays of players off court
+    df = PlayByPlay(transport=transport).get_game_pbp_data_lineups(
+        SEASON, 2, validate=True)
+    assert not df["validate_on_court_player"].all()
+
+
+@pytest.fixture(scope="module")
+def stints_games(transport):
+    # the stints of the games from the batched pipeline, and their plays
+    registry = LineupRegistry()
+    game_codes_df = pd.DataFrame({
+        "Phase": "RS", "Round": 1, "gameCode": GAMECODES})
+    pbp_df = PlayByPlay(transport=transport).get_games_pbp_data_lineups(
+        game_codes_df, SEASON, validate=False, lineup_format="id",
+        registry=registry)
+    return pbp_df, make_stints(pbp_df, registry=registry)
+
+
+def test_stints_cover_the_plays(stints_games):
+    pbp_df, stints_df = stints_games
+    assert sorted(stints_df["Gamecode"].unique()) == GAMECODES
+    assert stints_df["PLAYS"].sum() == len(pbp_df)
+    plays = pbp_df.groupby("Gamecode").size()
+    assert stints_df.groupby("Gamecode")["PLAYS"].sum().equals(plays)
+
+
+def test_stints_points_match_the_plays(stints_games):
+    pbp_df, stints_df = stints_games
+    points = pbp_df["PLAYTYPE"].astype(object).map(POINTS).fillna(0)
+    is_home = pbp_df["IsHomeTeam"].astype(object)
+    for team, home in [("A", True), ("B", False)]:
+        expected = points[is_home == home].groupby(
+            pbp_df["Gamecode"]).sum()
+        actual = stints_df.groupby("Gamecode")[f"POINTS_{team}"].sum()
+        assert actual.tolist() == expected.reindex(
+            actual.index, fill_value=0).tolist()
+
+
+def test_stints_change_with_the_lineups(stints_games):
+    pbp_df, stints_df = stints_games
+    keys = pbp_df[["Gamecode", "Lineup_A", "Lineup_B"]].to_numpy(
+        dtype=np.int64)
+    changes = np.flatnonzero((keys[1:] != keys[:-1]).any(axis=1)) + 1
+    starts = np.cumsum(stints_df["PLAYS"].to_numpy())[:-1]
+    assert starts.tolist() == changes.tolist()
+    # consecutive stints of a game differ in at least one lineup
+    for _, game in stints_df.groupby("Gamecode"):
+        lineups = game[["Lineup_A", "Lineup_B"]].to_numpy()
+        assert (lineups[1:] != lineups[:-1]).any(axis=1).all()
+
+
+def test_stints_are_numbered_per_game(stints_games):
+    _, stints_df = stints_games
+    for _, game in stints_df.groupby("Gamecode"):
+        assert game["Stint"].tolist() == list(range(1, len(game) + 1))
+    first = stints_df.groupby("Gamecode").head(1)
+    assert (first["TRUE_NUMBEROFPLAY_START"] == 0).all()
+
+
+def test_stints_span_periods(stints_games):
+    # the same ten players may start the next period
+    _, stints_df = stints_games
+    spanning = stints_df[
+        stints_df["PERIOD_START"] != stints_df["PERIOD_END"]]
+    assert not spanning.empty
+    assert (spanning["PLAYS"] > 1).all()
+
+
+@pytest.mark.parametrize("gamecode", GAMECODES)
+def test_game_stints_match_the_season_stints(
+        transport, stints_games, gamecode):
+    _, stints_df = stints_games
+    registry = LineupRegistry()
+    df = PlayByPlay(transport=transport).get_game_stints(
+        SEASON, gamecode, registry=registry)
+    game = stints_df[stints_df["Gamecode"] == gamecode]
+    columns = [c for c in df.columns if c not in ["Lineup_A", "Lineup_B"]]
+    pd.testing.assert_frame_equal(
+        df[columns].reset_index(drop=True),
+        game[columns].reset_index(drop=True),
+        check_dtype=False
+    )
+
+
+def test_starting_fives_are_padded():
+    # the away team has four starters in the boxscore
+    homes = np.array([1] * 6 + [0] * 5)
+    teams = np.array(["PAN"] * 6 + ["OLY"] * 5, dtype=object)
+    players = np.array([f"P{i}" for i in range(11)], dtype=object)
+    is_starter = np.array([True] * 5 + [False] + [True] * 4 + [False])
+    home, away, five_home, five_away = get_starting_fives(
+        homes, teams, players, is_starter)
+    assert (home, away) == ("PAN", "OLY")
+    assert five_home == ["P0", "P1", "P2", "P3", "P4"]
+    assert five_away[:4] == ["P6", "P7", "P8", "P9"]
+    assert np.isnan(five_away[4])
+    with pytest.raises(KeyError):
+        get_starting_fives(homes, teams, players, homes == 1)
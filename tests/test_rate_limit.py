@@ -0,0 +1,177 @@
+import os
+import threading
+import time
+from email.utils import formatdate
+import pytest
+from euroleague_api.events import EventLog
+from euroleague_api.rate_limit import (
+    ConcurrencyLimit, RateLimiter, RetryPolicy
+)
+from euroleague_api.replay import ReplayTransport
+from euroleague_api.server import RedirectTransport, StandInServer
+from euroleague_api.transport import HTTPTransport, build_response
+from conftest import make_archive
+
+GAME_URL = "https://live.euroleague.net/api/Header"
+GAME_PARAMS = {"gamecode": 1, "seasoncode": "E2023"}
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = make_archive(
+        os.path.join(tmp_path, "games.zip"),
+        [(GAME_URL, GAME_PARAMS, 200, b'{"Live": false}')]
+    )
+    yield archive
+    archive.close()
+
+
+def get(server, transport):
+    redirect = RedirectTransport(server.url, transport)
+    try:
+        return redirect.get(GAME_URL, params=GAME_PARAMS)
+    finally:
+        redirect.close()
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_errors_are_retried_up_to_max_retries(archive, status):
+    retry = RetryPolicy(max_retries=3, backoff_factor=0)
+    with StandInServer(
+            ReplayTransport(archive), error_rate=1,
+            error_statuses=[status]) as server:
+        r = get(server, HTTPTransport(retry=retry))
+    assert r.status_code == status
+    assert server.requests == 4
+
+
+def test_retried_errors_recover(archive):
+    retry = RetryPolicy(max_retries=20, backoff_factor=0)
+    with StandInServer(
+            ReplayTransport(archive), error_rate=0.5, seed=0) as server:
+        responses = [
+            get(server, HTTPTransport(retry=retry)) for _ in range(10)
+        ]
+    assert [r.status_code for r in responses] == [200] * 10
+    assert all(r.content == b'{"Live": false}' for r in responses)
+    assert server.errors > 0
+    assert server.requests == 10 + server.errors
+
+
+def test_retry_after_is_honoured(archive):
+    retry = RetryPolicy(max_retries=1, backoff_factor=0)
+    with StandInServer(
+            ReplayTransport(archive), error_rate=1,
+            error_statuses=[429], retry_after=0.2) as server:
+        with EventLog(events=["retry"]) as log:
+            start = time.perf_counter()
+            get(server, HTTPTransport(retry=retry))
+            elapsed = time.perf_counter() - start
+    assert [e["delay"] for e in log.records] == [0.2]
+    assert elapsed >= 0.2
+
+
+@pytest.mark.parametrize("retry_after, delay", [
+    ("2", 2), ("120", 5), ("-3", 0),
+])
+def test_retry_after_is_capped(retry_after, delay):
+    retry = RetryPolicy(max_backoff=5)
+    r = build_response(GAME_URL, 503, b"", {"Retry-After": retry_after})
+    assert retry.get_delay(0, r) == delay
+
+
+def test_retry_after_date():
+    retry = RetryPolicy(max_backoff=60)
+    date = formatdate(time.time() + 30, usegmt=True)
+    r = build_response(GAME_URL, 503, b"", {"Retry-After": date})
+    assert 28 <= retry.get_delay(0, r) <= 30
+
+
+def test_backoff_without_retry_after():
+    retry = RetryPolicy(backoff_factor=0.5, max_backoff=3)
+    r = build_response(GAME_URL, 503, b"")
+    delays = [retry.get_delay(attempt, r) for attempt in range(10)]
+    assert all(0 <= d <= min(3, 0.5 * 2 ** a) for a, d in enumerate(delays))
+
+
+def test_concurrency_limit_halves_and_recovers():
+    limit = ConcurrencyLimit(8)
+    for expected in [4, 2, 1, 1]:
+        limit.decrease()
+        assert limit.limit == expected
+    increases = 0
+    while limit.limit < 8:
+        limit.increase()
+        increases += 1
+    assert limit.limit == 8
+    # about one more request in flight per round of requests
+    assert 8 * 7 / 2 - 8 <= increases <= 8 * 7 / 2 + 8
+
+
+def test_concurrency_limit_bounds_the_requests_in_flight():
+    limit = ConcurrencyLimit(2)
+    assert limit.try_acquire()
+    assert limit.try_acquire()
+    assert not limit.try_acquire()
+    waiting = threading.Thread(target=limit.acquire)
+    waiting.start()
+    waiting.join(0.1)
+    assert waiting.is_alive()
+    limit.release()
+    waiting.join(1)
+    assert not waiting.is_alive()
+    assert limit.in_flight == 2
+
+
+def test_concurrency_limit_wakes_waiters_when_it_grows():
+    limit = ConcurrencyLimit(2)
+    limit.decrease()
+    assert limit.try_acquire()
+    waiting = threading.Thread(target=limit.acquire)
+    waiting.start()
+    waiting.join(0.1)
+    assert waiting.is_alive()
+    while int(limit.limit) < 2:
+        limit.increase()
+    waiting.join(1)
+    assert not waiting.is_alive()
+
+
+def test_adaptive_limiter_halves_on_failure_and_recovers():
+    limiter = RateLimiter(rate=8, adaptive=True, max_concurrency=8,
+                          min_rate=0.5, increase=1)
+    bucket = limiter.get_bucket(GAME_URL)
+    limit = limiter.get_limit(GAME_URL)
+    for status in [503, 429, None]:
+        limiter.on_response(GAME_URL, status)
+    assert bucket.rate == 1
+    assert limit.limit == 1
+    for _ in range(100):
+        limiter.on_response(GAME_URL, 200)
+    assert bucket.rate == 8
+    assert limit.limit == 8
+
+
+def test_limiter_is_not_adaptive_by_default():
+    limiter = RateLimiter(rate=8)
+    limiter.on_response(GAME_URL, 503)
+    assert limiter.get_bucket(GAME_URL).rate == 8
+    assert limiter.try_acquire(GAME_URL)
+    assert limiter.limits == {}
+
+
+def test_adaptive_transport_backs_off_the_server(archive):
+    limiter = RateLimiter(rate=1000, burst=100, adaptive=True,
+                          max_concurrency=8)
+    retry = RetryPolicy(max_retries=3, backoff_factor=0)
+    transport = HTTPTransport(rate_limiter=limiter, retry=retry)
+    with StandInServer(ReplayTransport(archive), error_rate=1) as server:
+        assert get(server, transport).status_code == 503
+        limit = limiter.get_limit(server.url)
+        assert limit.limit == 1
+        assert limiter.get_bucket(server.url).rate < 1000
+        server.error_rate = 0
+        for _ in range(10):
+            assert get(server, transport).status_code == 200
+    assert limit.limit > 1
+    assert limit.in_flight == 0
@@ -0,0 +1,90 @@
+import json
+import os
+import pandas as pd
+import pytest
+from euroleague_api.game_stats import GameStats
+from euroleague_api.replay import ReplayTransport
+from euroleague_api.schemas import SCHEMAS
+from euroleague_api.shot_data import ShotData
+from euroleague_api.utils import get_data_over_collection_of_games
+from conftest import GAMECODES, SEASON, make_archive, make_results_xml
+
+RESULTS_URL = "https://api-live.euroleague.net/v1/results/"
+REPORT_URL = (
+    "https://api-live.euroleague.net/v3/competitions/E/seasons/"
+    f"E{SEASON}/games/{{}}/report"
+)
+# the values of each game, typed differently per game
+ATTENDANCE = {1: 10500, 2: 8300, 3: 12000, 4: None}
+DURATION = {1: 40.0, 2: 40.0, 3: 45.5, 4: 40.0}
+CLUBS = {1: "PAN", 2: "OLY", 3: "PAN", 4: "OLY"}
+
+
+def make_report(gamecode: int) -> bytes:
+    return json.dumps({
+        "gameCode": gamecode,
+        "round": 1,
+        "attendance": ATTENDANCE[gamecode],
+        "duration": DURATION[gamecode],
+        "referee": f"REFEREE {gamecode}",
+        "local": {"club": {"code": CLUBS[gamecode]}},
+    }).encode()
+
+
+@pytest.fixture
+def reports_transport(tmp_path):
+    archive = make_archive(
+        os.path.join(tmp_path, "reports.zip"),
+        [(RESULTS_URL, {"seasonCode": f"E{SEASON}"}, 200,
+          make_results_xml(dict.fromkeys(GAMECODES, True)))] +
+        [(REPORT_URL.format(gamecode), None, 200, make_report(gamecode))
+         for gamecode in GAMECODES]
+    )
+    replay = ReplayTransport(archive)
+    yield replay
+    replay.close()
+
+
+def test_typed_season_dtypes_are_decided_over_the_games(reports_transport):
+    df = GameStats(
+        typed=True, transport=reports_transport
+    ).get_game_report_single_season(SEASON)
+    assert df["Gamecode"].tolist() == GAMECODES
+    # a whole number in most games and missing in one
+    assert df["attendance"].dtype == "Int16"
+    assert df["attendance"].isna().tolist() == [False] * 3 + [True]
+    # a whole number in most games and a fraction in one
+    assert df["duration"].dtype == "float64"
+    assert df["duration"].tolist() == list(DURATION.values())
+    # a string per game, with few distinct values over the games
+    assert isinstance(df["local.club.code"].dtype, pd.CategoricalDtype)
+    assert df["local.club.code"].tolist() == list(CLUBS.values())
+    # a distinct string per game
+    assert not isinstance(df["referee"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_string_dtype(df["referee"].dtype)
+
+
+def test_typed_range_dtypes_match_the_season_dtypes(reports_transport):
+    stats = GameStats(typed=True, transport=reports_transport)
+    season_df = stats.get_game_report_single_season(SEASON)
+    range_df = stats.get_game_report_range_seasons(SEASON, SEASON)
+    pd.testing.assert_frame_equal(range_df, season_df)
+
+
+def test_untyped_season_dtypes_are_kept(reports_transport):
+    df = GameStats(
+        transport=reports_transport).get_game_report_single_season(SEASON)
+    assert df["attendance"].tolist()[:3] == [10500, 8300, 12000]
+    assert not pd.api.types.is_extension_array_dtype(df["attendance"].dtype)
+    assert not isinstance(df["local.club.code"].dtype, pd.CategoricalDtype)
+
+
+def test_typed_games_keep_the_schema(transport):
+    game_codes_df = pd.DataFrame({
+        "Phase": "RS", "Round": 1, "gameCode": GAMECODES})
+    df = get_data_over_collection_of_games(
+        game_codes_df, SEASON,
+        ShotData(typed=True, transport=transport).get_game_shot_data)
+    assert sorted(df["Gamecode"].unique()) == GAMECODES
+    for col, dtype in SCHEMAS["shots"].items():
+        assert df[col].dtype == dtype, col
@@ -0,0 +1,53 @@
+import os
+import pandas as pd
+import pytest
+from euroleague_api.cache import ResponseCache
+from euroleague_api.EuroLeagueData import EuroLeagueData
+from euroleague_api.replay import ReplayTransport
+from conftest import SEASON, make_archive, make_results_xml
+
+RESULTS_URL = "https://api-live.euroleague.net/v1/results/"
+PLAYED = {1: True, 2: True, 3: True, 4: True, 5: False, 6: False}
+
+
+@pytest.fixture
+def results_transport(tmp_path):
+    archive = make_archive(
+        os.path.join(tmp_path, "results.zip"),
+        [(RESULTS_URL, {"seasonCode": f"E{SEASON}"}, 200,
+          make_results_xml(PLAYED))]
+    )
+    replay = ReplayTransport(archive)
+    yield replay
+    replay.close()
+
+
+def test_unplayed_games_are_not_played(results_transport):
+    df = EuroLeagueData(transport=results_transport).get_gamecodes_season(
+        SEASON)
+    assert df["played"].dtype == bool
+    assert dict(zip(df["gameCode"], df["played"])) == PLAYED
+
+
+def test_unplayed_games_are_not_collected(results_transport):
+    collected = []
+
+    def fun(season, gamecode):
+        collected.append(gamecode)
+        return pd.DataFrame({"Gamecode": [gamecode]})
+
+    df = EuroLeagueData(
+        transport=results_transport).get_season_data_from_game_data(
+            SEASON, fun)
+    assert sorted(collected) == [1, 2, 3, 4]
+    assert sorted(df["Gamecode"]) == [1, 2, 3, 4]
+
+
+def test_only_played_games_are_marked_in_the_cache(
+        results_transport, tmp_path):
+    cache = ResponseCache(os.path.join(tmp_path, "cache"))
+    results_transport.cache = cache
+    EuroLeagueData(transport=results_transport).get_gamecodes_season(SEASON)
+    marked = cache.db.execute(
+        "SELECT gamecode FROM played ORDER BY gamecode").fetchall()
+    assert [code for (code,) in marked] == [1, 2, 3, 4]